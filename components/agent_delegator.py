@@ -1,12 +1,240 @@
 import json
-from typing import Dict, Any, List, Optional
+import re
+from typing import Dict, Any, List, Optional, Tuple, TypedDict
 from datetime import datetime
+import sys
+import time
 import uuid
+import itertools
+from collections import deque
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional C extension
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C extension
+    orjson = None
 
 from langflow.custom import Component
-from langflow.io import MessageTextInput, DropdownInput, Output, BoolInput, DataInput
+from langflow.io import MessageTextInput, DropdownInput, Output, BoolInput, DataInput, IntInput
 from langflow.schema import Data
 
+# Hook types and agent names shared with RuntimeHooks filters
+HOOK_PRE = sys.intern("pre_task")
+HOOK_START = sys.intern("start_task")
+HOOK_END = sys.intern("end_run")
+HOOK_ERR = sys.intern("error")
+HOOK_ANALYSIS = sys.intern("task_analysis")
+AGENT_PRIMARY = sys.intern("primary")
+AGENT_SPECIALIST = sys.intern("specialist")
+
+# CRM-related keywords that suggest specialist agent
+CRM_KEYWORDS = (
+    'assistant', 'ai call', 'contact', 'gohighlevel', 'ghl',
+    'conversation', 'lead', 'crm', 'customer', 'phone',
+    'message', 'create assistant', 'make call', 'update contact',
+    'calling campaign', 'bulk call', 'leads', 'sales'
+)
+
+# Natural language processing keywords
+NATURAL_KEYWORDS = (
+    'chat', 'talk', 'explain', 'help', 'question', 'general',
+    'what is', 'how to', 'can you', 'please help'
+)
+
+# Normaliser for the delegation confidence score
+_KW_NORM = max(len(CRM_KEYWORDS), len(NATURAL_KEYWORDS))
+
+
+_KEYWORD_CATEGORY = {
+    **{keyword: "crm" for keyword in CRM_KEYWORDS},
+    **{keyword: "natural" for keyword in NATURAL_KEYWORDS}
+}
+
+# Declaration order, used to report found keywords in a stable order
+_KEYWORD_ORDER = {keyword: index for index, keyword in enumerate(_KEYWORD_CATEGORY)}
+
+
+# Specialist operations by trigger phrase; earlier entries win when several match
+_OPERATION_MAPPING = {
+    "create assistant": "create_assistant_operation",
+    "make call": "ai_call_operation",
+    "find contact": "contact_lookup_operation",
+    "send message": "message_operation",
+    "switch location": "location_switch_operation",
+    "calling campaign": "bulk_call_operation",
+    "bulk call": "bulk_call_operation"
+}
+
+_OPERATION_PRIORITY = {phrase: index for index, phrase in enumerate(_OPERATION_MAPPING)}
+
+# Tool calls planned for each specialist operation
+_TOOL_PLANS = {
+    "create_assistant_operation": (
+        "validate_location_access",
+        "create_assistant_api_call",
+        "confirm_creation"
+    ),
+    "ai_call_operation": (
+        "lookup_contact",
+        "validate_phone_number",
+        "initiate_ai_call",
+        "track_call_status"
+    ),
+    "bulk_call_operation": (
+        "validate_contact_list",
+        "create_assistant_if_needed",
+        "initiate_bulk_calls",
+        "monitor_campaign_progress"
+    ),
+    "contact_lookup_operation": (
+        "search_by_identifier",
+        "retrieve_contact_details",
+        "format_contact_info"
+    ),
+    "message_operation": (
+        "lookup_conversation",
+        "send_message",
+        "confirm_delivery"
+    ),
+    "location_switch_operation": (
+        "validate_location_access",
+        "switch_context",
+        "confirm_switch"
+    )
+}
+
+_DEFAULT_TOOL_PLAN = ("analyze_request", "determine_next_steps")
+
+# Suggested next steps for each specialist operation
+_NEXT_STEPS = {
+    "create_assistant_operation": (
+        "Provide assistant name and description",
+        "Specify location ID if different from default",
+        "Configure assistant parameters"
+    ),
+    "ai_call_operation": (
+        "Provide contact ID or phone number",
+        "Specify assistant to use for the call",
+        "Confirm number pool for outbound calling"
+    ),
+    "bulk_call_operation": (
+        "Provide contact list or criteria",
+        "Create or specify assistant for calls",
+        "Configure campaign parameters"
+    ),
+    "contact_lookup_operation": (
+        "Provide email, phone, or contact ID",
+        "Specify which location to search",
+        "Review returned contact information"
+    )
+}
+
+_DEFAULT_NEXT_STEPS = ("Provide more specific details about your request",)
+
+
+def _build_automaton(entries):
+    """Build an Aho-Corasick automaton from (word, value) pairs"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for word, value in entries:
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_automaton(
+    (keyword, (category, keyword)) for keyword, category in _KEYWORD_CATEGORY.items()
+)
+
+_OPERATION_AUTOMATON = _build_automaton((phrase, phrase) for phrase in _OPERATION_MAPPING)
+
+# Regex fallback: the zero-width lookahead visits every start position and the
+# longest-first alternation reports the longest keyword starting there
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_CATEGORY, key=len, reverse=True)) + "))"
+)
+
+# Any keyword contained in a matched keyword is present in the text as well
+_KEYWORD_IMPLIED = {
+    keyword: tuple(other for other in _KEYWORD_CATEGORY if other in keyword)
+    for keyword in _KEYWORD_CATEGORY
+}
+
+
+def _match_keywords(user_lower: str):
+    """Return the sets of CRM and natural keywords contained in lowercased text"""
+    hits = {"crm": set(), "natural": set()}
+    
+    if _KEYWORD_AUTOMATON is not None:
+        # Single O(N) pass; overlapping matches keep plain substring semantics
+        for _, (category, keyword) in _KEYWORD_AUTOMATON.iter(user_lower):
+            hits[category].add(keyword)
+    else:
+        for match in _KEYWORD_RE.finditer(user_lower):
+            for keyword in _KEYWORD_IMPLIED[match.group(1)]:
+                hits[_KEYWORD_CATEGORY[keyword]].add(keyword)
+    
+    return hits["crm"], hits["natural"]
+
+
+def _score_keywords(user_lower: str) -> Tuple[int, int, Tuple[str, ...], Tuple[str, ...]]:
+    """Score lowercased text, returning (crm_score, natural_score, crm_found, natural_found)"""
+    crm_hits, natural_hits = _match_keywords(user_lower)
+    crm_found = tuple(sorted(crm_hits, key=_KEYWORD_ORDER.__getitem__))
+    natural_found = tuple(sorted(natural_hits, key=_KEYWORD_ORDER.__getitem__))
+    return len(crm_found), len(natural_found), crm_found, natural_found
+
+
+def _detect_operation(text_lower: str) -> Optional[str]:
+    """Return the specialist operation for the highest-priority phrase in the text"""
+    if _OPERATION_AUTOMATON is not None:
+        matched = [phrase for _, phrase in _OPERATION_AUTOMATON.iter(text_lower)]
+        if not matched:
+            return None
+        return _OPERATION_MAPPING[min(matched, key=_OPERATION_PRIORITY.__getitem__)]
+    
+    for phrase, operation in _OPERATION_MAPPING.items():
+        if phrase in text_lower:
+            return operation
+    return None
+
+
+class Hook(TypedDict):
+    """Shape of a runtime hook record; kept a plain dict so consumers can index and extend it"""
+    hook_type: str
+    timestamp: str
+    component: str
+    data: Dict[str, Any]
+    status: str
+    session_id: str
+
+
+def _encode_payload(payload: Any) -> bytes:
+    """Encode a response payload to JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=str).encode()
+
+
+# Last formatted second, shared by all hook timestamps in this module
+_iso_second_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, formatting the date part once per second"""
+    seconds, remainder_ns = divmod(time.time_ns(), 1_000_000_000)
+    if seconds != _iso_second_cache[0]:
+        _iso_second_cache[0] = seconds
+        _iso_second_cache[1] = datetime.fromtimestamp(seconds).isoformat()
+    return f"{_iso_second_cache[1]}.{remainder_ns // 1000:06d}"
+
+
 class AgentDelegator(Component):
     display_name = "Agent Delegator"
     description = "Intelligent task delegation between Primary and Specialist agents with runtime hooks"
@@ -47,6 +275,12 @@ class AgentDelegator(Component):
             value=True,
             info="Enable progress notifications and status updates"
         ),
+        IntInput(
+            name="hook_buffer_size",
+            display_name="Hook Buffer Size",
+            value=512,
+            info="Maximum number of recent hooks to keep (oldest are dropped)"
+        ),
         MessageTextInput(
             name="primary_system_prompt",
             display_name="Primary Agent System Prompt",
@@ -68,22 +302,57 @@ class AgentDelegator(Component):
         Output(display_name="Task Analysis", name="task_analysis", method="get_task_analysis")
     ]
     
+    # Delegation mode -> predicate over the task analysis
+    _DELEGATION_RULES = {
+        "force_specialist": lambda analysis: True,
+        "primary_only": lambda analysis: False,
+        "auto_detect": lambda analysis: analysis["recommended_agent"] == AGENT_SPECIALIST,
+        # Use specialist for high-confidence CRM tasks, primary for everything else
+        "hybrid": lambda analysis: analysis["recommended_agent"] == AGENT_SPECIALIST and analysis["confidence"] > 0.3
+    }
+    
+    # Modes whose routing does not depend on the input, so analysis can be skipped
+    _FIXED_DELEGATION = {
+        "force_specialist": True,
+        "primary_only": False
+    }
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.hooks = []
+        self.hooks = deque(maxlen=getattr(self, 'hook_buffer_size', None) or 512)
         self.current_agent = None
         self.task_analysis = {}
+        self._session_id = uuid.uuid4().hex
+        self._task_counter = itertools.count()
+        # (input, input.lower()) from the last analysis, reused by the specialist path
+        self._user_lower = ("", "")
+        # Last delegation result and its lazily encoded JSON form
+        self._last_result = None
+        self._response_bytes = None
+        
+    def _lowered(self, user_input: str) -> str:
+        """Return user_input lowercased, reusing the copy made during analysis"""
+        cached_input, cached_lower = self._user_lower
+        if user_input is cached_input or user_input == cached_input:
+            return cached_lower
+        lowered = user_input.lower()
+        self._user_lower = (user_input, lowered)
+        return lowered
         
-    def emit_hook(self, hook_type: str, data: Dict[str, Any]):
+    def _next_task_id(self) -> str:
+        """Return a session-scoped task ID without drawing a fresh UUID"""
+        return f"{self._session_id}-{next(self._task_counter)}"
+    
+    def emit_hook(self, hook_type: str, data: Dict[str, Any]) -> Optional[Hook]:
         """Emit runtime hook for progress tracking"""
         if self.enable_hooks:
-            hook = {
+            hook: Hook = {
                 "hook_type": hook_type,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "component": "agent_delegator",
                 "data": data,
                 "status": "active",
-                "session_id": getattr(self, '_session_id', str(uuid.uuid4()))
+                "session_id": self._session_id
             }
             self.hooks.append(hook)
             return hook
@@ -92,35 +361,18 @@ class AgentDelegator(Component):
     def analyze_task(self, user_input: str) -> Dict[str, Any]:
         """Analyze user input to determine task delegation"""
         
-        # CRM-related keywords that suggest specialist agent
-        crm_keywords = [
-            'assistant', 'ai call', 'contact', 'gohighlevel', 'ghl', 
-            'conversation', 'lead', 'crm', 'customer', 'phone',
-            'message', 'create assistant', 'make call', 'update contact',
-            'calling campaign', 'bulk call', 'leads', 'sales'
-        ]
-        
-        # Natural language processing keywords
-        natural_keywords = [
-            'chat', 'talk', 'explain', 'help', 'question', 'general',
-            'what is', 'how to', 'can you', 'please help'
-        ]
-        
-        user_lower = user_input.lower()
-        
-        crm_score = sum(1 for keyword in crm_keywords if keyword in user_lower)
-        natural_score = sum(1 for keyword in natural_keywords if keyword in user_lower)
+        crm_score, natural_score, crm_found, natural_found = _score_keywords(self._lowered(user_input))
         
         analysis = {
             "input": user_input,
             "crm_score": crm_score,
             "natural_score": natural_score,
             "keywords_found": {
-                "crm": [kw for kw in crm_keywords if kw in user_lower],
-                "natural": [kw for kw in natural_keywords if kw in user_lower]
+                "crm": list(crm_found),
+                "natural": list(natural_found)
             },
-            "recommended_agent": "specialist" if crm_score > natural_score else "primary",
-            "confidence": abs(crm_score - natural_score) / max(len(crm_keywords), len(natural_keywords)),
+            "recommended_agent": AGENT_SPECIALIST if crm_score > natural_score else AGENT_PRIMARY,
+            "confidence": abs(crm_score - natural_score) / _KW_NORM,
             "delegation_reason": ""
         }
         
@@ -139,30 +391,22 @@ class AgentDelegator(Component):
     def should_delegate_to_specialist(self, analysis: Dict[str, Any]) -> bool:
         """Determine if task should be delegated to specialist"""
         
-        if self.delegation_mode == "force_specialist":
-            return True
-        elif self.delegation_mode == "primary_only":
-            return False
-        elif self.delegation_mode == "auto_detect":
-            return analysis["recommended_agent"] == "specialist"
-        elif self.delegation_mode == "hybrid":
-            # Use specialist for high-confidence CRM tasks, primary for everything else
-            return analysis["recommended_agent"] == "specialist" and analysis["confidence"] > 0.3
-        
-        return False
+        rule = self._DELEGATION_RULES.get(self.delegation_mode)
+        return rule(analysis) if rule is not None else False
     
     async def execute_with_primary_agent(self, user_input: str) -> Dict[str, Any]:
         """Execute task with primary agent"""
         
-        self.emit_hook("pre_task", {
-            "agent": "primary",
-            "action": "natural_language_processing",
-            "input": user_input
-        })
+        if self.enable_hooks:
+            self.emit_hook(HOOK_PRE, {
+                "agent": AGENT_PRIMARY,
+                "action": "natural_language_processing",
+                "input": user_input
+            })
         
         # Simulate primary agent response (in real implementation, this would call an LLM)
         response = {
-            "agent": "primary",
+            "agent": AGENT_PRIMARY,
             "response": f"I understand you're asking about: {user_input}. I'm a general assistant and can help with various tasks. If you need CRM operations like creating assistants or managing contacts, I can delegate that to our specialist agent.",
             "can_delegate": True,
             "suggested_next_steps": [
@@ -172,51 +416,40 @@ class AgentDelegator(Component):
             ]
         }
         
-        self.emit_hook("end_run", {
-            "agent": "primary",
-            "response": response,
-            "success": True
-        })
+        if self.enable_hooks:
+            self.emit_hook(HOOK_END, {
+                "agent": AGENT_PRIMARY,
+                "response": response,
+                "success": True
+            })
         
         return response
     
     async def execute_with_specialist_agent(self, user_input: str, tools: Optional[Any] = None) -> Dict[str, Any]:
         """Execute task with specialist agent"""
         
-        self.emit_hook("pre_task", {
-            "agent": "specialist",
-            "action": "crm_operation",
-            "input": user_input,
-            "tools_available": bool(tools)
-        })
+        if self.enable_hooks:
+            self.emit_hook(HOOK_PRE, {
+                "agent": AGENT_SPECIALIST,
+                "action": "crm_operation",
+                "input": user_input,
+                "tools_available": bool(tools)
+            })
         
         # Parse the input for CRM operations
-        operation_mapping = {
-            "create assistant": "create_assistant_operation",
-            "make call": "ai_call_operation", 
-            "find contact": "contact_lookup_operation",
-            "send message": "message_operation",
-            "switch location": "location_switch_operation",
-            "calling campaign": "bulk_call_operation",
-            "bulk call": "bulk_call_operation"
-        }
-        
-        detected_operation = None
-        for phrase, operation in operation_mapping.items():
-            if phrase in user_input.lower():
-                detected_operation = operation
-                break
+        detected_operation = _detect_operation(self._lowered(user_input))
         
-        self.emit_hook("start_task", {
-            "agent": "specialist",
-            "operation": detected_operation or "general_crm_task",
-            "task_id": str(uuid.uuid4())
-        })
+        if self.enable_hooks:
+            self.emit_hook(HOOK_START, {
+                "agent": AGENT_SPECIALIST,
+                "operation": detected_operation or "general_crm_task",
+                "task_id": self._next_task_id()
+            })
         
         # Simulate specialist agent response
         if detected_operation:
             response = {
-                "agent": "specialist",
+                "agent": AGENT_SPECIALIST,
                 "operation": detected_operation,
                 "response": f"I've identified this as a {detected_operation.replace('_', ' ')}. I'm equipped with specialized CRM tools to handle this request.",
                 "tool_calls_planned": self._plan_tool_calls(detected_operation, user_input),
@@ -225,117 +458,64 @@ class AgentDelegator(Component):
             }
         else:
             response = {
-                "agent": "specialist", 
+                "agent": AGENT_SPECIALIST, 
                 "operation": "analysis",
                 "response": f"I'm analyzing your CRM request: {user_input}. I have access to Assistable AI and GoHighLevel tools to help you.",
-                "available_operations": list(operation_mapping.keys()),
+                "available_operations": list(_OPERATION_MAPPING),
                 "suggestion": "Please specify which CRM operation you'd like to perform.",
                 "can_execute": False
             }
         
-        self.emit_hook("end_run", {
-            "agent": "specialist",
-            "operation": detected_operation,
-            "response": response,
-            "success": True
-        })
+        if self.enable_hooks:
+            self.emit_hook(HOOK_END, {
+                "agent": AGENT_SPECIALIST,
+                "operation": detected_operation,
+                "response": response,
+                "success": True
+            })
         
         return response
     
     def _plan_tool_calls(self, operation: str, user_input: str) -> List[str]:
         """Plan which tools to call for the operation"""
         
-        tool_plans = {
-            "create_assistant_operation": [
-                "validate_location_access",
-                "create_assistant_api_call",
-                "confirm_creation"
-            ],
-            "ai_call_operation": [
-                "lookup_contact",
-                "validate_phone_number",
-                "initiate_ai_call",
-                "track_call_status"  
-            ],
-            "bulk_call_operation": [
-                "validate_contact_list",
-                "create_assistant_if_needed",
-                "initiate_bulk_calls",
-                "monitor_campaign_progress"
-            ],
-            "contact_lookup_operation": [
-                "search_by_identifier",
-                "retrieve_contact_details",
-                "format_contact_info"
-            ],
-            "message_operation": [
-                "lookup_conversation",
-                "send_message",
-                "confirm_delivery"
-            ],
-            "location_switch_operation": [
-                "validate_location_access",
-                "switch_context",
-                "confirm_switch"
-            ]
-        }
-        
-        return tool_plans.get(operation, ["analyze_request", "determine_next_steps"])
+        return list(_TOOL_PLANS.get(operation, _DEFAULT_TOOL_PLAN))
     
     def _get_next_steps(self, operation: str) -> List[str]:
         """Get suggested next steps for the operation"""
         
-        next_steps = {
-            "create_assistant_operation": [
-                "Provide assistant name and description",
-                "Specify location ID if different from default",
-                "Configure assistant parameters"
-            ],
-            "ai_call_operation": [
-                "Provide contact ID or phone number",
-                "Specify assistant to use for the call",
-                "Confirm number pool for outbound calling"
-            ],
-            "bulk_call_operation": [
-                "Provide contact list or criteria",
-                "Create or specify assistant for calls",
-                "Configure campaign parameters"
-            ],
-            "contact_lookup_operation": [
-                "Provide email, phone, or contact ID",
-                "Specify which location to search",
-                "Review returned contact information"
-            ]
-        }
-        
-        return next_steps.get(operation, ["Provide more specific details about your request"])
+        return list(_NEXT_STEPS.get(operation, _DEFAULT_NEXT_STEPS))
     
     async def delegate_task(self) -> Data:
         """Main delegation logic"""
         try:
-            # Generate session ID for tracking
-            if not hasattr(self, '_session_id'):
-                self._session_id = str(uuid.uuid4())
-            
-            # Analyze the task
-            self.task_analysis = self.analyze_task(self.user_input)
+            fixed_route = self._FIXED_DELEGATION.get(self.delegation_mode)
+            if fixed_route is None:
+                # Analyze the task
+                self.task_analysis = self.analyze_task(self.user_input)
+            else:
+                self.task_analysis = {"input": self.user_input, "skipped": True}
             
-            self.emit_hook("task_analysis", {
-                "analysis": self.task_analysis,
-                "delegation_mode": self.delegation_mode
-            })
+            if self.enable_hooks:
+                self.emit_hook(HOOK_ANALYSIS, {
+                    "analysis": self.task_analysis,
+                    "delegation_mode": self.delegation_mode
+                })
             
             # Determine delegation
-            should_use_specialist = self.should_delegate_to_specialist(self.task_analysis)
+            if fixed_route is None:
+                should_use_specialist = self.should_delegate_to_specialist(self.task_analysis)
+            else:
+                should_use_specialist = fixed_route
             
             if should_use_specialist:
-                self.current_agent = "specialist"
+                self.current_agent = AGENT_SPECIALIST
                 result = await self.execute_with_specialist_agent(
                     self.user_input, 
                     self.specialist_tools
                 )
             else:
-                self.current_agent = "primary"
+                self.current_agent = AGENT_PRIMARY
                 result = await self.execute_with_primary_agent(self.user_input)
             
             # Add delegation metadata
@@ -346,25 +526,38 @@ class AgentDelegator(Component):
                 "session_id": self._session_id
             }
             
-            return Data(data=result)
+            return self._respond(result)
             
         except Exception as e:
             error_result = {
                 "error": f"Delegation failed: {str(e)}",
                 "agent_used": self.current_agent,
-                "session_id": getattr(self, '_session_id', 'unknown')
+                "session_id": self._session_id
             }
             
-            self.emit_hook("error", {
-                "error": str(e),
-                "agent": self.current_agent
-            })
+            if self.enable_hooks:
+                self.emit_hook(HOOK_ERR, {
+                    "error": str(e),
+                    "agent": self.current_agent
+                })
             
-            return Data(data=error_result)
+            return self._respond(error_result)
+    
+    def _respond(self, payload: Dict[str, Any]) -> Data:
+        """Wrap a delegation payload, remembering it for response_bytes"""
+        self._last_result = payload
+        self._response_bytes = None
+        return Data(data=payload)
+    
+    def response_bytes(self) -> Optional[bytes]:
+        """Return the last delegation result as JSON bytes, encoded once and cached"""
+        if self._response_bytes is None and self._last_result is not None:
+            self._response_bytes = _encode_payload(self._last_result)
+        return self._response_bytes
     
     def get_hooks(self) -> Data:
         """Return runtime hooks for monitoring"""
-        return Data(data={"hooks": self.hooks})
+        return Data(data={"hooks": list(self.hooks)})
     
     def get_agent_used(self) -> Data:
         """Return which agent was used"""
@@ -1,13 +1,53 @@
 import httpx
 import asyncio
-from typing import Dict, Any, Optional, List
+import copy
+import os
+from typing import Dict, Any, Optional, List, Tuple, TypedDict
 from datetime import datetime
+import sys
+import time
 import uuid
+import itertools
+from collections import deque
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C extension
+    orjson = None
 
 from langflow.custom import Component
 from langflow.io import DropdownInput, MessageTextInput, Output, BoolInput, IntInput
 from langflow.schema import Data
 
+# Hook types shared with RuntimeHooks filters
+HOOK_PRE = sys.intern("pre_task")
+HOOK_START = sys.intern("start_task")
+HOOK_END = sys.intern("end_run")
+HOOK_ERR = sys.intern("error")
+
+
+class Hook(TypedDict):
+    """Shape of a runtime hook record; kept a plain dict so consumers can index and extend it"""
+    hook_type: str
+    timestamp: str
+    component: str
+    data: Dict[str, Any]
+    status: str
+
+
+# Last formatted second, shared by all hook timestamps in this module
+_iso_second_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, formatting the date part once per second"""
+    seconds, remainder_ns = divmod(time.time_ns(), 1_000_000_000)
+    if seconds != _iso_second_cache[0]:
+        _iso_second_cache[0] = seconds
+        _iso_second_cache[1] = datetime.fromtimestamp(seconds).isoformat()
+    return f"{_iso_second_cache[1]}.{remainder_ns // 1000:06d}"
+
+
 class AssistableAIClient(Component):
     display_name = "Assistable AI Client"
     description = "Direct integration with Assistable AI API for creating assistants and managing conversations"
@@ -90,6 +130,12 @@ class AssistableAIClient(Component):
             value=True,
             info="Enable runtime hook notifications"
         ),
+        IntInput(
+            name="hook_buffer_size",
+            display_name="Hook Buffer Size",
+            value=512,
+            info="Maximum number of recent hooks to keep (oldest are dropped)"
+        ),
         IntInput(
             name="timeout",
             display_name="Request Timeout",
@@ -103,17 +149,48 @@ class AssistableAIClient(Component):
         Output(display_name="Hooks", name="hooks", method="get_hooks")
     ]
     
+    # Operation name -> coroutine method implementing it
+    _OPERATIONS = {
+        "create_assistant": "create_assistant",
+        "chat_completion": "chat_completion",
+        "make_ai_call": "make_ai_call",
+        "get_conversation": "get_conversation",
+        "create_message": "create_message",
+        "update_assistant": "update_assistant",
+        "delete_assistant": "delete_assistant",
+        "create_flow": "create_flow"
+    }
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.hooks = []
+        self.hooks = deque(maxlen=getattr(self, 'hook_buffer_size', None) or 512)
         self.base_url = "https://api.assistable.ai/v2"
-        
-    def emit_hook(self, hook_type: str, data: Dict[str, Any]):
+        self._session_id = uuid.uuid4().hex
+        self._task_counter = itertools.count()
+        
+        # Environment fallbacks, read once per instance
+        self._env_token = os.environ.get("ASSISTABLE_API_TOKEN")
+        self._env_location_id = os.environ.get("DEFAULT_LOCATION_ID")
+        self._env_number_pool_id = os.environ.get("DEFAULT_NUMBER_POOL_ID")
+        
+        # Pooled HTTP client, created lazily and reused across requests
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_key: Optional[Tuple[Any, ...]] = None
+        # Set on bulk_execute workers: the client they must use instead of managing the pool
+        self._pinned_client: Optional[httpx.AsyncClient] = None
+        self._header_token: Optional[str] = None
+        self._headers: Dict[str, str] = {}
+        
+    def _next_task_id(self) -> str:
+        """Return a session-scoped task ID without drawing a fresh UUID"""
+        return f"{self._session_id}-{next(self._task_counter)}"
+    
+    def emit_hook(self, hook_type: str, data: Dict[str, Any]) -> Optional[Hook]:
         """Emit runtime hook for progress tracking"""
         if self.emit_hooks:
-            hook = {
+            hook: Hook = {
                 "hook_type": hook_type,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "component": "assistable_ai_client",
                 "data": data,
                 "status": "active"
@@ -122,6 +199,50 @@ class AssistableAIClient(Component):
             return hook
         return None
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running loop and current settings
+        
+        The pool is rebuilt when the event loop, base_url or timeout changes; a superseded
+        client on the same loop is closed in the background.
+        """
+        pinned = self._pinned_client
+        if pinned is not None:
+            return pinned
+        loop = asyncio.get_running_loop()
+        key = (loop, self.base_url, self.timeout)
+        client = self._client
+        if client is not None and not client.is_closed and self._client_key == key:
+            return client
+        if client is not None and not client.is_closed and self._client_key[0] is loop:
+            asyncio.ensure_future(client.aclose())
+        self._client_key = key
+        self._client = self._build_client()
+        return self._client
+    
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": "Skyward-Langflow-Bundle/1.0.0"
+            }
+        )
+    
+    def _auth_headers(self, api_token: str) -> Dict[str, str]:
+        """Return the per-request auth header, rebuilt only when the token changes"""
+        if api_token != self._header_token:
+            self._header_token = api_token
+            self._headers = {"Authorization": f"Bearer {api_token}"}
+        return self._headers
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_key = None
+    
     async def _make_request(
         self, 
         method: str, 
@@ -132,40 +253,47 @@ class AssistableAIClient(Component):
         """Make HTTP request to Assistable AI API"""
         
         # Get API token from input or environment
-        import os
-        api_token = self.api_token or os.getenv("ASSISTABLE_API_TOKEN")
+        api_token = self.api_token or self._env_token
         if not api_token:
             return {"error": "API token is required. Set ASSISTABLE_API_TOKEN environment variable or provide token input."}
         
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": "Skyward-Langflow-Bundle/1.0.0"
-        }
-        
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data if data else None,
-                    params=params if params else None
-                )
-                
-                if response.status_code == 401:
-                    return {"error": "Unauthorized - Check API token"}
-                elif response.status_code == 429:
-                    return {"error": "Rate limited - Please try again later"}
-                elif response.status_code >= 400:
-                    return {"error": f"API Error {response.status_code}: {response.text}"}
-                
+            body = {}
+            if data:
+                # orjson emits bytes directly; Content-Type is set on the pooled client
+                if orjson is not None:
+                    body["content"] = orjson.dumps(data)
+                else:
+                    body["json"] = data
+            
+            client = self._get_client()
+            response = await client.request(
+                method=method,
+                url=endpoint,
+                headers=self._auth_headers(api_token),
+                params=params if params else None,
+                **body
+            )
+            
+            if response.status_code == 401:
+                return {"error": "Unauthorized - Check API token"}
+            elif response.status_code == 429:
+                return {"error": "Rate limited - Please try again later"}
+            elif response.status_code >= 400:
+                return {"error": f"API Error {response.status_code}: {response.text}"}
+            
+            if orjson is not None:
+                # Parse the raw body directly instead of going through httpx's stdlib decoder
                 try:
-                    return response.json()
-                except Exception:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     return {"success": True, "response": response.text}
-                    
+            
+            try:
+                return response.json()
+            except Exception:
+                return {"success": True, "response": response.text}
+                
         except httpx.TimeoutException:
             return {"error": "Request timeout"}
         except Exception as e:
@@ -174,18 +302,18 @@ class AssistableAIClient(Component):
     async def create_assistant(self) -> Dict[str, Any]:
         """Create a new assistant"""
         # Get location ID
-        import os
-        location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
+        location_id = self.location_id or self._env_location_id
         if not location_id:
             return {"error": "Location ID is required"}
         
         # Emit pre_task hook
-        self.emit_hook("pre_task", {
-            "action": "create_assistant",
-            "name": self.assistant_name,
-            "description": self.assistant_description,
-            "location_id": location_id
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_PRE, {
+                "action": "create_assistant",
+                "name": self.assistant_name,
+                "description": self.assistant_description,
+                "location_id": location_id
+            })
         
         data = {
             "name": self.assistant_name or "New Assistant",
@@ -198,20 +326,22 @@ class AssistableAIClient(Component):
         }
         
         # Emit start_task hook
-        self.emit_hook("start_task", {
-            "task_id": str(uuid.uuid4()),
-            "action": "create_assistant",
-            "data": data
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_START, {
+                "task_id": self._next_task_id(),
+                "action": "create_assistant",
+                "data": data
+            })
         
         result = await self._make_request("POST", "/create-assistant", data)
         
         # Emit end_run hook
-        self.emit_hook("end_run", {
-            "action": "create_assistant",
-            "result": result,
-            "success": "error" not in result
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_END, {
+                "action": "create_assistant",
+                "result": result,
+                "success": "error" not in result
+            })
         
         return result
     
@@ -221,16 +351,16 @@ class AssistableAIClient(Component):
         conversation_id = self.conversation_id or f"conv_{uuid.uuid4().hex[:8]}"
         
         # Get location ID
-        import os
-        location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
+        location_id = self.location_id or self._env_location_id
         
         # Emit pre_task hook
-        self.emit_hook("pre_task", {
-            "action": "chat_completion",
-            "conversation_id": conversation_id,
-            "assistant_id": self.assistant_id,
-            "input": self.input_text
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_PRE, {
+                "action": "chat_completion",
+                "conversation_id": conversation_id,
+                "assistant_id": self.assistant_id,
+                "input": self.input_text
+            })
         
         data = {
             "conversation_id": conversation_id,
@@ -242,41 +372,43 @@ class AssistableAIClient(Component):
         }
         
         # Emit start_task hook
-        self.emit_hook("start_task", {
-            "task_id": str(uuid.uuid4()),
-            "action": "chat_completion",
-            "conversation_id": conversation_id
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_START, {
+                "task_id": self._next_task_id(),
+                "action": "chat_completion",
+                "conversation_id": conversation_id
+            })
         
         result = await self._make_request("POST", "/ghl-chat-completion", data)
         
         # Emit end_run hook
-        self.emit_hook("end_run", {
-            "action": "chat_completion",
-            "conversation_id": conversation_id,
-            "result": result,
-            "success": "error" not in result
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_END, {
+                "action": "chat_completion",
+                "conversation_id": conversation_id,
+                "result": result,
+                "success": "error" not in result
+            })
         
         return result
     
     async def make_ai_call(self) -> Dict[str, Any]:
         """Initiate AI call through GoHighLevel integration"""
         # Get default values from environment
-        import os
-        location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
-        number_pool_id = self.number_pool_id or os.getenv("DEFAULT_NUMBER_POOL_ID")
+        location_id = self.location_id or self._env_location_id
+        number_pool_id = self.number_pool_id or self._env_number_pool_id
         
         if not all([self.assistant_id, self.contact_id, number_pool_id, location_id]):
             return {"error": "Missing required fields: assistant_id, contact_id, number_pool_id, location_id"}
         
         # Emit pre_task hook
-        self.emit_hook("pre_task", {
-            "action": "make_ai_call",
-            "assistant_id": self.assistant_id,
-            "contact_id": self.contact_id,
-            "number_pool_id": number_pool_id
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_PRE, {
+                "action": "make_ai_call",
+                "assistant_id": self.assistant_id,
+                "contact_id": self.contact_id,
+                "number_pool_id": number_pool_id
+            })
         
         data = {
             "assistant_id": self.assistant_id,
@@ -286,20 +418,22 @@ class AssistableAIClient(Component):
         }
         
         # Emit start_task hook
-        self.emit_hook("start_task", {
-            "task_id": str(uuid.uuid4()),
-            "action": "make_ai_call",
-            "call_data": data
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_START, {
+                "task_id": self._next_task_id(),
+                "action": "make_ai_call",
+                "call_data": data
+            })
         
         result = await self._make_request("POST", "/ghl/make-call", data)
         
         # Emit end_run hook
-        self.emit_hook("end_run", {
-            "action": "make_ai_call",
-            "result": result,
-            "success": "error" not in result
-        })
+        if self.emit_hooks:
+            self.emit_hook(HOOK_END, {
+                "action": "make_ai_call",
+                "result": result,
+                "success": "error" not in result
+            })
         
         return result
     
@@ -317,8 +451,7 @@ class AssistableAIClient(Component):
         conversation_id = self.conversation_id or f"conv_{uuid.uuid4().hex[:8]}"
         
         # Get location ID
-        import os
-        location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
+        location_id = self.location_id or self._env_location_id
         
         data = {
             "location_id": location_id,
@@ -361,8 +494,7 @@ class AssistableAIClient(Component):
     async def create_flow(self) -> Dict[str, Any]:
         """Create a new flow in Assistable AI"""
         # Get location ID
-        import os
-        location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
+        location_id = self.location_id or self._env_location_id
         if not location_id:
             return {"error": "Location ID is required"}
         
@@ -372,35 +504,58 @@ class AssistableAIClient(Component):
     async def execute_operation(self) -> Data:
         """Execute the selected operation"""
         try:
-            if self.operation == "create_assistant":
-                result = await self.create_assistant()
-            elif self.operation == "chat_completion":
-                result = await self.chat_completion()
-            elif self.operation == "make_ai_call":
-                result = await self.make_ai_call()
-            elif self.operation == "get_conversation":
-                result = await self.get_conversation()
-            elif self.operation == "create_message":
-                result = await self.create_message()
-            elif self.operation == "update_assistant":
-                result = await self.update_assistant()
-            elif self.operation == "delete_assistant":
-                result = await self.delete_assistant()
-            elif self.operation == "create_flow":
-                result = await self.create_flow()
-            else:
+            method_name = self._OPERATIONS.get(self.operation)
+            if method_name is None:
                 result = {"error": f"Unknown operation: {self.operation}"}
+            else:
+                result = await getattr(self, method_name)()
             
             return Data(data=result)
             
         except Exception as e:
             error_result = {"error": f"Operation failed: {str(e)}"}
-            self.emit_hook("error", {
-                "action": self.operation,
-                "error": str(e)
-            })
+            if self.emit_hooks:
+                self.emit_hook(HOOK_ERR, {
+                    "action": self.operation,
+                    "error": str(e)
+                })
             return Data(data=error_result)
     
+    async def _dispatch(self, op: Dict[str, Any], client: httpx.AsyncClient) -> Dict[str, Any]:
+        """Run one operation described by a dict of input overrides, over client"""
+        operation = op.get("operation", self.operation)
+        method_name = self._OPERATIONS.get(operation)
+        if method_name is None:
+            return {"error": f"Unknown operation: {operation}"}
+        
+        # Each op gets its own view of the inputs; hooks and the HTTP pool stay shared
+        worker = copy.copy(self)
+        for name, value in op.items():
+            setattr(worker, name, value)
+        
+        # An op that overrides transport settings gets a private client for its request
+        private = None
+        if worker.base_url != self.base_url or worker.timeout != self.timeout:
+            private = client = worker._build_client()
+        worker._pinned_client = client
+        try:
+            return await getattr(worker, method_name)()
+        finally:
+            if private is not None:
+                await private.aclose()
+    
+    async def bulk_execute(self, ops: List[Dict[str, Any]], max_concurrency: int = 10) -> List[Any]:
+        """Run independent operations concurrently over the pooled client"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Resolved once; workers never replace or close it
+        client = self._get_client()
+        
+        async def run(op: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._dispatch(op, client)
+        
+        return await asyncio.gather(*(run(op) for op in ops), return_exceptions=True)
+    
     def get_hooks(self) -> Data:
         """Return runtime hooks for monitoring"""
-        return Data(data={"hooks": self.hooks})
+        return Data(data={"hooks": list(self.hooks)})
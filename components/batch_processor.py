@@ -1,13 +1,164 @@
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, NamedTuple,
+    Optional, Sized
+)
 from datetime import datetime
+from collections import deque
+import os
+import time
 import uuid
 import json
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional C extension
+    uvloop = None
+
 from langflow.custom import Component
 from langflow.io import MessageTextInput, DropdownInput, Output, BoolInput, IntInput, DataInput
 from langflow.schema import Data
 
+def _maybe_use_uvloop() -> bool:
+    """Make new event loops uvloop-backed when installed and DEFAULT_USE_UVLOOP=true"""
+    if uvloop is None or os.getenv("DEFAULT_USE_UVLOOP", "false").lower() != "true":
+        return False
+    # Only the policy is swapped, so a loop the host is already running is left alone
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+_maybe_use_uvloop()
+
+# asyncio.timeout (3.11+) reschedules one handle instead of wrapping each item in a task
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+# Last formatted second, shared by all hook timestamps in this module
+_iso_second_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, formatting the date part once per second"""
+    seconds, remainder_ns = divmod(time.time_ns(), 1_000_000_000)
+    if seconds != _iso_second_cache[0]:
+        _iso_second_cache[0] = seconds
+        _iso_second_cache[1] = datetime.fromtimestamp(seconds).isoformat()
+    return f"{_iso_second_cache[1]}.{remainder_ns // 1000:06d}"
+
+
+class ItemResult(NamedTuple):
+    """Outcome of one batch item, kept as a tuple until the batch output is built"""
+    index: int
+    item: Any
+    result: Any
+    success: bool
+    error: Optional[str]
+    timestamp: str
+
+
+class _AdaptiveLimiter:
+    """AIMD concurrency limit: grows by one per window of fast completions, halves on rate limits"""
+    
+    # Completion slower than this multiple of the latency EMA counts as a slowdown
+    SLOWDOWN_FACTOR = 2.0
+    EMA_ALPHA = 0.2
+    
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self.latency_ema: Optional[float] = None
+        self.throttle_events = 0
+        self._waiters = deque()
+    
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+    
+    async def acquire(self):
+        if not self._waiters and self.in_flight < self.current:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # A slot handed over just as we were cancelled goes back to the pool
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1
+                self._wake()
+            raise
+    
+    def release(self, latency: Optional[float] = None, throttled: bool = False):
+        self.in_flight -= 1
+        if throttled:
+            self.throttle_events += 1
+            self.limit = max(self.minimum, self.limit / 2)
+        elif latency is not None:
+            if self.latency_ema is not None and latency > self.latency_ema * self.SLOWDOWN_FACTOR:
+                self.limit = max(self.minimum, self.limit - 1)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            if self.latency_ema is None:
+                self.latency_ema = latency
+            else:
+                self.latency_ema += self.EMA_ALPHA * (latency - self.latency_ema)
+        self._wake()
+    
+    def _wake(self):
+        while self._waiters and self.in_flight < self.current:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class TokenBucket:
+    """Pace requests to rate per period, bursting up to capacity
+    
+    Share one instance as the rate_limiter of every BatchProcessor calling the same API.
+    An empty bucket lends the token against future refill and the caller sleeps until it
+    is due, so waiters go in arrival order without a lock or a bound event loop.
+    """
+    
+    def __init__(self, rate: float, period: float = 1.0, capacity: Optional[float] = None):
+        self.rate_per_second = rate / period
+        self.capacity = rate if capacity is None else capacity
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+    
+    async def acquire(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            try:
+                await asyncio.sleep(-self._tokens / self.rate_per_second)
+            except asyncio.CancelledError:
+                self._tokens += 1
+                raise
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _is_throttled(record: ItemResult) -> bool:
+    """True if an item record reports an API rate limit"""
+    error = record.error
+    if not error and isinstance(record.result, dict):
+        error = record.result.get("error")
+    return isinstance(error, str) and ("Rate limited" in error or "429" in error)
+
+
 class BatchProcessor(Component):
     display_name = "Batch Processor"
     description = "Bulk operations for Assistable AI and GoHighLevel with progress tracking"
@@ -55,13 +206,25 @@ class BatchProcessor(Component):
             name="batch_size",
             display_name="Batch Size",
             value=10,
-            info="Number of items to process simultaneously"
+            info="Number of items to process simultaneously (starting point when concurrency adapts)"
+        ),
+        IntInput(
+            name="min_concurrency",
+            display_name="Min Concurrency",
+            value=1,
+            info="Lower bound for in-flight items when backing off from rate limits or slow responses"
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            value=50,
+            info="Upper bound for in-flight items while responses stay fast"
         ),
         IntInput(
             name="delay_between_batches",
             display_name="Delay Between Batches (seconds)",
             value=2,
-            info="Delay between batch processing"
+            info="Pause before launching the next batch after a rate limit is hit"
         ),
         BoolInput(
             name="stop_on_error",
@@ -90,117 +253,270 @@ class BatchProcessor(Component):
         Output(display_name="Errors", name="errors", method="get_errors")
     ]
     
+    # Minimum seconds between chunk_progress hooks
+    _PROGRESS_INTERVAL = 0.1
+    # Most hooks moved into progress_hooks per drain wakeup
+    _HOOK_DRAIN_BATCH = 256
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.progress_hooks = []
+        self.progress_hooks = deque(maxlen=4096)
         self.batch_results = []
         self.batch_errors = []
         self.batch_summary = {}
         self.session_id = str(uuid.uuid4())
+        # Fields shared by every progress hook of this session
+        self._hook_base = {
+            "component": "batch_processor",
+            "session_id": self.session_id,
+            "batch_operation": getattr(self, "batch_operation", None)
+        }
+        self._started_at = None
+        # In-flight contact lookups for the current batch, keyed by contact identifiers
+        self._lookup_cache: Optional[Dict[tuple, asyncio.Future]] = None
+        # Hook queue and its drain task, live only while a batch is running
+        self._hook_queue: Optional[asyncio.Queue] = None
+        self._hook_task: Optional[asyncio.Future] = None
+        self._last_progress_emit = 0.0
+        # Optional TokenBucket shared with other processors hitting the same API
+        self.rate_limiter: Optional[TokenBucket] = None
+        # Optional callback given each ItemResult as it finishes, e.g. to feed a next stage
+        self.on_result: Optional[Callable[[ItemResult], None]] = None
+        self._resolve_defaults()
         
+    def _resolve_defaults(self):
+        """Resolve environment fallbacks once so item handlers skip per-item lookups"""
+        self._env_location_id = os.getenv("DEFAULT_LOCATION_ID")
+        self._default_location_id = getattr(self, "location_id", None) or self._env_location_id
+        self._default_number_pool_id = (
+            getattr(self, "number_pool_id", None) or os.getenv("DEFAULT_NUMBER_POOL_ID")
+        )
+    
     def emit_progress_hook(self, hook_type: str, data: Dict[str, Any]):
         """Emit progress tracking hook"""
         if self.emit_progress_hooks:
-            hook = {
-                "hook_type": hook_type,
-                "timestamp": datetime.now().isoformat(),
-                "component": "batch_processor",
-                "session_id": self.session_id,
-                "data": data,
-                "batch_operation": self.batch_operation
-            }
-            self.progress_hooks.append(hook)
+            hook = {**self._hook_base, "hook_type": hook_type, "timestamp": _now_iso(), "data": data}
+            if self._hook_queue is not None:
+                self._hook_queue.put_nowait(hook)
+            else:
+                self.progress_hooks.append(hook)
             return hook
         return None
     
-    async def process_item_with_timeout(self, process_func, item: Any, index: int) -> Dict[str, Any]:
-        """Process a single item with timeout"""
+    async def _drain_hooks(self, queue: asyncio.Queue):
+        """Move queued hooks into progress_hooks in batches, one wakeup per burst"""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._HOOK_DRAIN_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            self.progress_hooks.extend(batch)
+            for _ in batch:
+                queue.task_done()
+    
+    def _start_hook_drain(self):
+        """Route hooks through a queue drained by one long-lived task"""
+        queue = asyncio.Queue()
+        self._hook_queue = queue
+        self._hook_task = asyncio.ensure_future(self._drain_hooks(queue))
+    
+    async def _stop_hook_drain(self):
+        """Flush queued hooks into progress_hooks and stop the drain task"""
+        queue, task = self._hook_queue, self._hook_task
+        if queue is None:
+            return
+        await queue.join()
+        self._hook_queue = None
+        self._hook_task = None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    
+    async def process_item_with_timeout(
+        self, process_func, item: Any, index: int, payload: Any = None
+    ) -> ItemResult:
+        """Process a single item with timeout, passing payload (the prepared item) when given"""
+        if payload is None:
+            payload = item
         try:
-            result = await asyncio.wait_for(
-                process_func(item, index),
-                timeout=self.timeout_per_item
+            if _asyncio_timeout is not None:
+                async with _asyncio_timeout(self.timeout_per_item):
+                    result = await process_func(payload, index)
+            else:
+                result = await asyncio.wait_for(
+                    process_func(payload, index),
+                    timeout=self.timeout_per_item
+                )
+            return ItemResult(
+                index=index,
+                item=item,
+                result=result,
+                success=True,
+                error=None,
+                timestamp=_now_iso()
             )
-            return {
-                "index": index,
-                "item": item,
-                "result": result,
-                "success": True,
-                "error": None,
-                "timestamp": datetime.now().isoformat()
-            }
         except asyncio.TimeoutError:
-            return {
-                "index": index,
-                "item": item,
-                "result": None,
-                "success": False,
-                "error": f"Timeout after {self.timeout_per_item} seconds",
-                "timestamp": datetime.now().isoformat()
-            }
+            return ItemResult(
+                index=index,
+                item=item,
+                result=None,
+                success=False,
+                error=f"Timeout after {self.timeout_per_item} seconds",
+                timestamp=_now_iso()
+            )
         except Exception as e:
-            return {
-                "index": index,
-                "item": item,
-                "result": None,
-                "success": False,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
+            return ItemResult(
+                index=index,
+                item=item,
+                result=None,
+                success=False,
+                error=str(e),
+                timestamp=_now_iso()
+            )
     
-    async def process_batch_chunk(self, process_func, items: List[Any], start_index: int) -> List[Dict[str, Any]]:
-        """Process a chunk of items concurrently"""
+    async def run_pipeline(self, process_func, items: Iterable[Any], prepare=None) -> List[ItemResult]:
+        """Process items through an adaptive concurrency limit, starting each as a slot frees up
         
-        self.emit_progress_hook("batch_chunk_start", {
-            "chunk_size": len(items),
-            "start_index": start_index,
-            "operation": self.batch_operation
-        })
+        items may be any iterable or async iterable; it is consumed lazily, one item per
+        free slot, so streaming inputs are never materialized. prepare, if given, validates and
+        resolves each item synchronously before it is scheduled, so invalid items fail
+        without a task or a concurrency slot.
+        """
         
-        # Create tasks for concurrent processing
-        tasks = [
-            self.process_item_with_timeout(process_func, item, start_index + i)
-            for i, item in enumerate(items)
-        ]
+        total_items = len(items) if isinstance(items, Sized) else None
+        window = max(1, self.batch_size)
+        limiter = _AdaptiveLimiter(window, self.min_concurrency, self.max_concurrency)
+        stopped = False
+        completed = 0
+        failed = 0
+        # Result slots written by index as items finish; preallocated when the size is known
+        results: List[Optional[ItemResult]] = [None] * total_items if total_items is not None else []
+        pending = set()
         
-        # Process concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        def finish(index: int, result: ItemResult) -> None:
+            nonlocal completed, failed, stopped
+            results[index] = result
+            completed += 1
+            if self.on_result is not None:
+                self.on_result(result)
+            if not result.success:
+                failed += 1
+                if self.stop_on_error and not stopped:
+                    stopped = True
+                    current = asyncio.current_task()
+                    for task in pending:
+                        if task is not current:
+                            task.cancel()
+            
+            # Coalesce progress updates to at most one per interval, plus the final one
+            if (completed % window == 0 or completed == total_items) and (
+                completed == total_items
+                or time.monotonic() - self._last_progress_emit > self._PROGRESS_INTERVAL
+            ):
+                self._last_progress_emit = time.monotonic()
+                progress = {
+                    "chunk_index": (completed - 1) // window,
+                    "processed_items": completed,
+                    "concurrency": limiter.current
+                }
+                if total_items:
+                    progress["total_items"] = total_items
+                    progress["progress_percentage"] = (completed / total_items) * 100
+                self.emit_progress_hook("chunk_progress", progress)
         
-        # Handle any exceptions from gather
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    "index": start_index + i,
-                    "item": items[i],
-                    "result": None,
-                    "success": False,
-                    "error": str(result),
-                    "timestamp": datetime.now().isoformat()
-                })
-            else:
-                processed_results.append(result)
+        async def run_one(index: int, item: Any, payload: Any) -> None:
+            latency = None
+            throttled = False
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+                started = time.monotonic()
+                result = await self.process_item_with_timeout(process_func, item, index, payload)
+                latency = time.monotonic() - started
+                throttled = _is_throttled(result)
+            finally:
+                limiter.release(latency, throttled)
+            finish(index, result)
         
-        self.emit_progress_hook("batch_chunk_complete", {
-            "chunk_size": len(items),
-            "start_index": start_index,
-            "successful": sum(1 for r in processed_results if r["success"]),
-            "failed": sum(1 for r in processed_results if not r["success"])
-        })
+        # Pull the next item only once a slot is free. delay_between_batches is spent at
+        # window boundaries only when a rate limit was reported since the last one
+        throttle_seen = 0
         
-        return processed_results
-    
-    async def bulk_create_assistants_item(self, item: Dict[str, Any], index: int) -> Dict[str, Any]:
-        """Process single assistant creation"""
-        # This would integrate with AssistableAIClient in real implementation
+        async def schedule(index: int, item: Any) -> bool:
+            """Start one item; False once stop_on_error has stopped the batch"""
+            nonlocal throttle_seen
+            if stopped:
+                return False
+            if index and index % window == 0 and self.delay_between_batches > 0:
+                if limiter.throttle_events > throttle_seen:
+                    throttle_seen = limiter.throttle_events
+                    await asyncio.sleep(self.delay_between_batches)
+            if total_items is None:
+                results.append(None)
+            
+            payload = None
+            if prepare is not None:
+                try:
+                    payload = prepare(item)
+                except Exception as e:
+                    finish(index, ItemResult(
+                        index=index,
+                        item=item,
+                        result=None,
+                        success=False,
+                        error=str(e),
+                        timestamp=_now_iso()
+                    ))
+                    return True
+            
+            await limiter.acquire()
+            if stopped:
+                limiter.release()
+                return False
+            task = asyncio.ensure_future(run_one(index, item, payload))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            return True
+        
+        if isinstance(items, AsyncIterable):
+            index = 0
+            async for item in items:
+                if not await schedule(index, item):
+                    break
+                index += 1
+        else:
+            for index, item in enumerate(items):
+                if not await schedule(index, item):
+                    break
+        
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         
+        # Slots stay empty only for items cancelled by stop_on_error
+        if completed < len(results):
+            results = [r for r in results if r is not None]
+        
+        if stopped:
+            self.emit_progress_hook("batch_stopped", {
+                "reason": "stop_on_error",
+                "processed_items": len(results),
+                "errors": failed
+            })
+        
+        return results
+    
+    def _prepare_create_assistant(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate an assistant item and resolve its location"""
         required_fields = ["name", "description", "prompt"]
         for field in required_fields:
             if field not in item:
                 raise ValueError(f"Missing required field: {field}")
         
         # Get location ID
-        import os
-        location_id = self.location_id or item.get("location_id") or os.getenv("DEFAULT_LOCATION_ID")
+        location_id = self.location_id or item.get("location_id") or self._env_location_id
+        return {**item, "location_id": location_id}
+    
+    async def bulk_create_assistants_item(self, item: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Process single assistant creation (item already prepared)"""
+        # This would integrate with AssistableAIClient in real implementation
         
         # Simulate API call delay
         await asyncio.sleep(0.5)
@@ -210,14 +526,12 @@ class BatchProcessor(Component):
             "assistant_id": f"asst_{uuid.uuid4().hex[:8]}",
             "name": item["name"],
             "description": item["description"],
-            "location_id": location_id,
-            "created_at": datetime.now().isoformat()
+            "location_id": item["location_id"],
+            "created_at": _now_iso()
         }
     
-    async def bulk_ai_calls_item(self, item: Dict[str, Any], index: int) -> Dict[str, Any]:
-        """Process single AI call"""
-        # This would integrate with AssistableAIClient in real implementation
-        
+    def _prepare_ai_call(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a call item and resolve assistant, number pool and location"""
         required_fields = ["contact_id"]
         for field in required_fields:
             if field not in item:
@@ -226,13 +540,23 @@ class BatchProcessor(Component):
         # Use provided or default values
         assistant_id = item.get("assistant_id") or self.assistant_id
         
-        import os
-        number_pool_id = item.get("number_pool_id") or self.number_pool_id or os.getenv("DEFAULT_NUMBER_POOL_ID")
-        location_id = item.get("location_id") or self.location_id or os.getenv("DEFAULT_LOCATION_ID")
+        number_pool_id = item.get("number_pool_id") or self._default_number_pool_id
+        location_id = item.get("location_id") or self._default_location_id
         
         if not all([assistant_id, number_pool_id, location_id]):
             raise ValueError("Missing required fields: assistant_id, number_pool_id, location_id")
         
+        return {
+            **item,
+            "assistant_id": assistant_id,
+            "number_pool_id": number_pool_id,
+            "location_id": location_id
+        }
+    
+    async def bulk_ai_calls_item(self, item: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Process single AI call (item already prepared)"""
+        # This would integrate with AssistableAIClient in real implementation
+        
         # Simulate API call delay
         await asyncio.sleep(1.0)
         
@@ -240,20 +564,67 @@ class BatchProcessor(Component):
         return {
             "call_id": f"call_{uuid.uuid4().hex[:8]}",
             "contact_id": item["contact_id"],
-            "assistant_id": assistant_id,
-            "number_pool_id": number_pool_id,
-            "location_id": location_id,
+            "assistant_id": item["assistant_id"],
+            "number_pool_id": item["number_pool_id"],
+            "location_id": item["location_id"],
             "status": "initiated",
-            "initiated_at": datetime.now().isoformat()
+            "initiated_at": _now_iso()
         }
     
+    def _prepare_contact_lookup(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a lookup item has something to look up by"""
+        if "emails" in item:
+            if not item["emails"]:
+                raise ValueError("emails must be a non-empty list")
+            return item
+        if not any(key in item for key in ["contact_id", "email", "phone"]):
+            raise ValueError("Must provide contact_id, email, or phone")
+        return item
+    
     async def bulk_contact_lookup_item(self, item: Dict[str, Any], index: int) -> Dict[str, Any]:
-        """Process single contact lookup"""
+        """Process single contact lookup (item already prepared)"""
         # This would integrate with GoHighLevelClient in real implementation
         
-        if not any(key in item for key in ["contact_id", "email", "phone"]):
-            raise ValueError("Must provide contact_id, email, or phone")
+        # A page of emails is resolved by one search request instead of one per contact
+        if "emails" in item:
+            contacts = await self._lookup_contacts_by_email(item["emails"])
+            return {
+                "contacts": contacts,
+                "found": any(contact["found"] for contact in contacts),
+                "lookup_method": "emails"
+            }
+        
+        cache = self._lookup_cache
+        if cache is None:
+            return await self._lookup_contact(item)
         
+        # Duplicate identifiers in one batch share a single lookup
+        key = (item.get("contact_id"), item.get("email"), item.get("phone"))
+        pending = cache.get(key)
+        if pending is not None:
+            return dict(await asyncio.shield(pending))
+        
+        pending = asyncio.get_running_loop().create_future()
+        cache[key] = pending
+        try:
+            result = await self._lookup_contact(item)
+        except asyncio.CancelledError:
+            # Usually our own item timeout; duplicates fail as timeouts of their own
+            # rather than being cancelled out of the batch
+            cache.pop(key, None)
+            pending.set_exception(asyncio.TimeoutError())
+            pending.exception()  # mark retrieved when no duplicate is waiting
+            raise
+        except Exception as e:
+            cache.pop(key, None)
+            pending.set_exception(e)
+            pending.exception()  # mark retrieved when no duplicate is waiting
+            raise
+        pending.set_result(result)
+        return result
+    
+    async def _lookup_contact(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Look up a single contact"""
         # Simulate API call delay
         await asyncio.sleep(0.3)
         
@@ -268,82 +639,104 @@ class BatchProcessor(Component):
             "lookup_method": "email" if "email" in item else "phone" if "phone" in item else "id"
         }
     
+    async def _lookup_contacts_by_email(self, emails: List[str]) -> List[Dict[str, Any]]:
+        """Look up several contacts by email in a single search request"""
+        # Simulated successful response, one record per requested email
+        return [
+            {
+                "contact_id": f"contact_{uuid.uuid4().hex[:8]}",
+                "email": email,
+                "first_name": "John",
+                "last_name": "Doe",
+                "found": True,
+                "lookup_method": "email"
+            }
+            for email in dict.fromkeys(emails)
+        ]
+    
+    @staticmethod
+    def _iter_batch_items(batch_data: Any) -> Iterable[Any]:
+        """Return batch_data as items: sequences as-is, (async) iterators lazily, anything else as one item"""
+        # Data/dict payloads are iterable too, so only explicit iterators are streamed
+        if isinstance(batch_data, (list, tuple, Iterator, AsyncIterator)):
+            return batch_data
+        return [batch_data]
+    
     async def process_batch(self) -> Data:
         """Main batch processing method"""
+        self._start_hook_drain()
+        try:
+            return await self._process_batch()
+        finally:
+            # progress_hooks is complete by the time the caller sees the result
+            await self._stop_hook_drain()
+    
+    async def _process_batch(self) -> Data:
+        """Run the batch and build its result"""
         try:
             # Validate inputs
             if not self.batch_data:
                 return Data(data={"error": "No batch data provided"})
             
-            batch_items = self.batch_data if isinstance(self.batch_data, list) else [self.batch_data]
-            total_items = len(batch_items)
+            batch_items = self._iter_batch_items(self.batch_data)
+            total_items = len(batch_items) if isinstance(batch_items, Sized) else None
             
+            self._resolve_defaults()
+            self._hook_base["batch_operation"] = self.batch_operation
+            self._started_at = _now_iso()
             self.emit_progress_hook("batch_start", {
                 "total_items": total_items,
                 "batch_size": self.batch_size,
                 "operation": self.batch_operation,
-                "estimated_chunks": (total_items + self.batch_size - 1) // self.batch_size
+                "estimated_chunks": (
+                    (total_items + self.batch_size - 1) // self.batch_size
+                    if total_items is not None else None
+                )
             })
             
             # Select processing function
+            # Operation -> (sync preparation, async processing)
             process_functions = {
-                "bulk_create_assistants": self.bulk_create_assistants_item,
-                "bulk_ai_calls": self.bulk_ai_calls_item,
-                "bulk_contact_lookup": self.bulk_contact_lookup_item,
+                "bulk_create_assistants": (self._prepare_create_assistant, self.bulk_create_assistants_item),
+                "bulk_ai_calls": (self._prepare_ai_call, self.bulk_ai_calls_item),
+                "bulk_contact_lookup": (self._prepare_contact_lookup, self.bulk_contact_lookup_item),
                 # Add other functions as needed
             }
             
-            process_func = process_functions.get(self.batch_operation)
-            if not process_func:
+            if self.batch_operation not in process_functions:
                 return Data(data={"error": f"Unknown batch operation: {self.batch_operation}"})
+            prepare, process_func = process_functions[self.batch_operation]
             
-            # Process in chunks
-            all_results = []
+            if self.batch_operation == "bulk_contact_lookup":
+                self._lookup_cache = {}
+            try:
+                all_results = await self.run_pipeline(process_func, batch_items, prepare)
+            finally:
+                self._lookup_cache = None
             
-            for i in range(0, total_items, self.batch_size):
-                chunk = batch_items[i:i + self.batch_size]
-                
-                self.emit_progress_hook("chunk_progress", {
-                    "chunk_index": i // self.batch_size,
-                    "processed_items": i,
-                    "total_items": total_items,
-                    "progress_percentage": (i / total_items) * 100
-                })
-                
-                # Process chunk
-                chunk_results = await self.process_batch_chunk(process_func, chunk, i)
-                all_results.extend(chunk_results)
-                
-                # Check for errors
-                chunk_errors = [r for r in chunk_results if not r["success"]]
-                if chunk_errors and self.stop_on_error:
-                    self.emit_progress_hook("batch_stopped", {
-                        "reason": "stop_on_error",
-                        "processed_items": len(all_results),
-                        "errors": len(chunk_errors)
-                    })
-                    break
-                
-                # Delay between chunks (except for last chunk)
-                if i + self.batch_size < total_items and self.delay_between_batches > 0:
-                    await asyncio.sleep(self.delay_between_batches)
-            
-            # Compile results
-            self.batch_results = all_results
-            self.batch_errors = [r for r in all_results if not r["success"]]
+            # Compile results and count outcomes in one pass
+            successful = 0
+            errors = []
+            for r in all_results:
+                if r.success:
+                    successful += 1
+                else:
+                    errors.append(r)
+            # Records stay compact tuples while the batch runs; convert once for output
+            self.batch_results = [r._asdict() for r in all_results]
+            self.batch_errors = [r._asdict() for r in errors]
             
             # Generate summary
-            successful_results = [r for r in all_results if r["success"]]
             self.batch_summary = {
-                "total_items": total_items,
+                "total_items": total_items if total_items is not None else len(all_results),
                 "processed_items": len(all_results),
-                "successful": len(successful_results),
-                "failed": len(self.batch_errors),
-                "success_rate": len(successful_results) / len(all_results) if all_results else 0,
+                "successful": successful,
+                "failed": len(errors),
+                "success_rate": successful / len(all_results) if all_results else 0,
                 "operation": self.batch_operation,
                 "session_id": self.session_id,
-                "started_at": self.progress_hooks[0]["timestamp"] if self.progress_hooks else None,
-                "completed_at": datetime.now().isoformat()
+                "started_at": self._started_at,
+                "completed_at": _now_iso()
             }
             
             self.emit_progress_hook("batch_complete", self.batch_summary)
@@ -359,7 +752,7 @@ class BatchProcessor(Component):
                 "error": str(e),
                 "operation": self.batch_operation,
                 "session_id": self.session_id,
-                "failed_at": datetime.now().isoformat()
+                "failed_at": _now_iso()
             }
             
             self.emit_progress_hook("batch_error", error_summary)
@@ -369,7 +762,7 @@ class BatchProcessor(Component):
     def get_progress(self) -> Data:
         """Get batch processing progress"""
         return Data(data={
-            "progress_hooks": self.progress_hooks,
+            "progress_hooks": list(self.progress_hooks),
             "session_id": self.session_id
         })
     
@@ -1,13 +1,40 @@
 import httpx
 import asyncio
-from typing import Dict, Any, Optional, List
+import os
+import random
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+import time
 import uuid
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C extension
+    orjson = None
+
+try:
+    import h2  # noqa: F401  - enables httpx HTTP/2 support
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+
 from langflow.custom import Component
 from langflow.io import DropdownInput, MessageTextInput, Output, BoolInput, IntInput
 from langflow.schema import Data
 
+# Last formatted second, shared by all hook timestamps in this module
+_iso_second_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, formatting the date part once per second"""
+    seconds, remainder_ns = divmod(time.time_ns(), 1_000_000_000)
+    if seconds != _iso_second_cache[0]:
+        _iso_second_cache[0] = seconds
+        _iso_second_cache[1] = datetime.fromtimestamp(seconds).isoformat()
+    return f"{_iso_second_cache[1]}.{remainder_ns // 1000:06d}"
+
+
 class GoHighLevelClient(Component):
     display_name = "GoHighLevel Client"
     description = "Direct integration with GoHighLevel v2 API for CRM operations"
@@ -105,6 +132,12 @@ class GoHighLevelClient(Component):
             display_name="Request Timeout",
             value=30,
             info="API request timeout in seconds"
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            value=3,
+            info="Retries for rate-limited (429), 5xx and connection-failed requests"
         )
     ]
     
@@ -113,26 +146,92 @@ class GoHighLevelClient(Component):
         Output(display_name="Hooks", name="hooks", method="get_hooks")
     ]
     
+    # Fields shared by every hook this component emits
+    _HOOK_BASE = {
+        "component": "ghl_client",
+        "status": "active"
+    }
+    
+    # Headers shared by every GHL request; Authorization is added per pooled client
+    _STATIC_HEADERS = {
+        "Content-Type": "application/json",
+        "Version": "2021-07-28",
+        "User-Agent": "Skyward-Langflow-Bundle/1.0.0"
+    }
+    
+    # Error messages for status codes with a specific meaning; other >= 400 codes are reported generically
+    _STATUS_ERRORS = {
+        401: "Unauthorized - Check API token or location access",
+        403: "Forbidden - Insufficient permissions",
+        429: "Rate limited - Please try again later"
+    }
+    
+    # Backoff bounds for retried requests, in seconds
+    _RETRY_BASE = 0.5
+    _RETRY_CAP = 30.0
+    
+    # Methods safe to resend after a 5xx; a POST may already have been applied by the server
+    _IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.hooks = []
         self.base_url = "https://services.leadconnectorhq.com"
         self._location_tokens = {}
         
+        # Pooled HTTP clients, one per location (None for the main API key), each tagged with
+        # the token, loop and settings it was built for
+        self._clients: Dict[Optional[str], Tuple[Tuple[Any, ...], httpx.AsyncClient]] = {}
+        
     def emit_hook(self, hook_type: str, data: Dict[str, Any]):
         """Emit runtime hook for progress tracking"""
         if self.emit_hooks:
-            hook = {
-                "hook_type": hook_type,
-                "timestamp": datetime.now().isoformat(),
-                "component": "ghl_client",
-                "data": data,
-                "status": "active"
-            }
+            hook = {**self._HOOK_BASE, "hook_type": hook_type, "timestamp": _now_iso(), "data": data}
             self.hooks.append(hook)
             return hook
         return None
     
+    def _get_client(self, token: str, slot: Optional[str] = None) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for a location slot, creating it on first use
+        
+        The client is rebuilt when the slot's token, the running loop, base_url or timeout
+        changes; a superseded client on the same loop is closed in the background.
+        """
+        loop = asyncio.get_running_loop()
+        key = (token, loop, self.base_url, self.timeout)
+        entry = self._clients.get(slot)
+        if entry is not None:
+            old_key, client = entry
+            if not client.is_closed:
+                if old_key == key:
+                    return client
+                if old_key[1] is loop:
+                    asyncio.ensure_future(client.aclose())
+        client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=_HTTP2_AVAILABLE,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            headers={**self._STATIC_HEADERS, "Authorization": f"Bearer {token}"}
+        )
+        self._clients[slot] = (key, client)
+        return client
+    
+    async def aclose(self) -> None:
+        """Close every pooled HTTP client"""
+        clients, self._clients = self._clients, {}
+        for _, client in clients.values():
+            await client.aclose()
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt: Retry-After if usable, else capped exponential backoff with jitter"""
+        if retry_after is not None:
+            try:
+                return min(self._RETRY_CAP, max(0.0, float(retry_after)))
+            except (TypeError, ValueError):
+                pass
+        return min(self._RETRY_CAP, self._RETRY_BASE * 2 ** attempt) + random.uniform(0, 0.25)
+    
     async def _make_request(
         self,
         method: str,
@@ -144,49 +243,71 @@ class GoHighLevelClient(Component):
         """Make HTTP request to GoHighLevel API"""
         
         # Get API key from input or environment
-        import os
         api_key = self.api_key or os.getenv("GHL_API_KEY")
         if not api_key:
             return {"error": "API key is required. Set GHL_API_KEY environment variable or provide key input."}
         
-        url = f"{self.base_url}{endpoint}"
-        
         # Use location-specific token if available, otherwise use main API key
-        headers = {
-            "Content-Type": "application/json",
-            "Version": "2021-07-28",
-            "User-Agent": "Skyward-Langflow-Bundle/1.0.0"
-        }
-        
         if location_id and location_id in self._location_tokens:
-            headers["Authorization"] = f"Bearer {self._location_tokens[location_id]}"
+            token = self._location_tokens[location_id]
+            slot = location_id
         else:
-            headers["Authorization"] = f"Bearer {api_key}"
+            token = api_key
+            slot = None
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data if data else None,
-                    params=params if params else None
-                )
-                
-                if response.status_code == 401:
-                    return {"error": "Unauthorized - Check API token or location access"}
-                elif response.status_code == 403:
-                    return {"error": "Forbidden - Insufficient permissions"}
-                elif response.status_code == 429:
-                    return {"error": "Rate limited - Please try again later"}
-                elif response.status_code >= 400:
-                    return {"error": f"GHL API Error {response.status_code}: {response.text}"}
+            body = {}
+            if data:
+                # orjson emits bytes directly; Content-Type is set on the pooled client
+                if orjson is not None:
+                    body["content"] = orjson.dumps(data)
+                else:
+                    body["json"] = data
+            
+            client = self._get_client(token, slot)
+            max_retries = max(0, self.max_retries or 0)
+            retry_server_errors = method.upper() in self._IDEMPOTENT_METHODS
+            for attempt in range(max_retries + 1):
+                try:
+                    response = await client.request(
+                        method=method,
+                        url=endpoint,
+                        params=params if params else None,
+                        **body
+                    )
+                except httpx.ConnectError:
+                    # The connection was never established, so the request did not reach the server
+                    if attempt == max_retries:
+                        raise
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
                 
+                # Rate limits are retried for every method and server errors only for idempotent
+                # ones, honoring Retry-After when sent
+                status_code = response.status_code
+                if attempt < max_retries and (
+                    status_code == 429 or (status_code >= 500 and retry_server_errors)
+                ):
+                    await asyncio.sleep(self._retry_delay(attempt, response.headers.get("Retry-After")))
+                    continue
+                break
+            
+            if status_code >= 400:
+                message = self._STATUS_ERRORS.get(status_code) or f"GHL API Error {status_code}: {response.text}"
+                return {"error": message, "status": status_code}
+            
+            if orjson is not None:
+                # Parse the raw body directly instead of going through httpx's stdlib decoder
                 try:
-                    return response.json()
-                except Exception:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     return {"success": True, "response": response.text}
-                    
+            
+            try:
+                return response.json()
+            except Exception:
+                return {"success": True, "response": response.text}
+                
         except httpx.TimeoutException:
             return {"error": "Request timeout"}
         except Exception as e:
@@ -195,7 +316,6 @@ class GoHighLevelClient(Component):
     async def get_contact(self) -> Dict[str, Any]:
         """Get contact information by ID"""
         # Get location ID
-        import os
         location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
         
         if not self.contact_id:
@@ -226,7 +346,6 @@ class GoHighLevelClient(Component):
     
     async def get_contact_by_email(self) -> Dict[str, Any]:
         """Get contact by email address"""
-        import os
         location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
         
         if not self.email:
@@ -257,7 +376,6 @@ class GoHighLevelClient(Component):
     
     async def get_contact_by_phone(self) -> Dict[str, Any]:
         """Get contact by phone number"""
-        import os
         location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
         
         if not self.phone:
@@ -273,7 +391,6 @@ class GoHighLevelClient(Component):
     
     async def create_contact(self) -> Dict[str, Any]:
         """Create a new contact"""
-        import os
         location_id = self.location_id or os.getenv("DEFAULT_LOCATION_ID")
         
         if not (self.email or self.phone):
@@ -325,7 +442,6 @@ class GoHighLevelClient(Component):
         })
         
         # Store location context
-        import os
         os.environ["CURRENT_LOCATION_ID"] = self.location_id
         
         self.emit_hook("end_run", {
@@ -1,14 +1,283 @@
 import json
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Iterable, List, Optional, Callable
 from datetime import datetime, timedelta
 import uuid
 import asyncio
-from collections import deque
+import itertools
+import logging
+import os
+import time
+import weakref
+from collections import Counter, OrderedDict, deque
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C extension
+    orjson = None
 
 from langflow.custom import Component
 from langflow.io import MessageTextInput, DropdownInput, Output, BoolInput, IntInput, DataInput
 from langflow.schema import Data
 
+logger = logging.getLogger("skyward_bundle.runtime_hooks")
+
+# Hook ids only need to be unique within this process: a per-process prefix
+# plus a counter is much cheaper than uuid4 on every emit
+_HOOK_ID_PREFIX = f"{os.getpid():x}-{time.time_ns():x}-"
+_hook_ids = itertools.count()
+
+
+def _next_hook_id() -> str:
+    return f"{_HOOK_ID_PREFIX}{next(_hook_ids):x}"
+
+
+def _encode_payload(payload: Any) -> bytes:
+    """Encode a response payload to JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=str).encode()
+
+
+def _hook_epoch(hook: Dict[str, Any]) -> float:
+    """Epoch seconds for a hook, parsing the ISO timestamp only for hooks emitted elsewhere"""
+    ts = hook.get("_ts")
+    if ts is None:
+        timestamp = hook["timestamp"]
+        if timestamp.endswith("Z"):
+            timestamp = timestamp[:-1] + "+00:00"
+        ts = datetime.fromisoformat(timestamp).timestamp()
+    return ts
+
+
+def _cancel_task(task: "asyncio.Future") -> None:
+    """Cancel task from any thread, unless it is finished or its loop is closed"""
+    if task.done():
+        return
+    loop = task.get_loop()
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(task.cancel)
+
+
+def _decrement(counter: Counter, key: Any):
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+
+def _unindex(index: Dict[str, deque], key: str, oldest: bool):
+    bucket = index[key]
+    if oldest:
+        bucket.popleft()
+    else:
+        bucket.pop()
+    if not bucket:
+        del index[key]
+
+
+def _new_session_state(session_id: str, hook: Dict[str, Any]) -> Dict[str, Any]:
+    ts = _hook_epoch(hook)
+    return {
+        "session_id": session_id,
+        "start_time": hook["timestamp"],
+        "end_time": hook["timestamp"],
+        "start_ts": ts,
+        "end_ts": ts,
+        "status": "active",
+        "operations": {},  # insertion-ordered set
+        "errors": []
+    }
+
+
+def _track_operation(state: Dict[str, Any], hook: Dict[str, Any]):
+    state["operations"][hook.get("data", {}).get("action", "unknown")] = None
+
+
+def _track_error(state: Dict[str, Any], hook: Dict[str, Any]):
+    state["errors"].append(hook["data"])
+    state["status"] = "error"
+
+
+def _track_end_run(state: Dict[str, Any], hook: Dict[str, Any]):
+    if state["status"] != "error":
+        state["status"] = "completed"
+
+
+def _ignore_hook(state: Dict[str, Any], hook: Dict[str, Any]):
+    pass
+
+
+# Per hook type session bookkeeping; other hook types only update timing
+_SESSION_HANDLERS = {
+    "pre_task": _track_operation,
+    "error": _track_error,
+    "end_run": _track_end_run
+}
+
+
+def _fold_session(state: Dict[str, Any], hook: Dict[str, Any]):
+    """Fold one hook into a session's running state"""
+    # Compare epochs; the hook's own ISO string is kept for display
+    ts = _hook_epoch(hook)
+    if ts < state["start_ts"]:
+        state["start_ts"] = ts
+        state["start_time"] = hook["timestamp"]
+    elif ts > state["end_ts"]:
+        state["end_ts"] = ts
+        state["end_time"] = hook["timestamp"]
+    
+    # Track operations and errors
+    _SESSION_HANDLERS.get(hook["hook_type"], _ignore_hook)(state, hook)
+
+
+def _session_view(state: Dict[str, Any], hooks: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Output shape of an aggregated session"""
+    return {
+        "session_id": state["session_id"],
+        "hooks": list(hooks),
+        "start_time": state["start_time"],
+        "end_time": state["end_time"],
+        "status": state["status"],
+        "operations": list(state["operations"]),
+        "errors": list(state["errors"])
+    }
+
+
+class _HookStore(deque):
+    """Bounded hook deque that keeps summary counters, filter indexes and session state in step with its contents"""
+    
+    def __init__(self, hooks=(), maxlen: Optional[int] = None):
+        super().__init__(maxlen=maxlen)
+        self.by_type = Counter()
+        self.by_component = Counter()
+        self.by_status = Counter()
+        self.latest_timestamp = None
+        self.type_index: Dict[str, deque] = {}
+        self.component_index: Dict[str, deque] = {}
+        self.session_index: Dict[str, deque] = {}
+        # Aggregated state per session, folded forward on append and rebuilt
+        # from session_index only after one of its hooks has left the store
+        self.session_state: Dict[str, Dict[str, Any]] = {}
+        self.extend(hooks)
+    
+    def _count(self, hook: Dict[str, Any]):
+        hook_type = hook.get("hook_type", "unknown")
+        component = hook.get("component", "unknown")
+        self.type_index.setdefault(hook_type, deque()).append(hook)
+        self.component_index.setdefault(component, deque()).append(hook)
+        self.by_type[hook_type] += 1
+        self.by_component[component] += 1
+        self.by_status[hook.get("status", "unknown")] += 1
+        session_id = hook.get("session_id", "default")
+        self.session_index.setdefault(session_id, deque()).append(hook)
+        state = self.session_state.get(session_id)
+        if state is not None:
+            _fold_session(state, hook)
+        timestamp = hook.get("timestamp")
+        if timestamp is not None and (self.latest_timestamp is None or timestamp > self.latest_timestamp):
+            self.latest_timestamp = timestamp
+    
+    def _discount(self, hook: Dict[str, Any], oldest: bool):
+        hook_type = hook.get("hook_type", "unknown")
+        component = hook.get("component", "unknown")
+        _unindex(self.type_index, hook_type, oldest)
+        _unindex(self.component_index, component, oldest)
+        _decrement(self.by_type, hook_type)
+        _decrement(self.by_component, component)
+        _decrement(self.by_status, hook.get("status", "unknown"))
+        session_id = hook.get("session_id", "default")
+        _unindex(self.session_index, session_id, oldest)
+        self.session_state.pop(session_id, None)
+        if not self:
+            self.latest_timestamp = None
+    
+    def append(self, hook: Dict[str, Any]):
+        if self.maxlen is not None and len(self) == self.maxlen:
+            self.popleft()
+        super().append(hook)
+        self._count(hook)
+    
+    def extend(self, hooks):
+        for hook in hooks:
+            self.append(hook)
+    
+    def popleft(self) -> Dict[str, Any]:
+        hook = super().popleft()
+        self._discount(hook, oldest=True)
+        return hook
+    
+    def pop(self) -> Dict[str, Any]:
+        hook = super().pop()
+        self._discount(hook, oldest=False)
+        return hook
+    
+    def clear(self):
+        super().clear()
+        for counter in (self.by_type, self.by_component, self.by_status):
+            counter.clear()
+        self.type_index.clear()
+        self.component_index.clear()
+        self.session_index.clear()
+        self.session_state.clear()
+        self.latest_timestamp = None
+    
+    def expire(self, cutoff: float) -> int:
+        """Drop hooks from the old end until the oldest one is newer than cutoff"""
+        expired = 0
+        while self and _hook_epoch(self[0]) <= cutoff:
+            self.popleft()
+            expired += 1
+        return expired
+    
+    def select(self, hook_type: str = "", component: str = "") -> List[Dict[str, Any]]:
+        """Hooks matching the given type and/or component, read from the smaller index"""
+        if hook_type and component:
+            by_type = self.type_index.get(hook_type, ())
+            by_component = self.component_index.get(component, ())
+            if len(by_type) <= len(by_component):
+                return [h for h in by_type if h.get("component", "unknown") == component]
+            return [h for h in by_component if h.get("hook_type", "unknown") == hook_type]
+        if hook_type:
+            return list(self.type_index.get(hook_type, ()))
+        if component:
+            return list(self.component_index.get(component, ()))
+        return list(self)
+    
+    def summary(self) -> Dict[str, Any]:
+        """Snapshot of the running counters, shaped like RuntimeHooks.get_hook_summary"""
+        if not self:
+            return {
+                "total_hooks": 0,
+                "by_type": {},
+                "by_component": {},
+                "by_status": {},
+                "latest_timestamp": None,
+                "sessions": 0
+            }
+        
+        return {
+            "total_hooks": len(self),
+            "by_type": dict(self.by_type),
+            "by_component": dict(self.by_component),
+            "by_status": dict(self.by_status),
+            "latest_timestamp": self.latest_timestamp,
+            "sessions": len(self.session_index),
+            "session_list": list(self.session_index)
+        }
+    
+    def sessions(self) -> Dict[str, Any]:
+        """Aggregated sessions, shaped like RuntimeHooks.aggregate_hooks_by_session"""
+        session_data = {}
+        for session_id, hooks in self.session_index.items():
+            state = self.session_state.get(session_id)
+            if state is None:
+                state = _new_session_state(session_id, hooks[0])
+                for hook in hooks:
+                    _fold_session(state, hook)
+                self.session_state[session_id] = state
+            session_data[session_id] = _session_view(state, hooks)
+        return session_data
+
+
 class RuntimeHooks(Component):
     display_name = "Runtime Hooks"
     description = "Progress notification and monitoring system for agent operations"
@@ -77,94 +346,262 @@ class RuntimeHooks(Component):
         Output(display_name="Real-time Feed", name="realtime", method="get_realtime_feed")
     ]
     
+    # Seconds between background retention sweeps
+    _CLEANUP_INTERVAL = 600
+    # Most sessions tracked in session_hooks; the least recently used is evicted
+    _MAX_SESSIONS = 256
+    # Set to True where consumers require RFC 4122 hook ids
+    uuid_hook_ids = False
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.hook_storage = deque(maxlen=self.max_hooks if hasattr(self, 'max_hooks') else 100)
+        self._bind_settings()
+        self.hook_storage = _HookStore(maxlen=self._max_hooks)
         self.hook_listeners = []
-        self.session_hooks = {}
+        self._batch_listeners = []
+        self._listener_queues: List[asyncio.Queue] = []
+        self.session_hooks: "OrderedDict[str, deque]" = OrderedDict()
         self.last_cleanup = datetime.now()
+        self._last_cleanup_iso = self.last_cleanup.isoformat()
+        self._cleanup_task: Optional[asyncio.Task] = None
+        # Last process_hooks payload and its lazily encoded JSON form
+        self._last_result = None
+        self._response_bytes = None
+    
+    def _bind_settings(self):
+        """Copy input values into plain attributes read on the hot paths"""
+        previous = self.__dict__.get("_max_hooks")
+        self._max_hooks = int(getattr(self, "max_hooks", None) or 100)
+        self._session_maxlen = max(16, self._max_hooks // 32)
+        if previous is not None and previous != self._max_hooks:
+            self._resize_storage()
+        self._retention_minutes = int(getattr(self, "retention_minutes", 60))
+        self._retention_seconds = self._retention_minutes * 60.0
+        self._real_time = bool(getattr(self, "real_time_updates", True))
+        self._auto_cleanup = bool(getattr(self, "auto_cleanup", True))
+        # Static part of get_status; only the live counts are filled in per call
+        self._status_template = {
+            "total_hooks_stored": 0,
+            "active_sessions": 0,
+            "last_cleanup": None,
+            "retention_minutes": self._retention_minutes,
+            "max_hooks": self._max_hooks,
+            "real_time_enabled": self._real_time,
+            "listeners_count": 0
+        }
         
-    def add_hook_listener(self, callback: Callable[[Dict[str, Any]], None]):
-        """Add a callback function to listen for new hooks"""
-        self.hook_listeners.append(callback)
+    def _resize_storage(self):
+        """Apply a changed max_hooks to the stores, keeping the newest hooks"""
+        limit = self._max_hooks
+        self.hook_storage = _HookStore(list(self.hook_storage)[-limit:], maxlen=limit)
+        for session_id, hooks in self.session_hooks.items():
+            self.session_hooks[session_id] = deque(hooks, maxlen=self._session_maxlen)
     
-    def emit_hook(self, hook_type: str, component: str, data: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
-        """Emit a new runtime hook"""
+    @staticmethod
+    async def _cleanup_loop(ref: "weakref.ref[RuntimeHooks]"):
+        """Run retention cleanup on a fixed interval, off the request path
+        
+        Holds the component only through ref, so a discarded instance can be collected;
+        the loop ends once it is gone.
+        """
+        while True:
+            hooks = ref()
+            if hooks is None:
+                return
+            interval = hooks._CLEANUP_INTERVAL
+            del hooks
+            await asyncio.sleep(interval)
+            hooks = ref()
+            if hooks is None:
+                return
+            hooks.cleanup_old_hooks()
+            del hooks
+    
+    def _ensure_cleanup_task(self):
+        """Start the background cleanup task on the running loop if it is not already there"""
+        task = self._cleanup_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+        task = self._cleanup_task = asyncio.ensure_future(self._cleanup_loop(weakref.ref(self)))
+        # Stop the sleeping task as soon as the component is collected
+        weakref.finalize(self, _cancel_task, task)
+    
+    async def aclose(self) -> None:
+        """Stop the background cleanup task"""
+        task, self._cleanup_task = self._cleanup_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    
+    def add_hook_listener(self, callback: Callable[[Any], None], batch: bool = False):
+        """Add a callback function to listen for new hooks; batch listeners get each emitted list at once"""
+        if batch:
+            self._batch_listeners.append(callback)
+        else:
+            self.hook_listeners.append(callback)
+    
+    def add_hook_queue(self, maxsize: int = 1000) -> asyncio.Queue:
+        """Subscribe to new hooks through a bounded queue the caller drains"""
+        queue = asyncio.Queue(maxsize=maxsize)
+        self._listener_queues.append(queue)
+        return queue
+    
+    @staticmethod
+    def _call_listener(listener: Callable[[Any], None], payload: Any):
+        try:
+            listener(payload)
+        except Exception as e:
+            logger.warning("Hook listener error: %s", e)
+    
+    @staticmethod
+    def _call_listener_each(listener: Callable[[Dict[str, Any]], None], hooks: List[Dict[str, Any]]):
+        try:
+            for hook in hooks:
+                listener(hook)
+        except Exception as e:
+            logger.warning("Hook listener error: %s", e)
+    
+    def _notify_listeners(self, hooks: List[Dict[str, Any]]):
+        """Hand new hooks to queue subscribers and callbacks without blocking the emitter"""
+        for queue in self._listener_queues:
+            for hook in hooks:
+                try:
+                    queue.put_nowait(hook)
+                except asyncio.QueueFull:
+                    logger.warning("Hook listener queue full, dropping hook %s", hook.get("id"))
         
-        hook = {
-            "id": str(uuid.uuid4()),
+        if self.hook_listeners or self._batch_listeners:
+            try:
+                schedule = asyncio.get_running_loop().call_soon
+            except RuntimeError:
+                schedule = None
+            calls = [(self._call_listener, listener, hooks) for listener in self._batch_listeners]
+            calls += [(self._call_listener_each, listener, hooks) for listener in self.hook_listeners]
+            for call, listener, payload in calls:
+                if schedule is None:
+                    call(listener, payload)
+                else:
+                    schedule(call, listener, payload)
+    
+    def _build_hook(self, hook_type: str, component: str, data: Dict[str, Any], session_id: Optional[str],
+                    timestamp: str, ts: float) -> Dict[str, Any]:
+        return {
+            "id": str(uuid.uuid4()) if self.uuid_hook_ids else _next_hook_id(),
             "hook_type": hook_type,
             "component": component,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
+            "_ts": ts,
             "data": data,
             "session_id": session_id or "default",
             "status": "active"
         }
+    
+    def _track_session(self, session_id: str, hook: Dict[str, Any]):
+        """Record a hook under its session, evicting the least recently used session when full"""
+        session = self.session_hooks.get(session_id)
+        if session is None:
+            if len(self.session_hooks) >= self._MAX_SESSIONS:
+                self.session_hooks.popitem(last=False)
+            session = self.session_hooks[session_id] = deque(maxlen=self._session_maxlen)
+        else:
+            self.session_hooks.move_to_end(session_id)
+        session.append(hook)
+    
+    def emit_hook(self, hook_type: str, component: str, data: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Emit a new runtime hook"""
+        
+        now = datetime.now()
+        hook = self._build_hook(hook_type, component, data, session_id, now.isoformat(), now.timestamp())
         
         # Store the hook
         self.hook_storage.append(hook)
         
         # Store by session
         if session_id:
-            if session_id not in self.session_hooks:
-                self.session_hooks[session_id] = []
-            self.session_hooks[session_id].append(hook)
+            self._track_session(session_id, hook)
         
         # Notify listeners
-        if self.real_time_updates:
-            for listener in self.hook_listeners:
-                try:
-                    listener(hook)
-                except Exception as e:
-                    print(f"Hook listener error: {e}")
+        if self._real_time:
+            self._notify_listeners([hook])
         
         return hook
     
-    def filter_hooks(self, hooks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter hooks based on criteria"""
+    def emit_hooks(self, batch: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Emit several hooks at once, sharing one timestamp and one listener notification"""
         
-        filtered = hooks
+        now = datetime.now()
+        timestamp, ts = now.isoformat(), now.timestamp()
+        hooks = []
+        for item in batch:
+            session_id = item.get("session_id")
+            hook = self._build_hook(
+                item.get("hook_type", "custom"),
+                item.get("component", "runtime_hooks"),
+                item.get("data", {}),
+                session_id,
+                timestamp,
+                ts
+            )
+            if session_id:
+                self._track_session(session_id, hook)
+            hooks.append(hook)
         
-        # Filter by hook type
-        if self.filter_type:
-            filtered = [h for h in filtered if h.get("hook_type") == self.filter_type]
+        self.hook_storage.extend(hooks)
         
-        # Filter by component
-        if self.component_filter:
-            filtered = [h for h in filtered if h.get("component") == self.component_filter]
+        if hooks and self._real_time:
+            self._notify_listeners(hooks)
         
-        return filtered
+        return hooks
+    
+    def filter_hooks(self, hooks: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Filter hooks based on criteria"""
+        
+        if hooks is self.hook_storage:
+            return self.hook_storage.select(self.filter_type, self.component_filter)
+        
+        filter_type = self.filter_type
+        component_filter = self.component_filter
+        if not filter_type and not component_filter:
+            return hooks if isinstance(hooks, list) else list(hooks)
+        
+        # Filter by hook type and component in one pass
+        return [
+            h for h in hooks
+            if (not filter_type or h.get("hook_type") == filter_type)
+            and (not component_filter or h.get("component") == component_filter)
+        ]
     
     def cleanup_old_hooks(self):
         """Remove hooks older than retention period"""
-        if not self.auto_cleanup:
+        if not self._auto_cleanup:
             return
             
         now = datetime.now()
-        cutoff = now - timedelta(minutes=self.retention_minutes)
+        cutoff = now.timestamp() - self._retention_seconds
         
-        # Clean main storage
-        self.hook_storage = deque([
-            hook for hook in self.hook_storage 
-            if datetime.fromisoformat(hook["timestamp"]) > cutoff
-        ], maxlen=self.max_hooks)
+        # Clean main storage; hooks are stored in emit order, so the expired
+        # ones are all at the left end and the rest is never touched
+        self.hook_storage.expire(cutoff)
         
-        # Clean session hooks
-        for session_id in list(self.session_hooks.keys()):
-            self.session_hooks[session_id] = [
-                hook for hook in self.session_hooks[session_id]
-                if datetime.fromisoformat(hook["timestamp"]) > cutoff
-            ]
+        # Clean session hooks; each session deque is chronological too, so
+        # only its expired prefix is popped
+        for session_id, hooks in list(self.session_hooks.items()):
+            while hooks and _hook_epoch(hooks[0]) <= cutoff:
+                hooks.popleft()
             
             # Remove empty sessions
-            if not self.session_hooks[session_id]:
+            if not hooks:
                 del self.session_hooks[session_id]
         
         self.last_cleanup = now
+        self._last_cleanup_iso = now.isoformat()
     
     def get_hook_summary(self, hooks: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate summary statistics for hooks"""
         
+        if hooks is self.hook_storage:
+            return self.hook_storage.summary()
+        
         if not hooks:
             return {
                 "total_hooks": 0,
@@ -175,35 +612,26 @@ class RuntimeHooks(Component):
                 "sessions": 0
             }
         
-        # Count by type
-        by_type = {}
-        for hook in hooks:
-            hook_type = hook.get("hook_type", "unknown")
-            by_type[hook_type] = by_type.get(hook_type, 0) + 1
-        
-        # Count by component
-        by_component = {}
+        # Count by type, component and status in a single pass
+        by_type = Counter()
+        by_component = Counter()
+        by_status = Counter()
+        sessions = set()
+        latest_timestamp = None
         for hook in hooks:
-            component = hook.get("component", "unknown")
-            by_component[component] = by_component.get(component, 0) + 1
-        
-        # Count by status
-        by_status = {}
-        for hook in hooks:
-            status = hook.get("status", "unknown")
-            by_status[status] = by_status.get(status, 0) + 1
-        
-        # Get unique sessions
-        sessions = set(hook.get("session_id", "default") for hook in hooks)
-        
-        # Latest timestamp
-        latest_timestamp = max(hook["timestamp"] for hook in hooks) if hooks else None
+            by_type[hook.get("hook_type", "unknown")] += 1
+            by_component[hook.get("component", "unknown")] += 1
+            by_status[hook.get("status", "unknown")] += 1
+            sessions.add(hook.get("session_id", "default"))
+            timestamp = hook.get("timestamp")
+            if timestamp is not None and (latest_timestamp is None or timestamp > latest_timestamp):
+                latest_timestamp = timestamp
         
         return {
             "total_hooks": len(hooks),
-            "by_type": by_type,
-            "by_component": by_component,
-            "by_status": by_status,
+            "by_type": dict(by_type),
+            "by_component": dict(by_component),
+            "by_status": dict(by_status),
             "latest_timestamp": latest_timestamp,
             "sessions": len(sessions),
             "session_list": list(sessions)
@@ -212,63 +640,49 @@ class RuntimeHooks(Component):
     def aggregate_hooks_by_session(self, hooks: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Aggregate hooks by session for workflow tracking"""
         
-        session_data = {}
+        if hooks is self.hook_storage:
+            return self.hook_storage.sessions()
+        
+        states = {}
+        session_hooks = {}
         
         for hook in hooks:
             session_id = hook.get("session_id", "default")
             
-            if session_id not in session_data:
-                session_data[session_id] = {
-                    "session_id": session_id,
-                    "hooks": [],
-                    "start_time": hook["timestamp"],
-                    "end_time": hook["timestamp"],
-                    "status": "active",
-                    "operations": [],
-                    "errors": []
-                }
-            
-            session_info = session_data[session_id]
-            session_info["hooks"].append(hook)
+            state = states.get(session_id)
+            if state is None:
+                state = states[session_id] = _new_session_state(session_id, hook)
+                session_hooks[session_id] = []
             
-            # Update timing
-            if hook["timestamp"] < session_info["start_time"]:
-                session_info["start_time"] = hook["timestamp"]
-            if hook["timestamp"] > session_info["end_time"]:
-                session_info["end_time"] = hook["timestamp"]
-            
-            # Track operations and errors
-            if hook["hook_type"] == "pre_task":
-                operation = hook.get("data", {}).get("action", "unknown")
-                if operation not in session_info["operations"]:
-                    session_info["operations"].append(operation)
-            
-            if hook["hook_type"] == "error":
-                session_info["errors"].append(hook["data"])
-                session_info["status"] = "error"
-            elif hook["hook_type"] == "end_run" and session_info["status"] != "error":
-                session_info["status"] = "completed"
+            session_hooks[session_id].append(hook)
+            _fold_session(state, hook)
         
-        return session_data
+        return {
+            session_id: _session_view(state, session_hooks[session_id])
+            for session_id, state in states.items()
+        }
     
     def get_realtime_updates(self) -> List[Dict[str, Any]]:
         """Get recent hooks for real-time monitoring"""
         
         # Get hooks from last 5 minutes
-        cutoff = datetime.now() - timedelta(minutes=5)
+        cutoff = (datetime.now() - timedelta(minutes=5)).timestamp()
         recent_hooks = [
             hook for hook in self.hook_storage
-            if datetime.fromisoformat(hook["timestamp"]) > cutoff
+            if _hook_epoch(hook) > cutoff
         ]
         
-        return sorted(recent_hooks, key=lambda x: x["timestamp"], reverse=True)
+        return sorted(recent_hooks, key=_hook_epoch, reverse=True)
     
     async def process_hooks(self) -> Data:
         """Main hook processing method"""
         try:
-            # Cleanup old hooks periodically
-            if datetime.now() - self.last_cleanup > timedelta(minutes=10):
-                self.cleanup_old_hooks()
+            # Pick up input changes once per run rather than on every hook
+            self._bind_settings()
+            
+            # Old hooks are cleaned up periodically by a background task
+            if self._auto_cleanup:
+                self._ensure_cleanup_task()
             
             if self.hook_mode == "emit" and self.hook_input:
                 # Emit a new hook
@@ -279,51 +693,61 @@ class RuntimeHooks(Component):
                     data=hook_data.get("data", {}),
                     session_id=hook_data.get("session_id")
                 )
-                return Data(data={"emitted_hook": hook})
+                return self._respond({"emitted_hook": hook})
             
             elif self.hook_mode == "monitor":
                 # Return all hooks with filtering
-                all_hooks = list(self.hook_storage)
-                filtered_hooks = self.filter_hooks(all_hooks)
-                return Data(data={"hooks": filtered_hooks})
+                filtered_hooks = self.filter_hooks(self.hook_storage)
+                return self._respond({"hooks": filtered_hooks})
             
             elif self.hook_mode == "filter":
                 # Return filtered hooks
-                all_hooks = list(self.hook_storage)
-                filtered_hooks = self.filter_hooks(all_hooks)
-                return Data(data={"filtered_hooks": filtered_hooks})
+                filtered_hooks = self.filter_hooks(self.hook_storage)
+                return self._respond({"filtered_hooks": filtered_hooks})
             
             elif self.hook_mode == "aggregate":
-                # Return aggregated hook data
-                all_hooks = list(self.hook_storage)
-                filtered_hooks = self.filter_hooks(all_hooks)
+                # Return aggregated hook data, served from the store's session state when unfiltered
+                filtered_hooks = self.hook_storage
+                if self.filter_type or self.component_filter:
+                    filtered_hooks = self.filter_hooks(self.hook_storage)
                 aggregated = self.aggregate_hooks_by_session(filtered_hooks)
-                return Data(data={"aggregated_sessions": aggregated})
+                return self._respond({"aggregated_sessions": aggregated})
             
             else:
-                return Data(data={"error": f"Unknown hook mode: {self.hook_mode}"})
+                return self._respond({"error": f"Unknown hook mode: {self.hook_mode}"})
                 
         except Exception as e:
-            return Data(data={"error": f"Hook processing failed: {str(e)}"})
+            return self._respond({"error": f"Hook processing failed: {str(e)}"})
+    
+    def _respond(self, payload: Dict[str, Any]) -> Data:
+        """Wrap a process_hooks payload, remembering it for response_bytes"""
+        self._last_result = payload
+        self._response_bytes = None
+        return Data(data=payload)
+    
+    def response_bytes(self) -> Optional[bytes]:
+        """Return the last process_hooks payload as JSON bytes, encoded once and cached"""
+        if self._response_bytes is None and self._last_result is not None:
+            self._response_bytes = _encode_payload(self._last_result)
+        return self._response_bytes
     
     def get_summary(self) -> Data:
         """Get hook summary statistics"""
-        all_hooks = list(self.hook_storage)
-        filtered_hooks = self.filter_hooks(all_hooks)
+        if not self.filter_type and not self.component_filter:
+            # Unfiltered summaries come straight from the running counters
+            return Data(data=self.hook_storage.summary())
+        
+        filtered_hooks = self.filter_hooks(self.hook_storage)
         summary = self.get_hook_summary(filtered_hooks)
         return Data(data=summary)
     
     def get_status(self) -> Data:
         """Get current runtime status"""
-        status = {
-            "total_hooks_stored": len(self.hook_storage),
-            "active_sessions": len(self.session_hooks),
-            "last_cleanup": self.last_cleanup.isoformat(),
-            "retention_minutes": self.retention_minutes,
-            "max_hooks": self.max_hooks,
-            "real_time_enabled": self.real_time_updates,
-            "listeners_count": len(self.hook_listeners)
-        }
+        status = self._status_template.copy()
+        status["total_hooks_stored"] = len(self.hook_storage)
+        status["active_sessions"] = len(self.session_hooks)
+        status["last_cleanup"] = self._last_cleanup_iso
+        status["listeners_count"] = len(self.hook_listeners) + len(self._batch_listeners) + len(self._listener_queues)
         return Data(data=status)
     
     def get_realtime_feed(self) -> Data:
@@ -3,8 +3,13 @@ Environment-specific configuration handling
 """
 
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 from enum import Enum
+from types import MappingProxyType
+
+
+# Marks dot-paths that resolved to nothing, so misses are cached too
+_MISSING = object()
 
 
 class Environment(Enum):
@@ -14,205 +19,195 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
+def _freeze(config: Dict[str, Any]) -> Mapping[str, Any]:
+    """Read-only view of a nested config dict"""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
+
+
+_BASE_CONFIG: Dict[str, Any] = {
+    "api_timeouts": {
+        "assistable_ai": 30,
+        "gohighlevel": 30
+    },
+    "batch_processing": {
+        "default_size": 10,
+        "max_concurrent": 5,
+        "delay_between": 2
+    },
+    "security": {
+        "rate_limit_per_minute": 60,
+        "enable_audit_logging": True,
+        "enable_input_validation": True
+    },
+    "performance": {
+        "cache_ttl": 300,
+        "enable_caching": True,
+        "enable_metrics": True
+    },
+    "hooks": {
+        "max_hooks": 100,
+        "retention_minutes": 60,
+        "real_time_updates": True
+    }
+}
+
+# More relaxed settings for development
+_DEVELOPMENT_CONFIG = _freeze({**_BASE_CONFIG, **{
+    "debug": True,
+    "log_level": "DEBUG",
+    "api_timeouts": {
+        "assistable_ai": 60,  # Longer timeouts for debugging
+        "gohighlevel": 60
+    },
+    "batch_processing": {
+        "default_size": 3,  # Smaller batches for testing
+        "max_concurrent": 2,
+        "delay_between": 1
+    },
+    "security": {
+        "rate_limit_per_minute": 120,  # More permissive
+        "enable_audit_logging": False,  # Less logging
+        "enable_input_validation": True
+    },
+    "performance": {
+        "cache_ttl": 60,  # Shorter cache for development
+        "enable_caching": False,  # Disable for fresh data
+        "enable_metrics": True,
+        "enable_detailed_logging": True
+    },
+    "hooks": {
+        "max_hooks": 50,  # Smaller buffer
+        "retention_minutes": 30,
+        "real_time_updates": True
+    }
+}})
+
+# Production-like but with some debugging capabilities
+_STAGING_CONFIG = _freeze({**_BASE_CONFIG, **{
+    "debug": False,
+    "log_level": "INFO",
+    "api_timeouts": {
+        "assistable_ai": 45,
+        "gohighlevel": 45
+    },
+    "batch_processing": {
+        "default_size": 5,  # Moderate batch sizes
+        "max_concurrent": 3,
+        "delay_between": 3
+    },
+    "security": {
+        "rate_limit_per_minute": 80,
+        "enable_audit_logging": True,
+        "enable_input_validation": True
+    },
+    "performance": {
+        "cache_ttl": 180,
+        "enable_caching": True,
+        "enable_metrics": True,
+        "enable_detailed_logging": False
+    },
+    "hooks": {
+        "max_hooks": 75,
+        "retention_minutes": 45,
+        "real_time_updates": True
+    }
+}})
+
+# Optimized for performance and reliability
+_PRODUCTION_CONFIG = _freeze({**_BASE_CONFIG, **{
+    "debug": False,
+    "log_level": "INFO",
+    "api_timeouts": {
+        "assistable_ai": 30,
+        "gohighlevel": 30
+    },
+    "batch_processing": {
+        "default_size": 10,
+        "max_concurrent": 5,
+        "delay_between": 2
+    },
+    "security": {
+        "rate_limit_per_minute": 60,
+        "enable_audit_logging": True,
+        "enable_input_validation": True
+    },
+    "performance": {
+        "cache_ttl": 300,
+        "enable_caching": True,
+        "enable_metrics": True,
+        "enable_detailed_logging": False
+    },
+    "hooks": {
+        "max_hooks": 100,
+        "retention_minutes": 60,
+        "real_time_updates": True
+    }
+}})
+
+_ENVIRONMENT_CONFIGS = {
+    Environment.DEVELOPMENT: _DEVELOPMENT_CONFIG,
+    Environment.STAGING: _STAGING_CONFIG,
+    Environment.PRODUCTION: _PRODUCTION_CONFIG
+}
+
+
 class EnvironmentConfig:
     """Environment-specific configuration management"""
     
     def __init__(self):
         self.current_env = self._detect_environment()
         self.config = self._load_environment_config()
+        self._flat_cache: Dict[str, Any] = {}
     
     def _detect_environment(self) -> Environment:
         """Detect current environment from various sources"""
         
+        getenv = os.getenv
+        env_str = getenv("ENVIRONMENT", "").lower()
+        railway = getenv("RAILWAY_ENVIRONMENT")
+        vercel_env = getenv("VERCEL_ENV")
+        dyno = getenv("DYNO")
+        
         # Check explicit environment variable
-        env_str = os.getenv("ENVIRONMENT", "").lower()
         if env_str:
             try:
                 return Environment(env_str)
             except ValueError:
                 pass
         
-        # Check Railway environment
-        if os.getenv("RAILWAY_ENVIRONMENT"):
-            return Environment.PRODUCTION
-        
-        # Check other deployment indicators
-        if os.getenv("VERCEL_ENV") == "production":
+        # Deployment indicators, in priority order
+        if railway or vercel_env == "production":
             return Environment.PRODUCTION
-        elif os.getenv("VERCEL_ENV") in ["preview", "staging"]:
+        if vercel_env in ("preview", "staging"):
             return Environment.STAGING
-        
-        # Check Heroku
-        if os.getenv("DYNO"):
+        if dyno:
             return Environment.PRODUCTION
         
-        # Check for development indicators
-        if os.getenv("DEBUG", "").lower() == "true":
-            return Environment.DEVELOPMENT
-        
-        # Default to development
+        # DEBUG=true and everything else defaults to development
         return Environment.DEVELOPMENT
     
-    def _load_environment_config(self) -> Dict[str, Any]:
+    def _load_environment_config(self) -> Mapping[str, Any]:
         """Load environment-specific configuration"""
-        
-        base_config = {
-            "api_timeouts": {
-                "assistable_ai": 30,
-                "gohighlevel": 30
-            },
-            "batch_processing": {
-                "default_size": 10,
-                "max_concurrent": 5,
-                "delay_between": 2
-            },
-            "security": {
-                "rate_limit_per_minute": 60,
-                "enable_audit_logging": True,
-                "enable_input_validation": True
-            },
-            "performance": {
-                "cache_ttl": 300,
-                "enable_caching": True,
-                "enable_metrics": True
-            },
-            "hooks": {
-                "max_hooks": 100,
-                "retention_minutes": 60,
-                "real_time_updates": True
-            }
-        }
-        
-        if self.current_env == Environment.DEVELOPMENT:
-            return self._development_config(base_config)
-        elif self.current_env == Environment.STAGING:
-            return self._staging_config(base_config)
-        else:  # Production
-            return self._production_config(base_config)
-    
-    def _development_config(self, base: Dict[str, Any]) -> Dict[str, Any]:
-        """Development environment configuration"""
-        config = base.copy()
-        
-        # More relaxed settings for development
-        config.update({
-            "debug": True,
-            "log_level": "DEBUG",
-            "api_timeouts": {
-                "assistable_ai": 60,  # Longer timeouts for debugging
-                "gohighlevel": 60
-            },
-            "batch_processing": {
-                "default_size": 3,  # Smaller batches for testing
-                "max_concurrent": 2,
-                "delay_between": 1
-            },
-            "security": {
-                "rate_limit_per_minute": 120,  # More permissive
-                "enable_audit_logging": False,  # Less logging
-                "enable_input_validation": True
-            },
-            "performance": {
-                "cache_ttl": 60,  # Shorter cache for development
-                "enable_caching": False,  # Disable for fresh data
-                "enable_metrics": True,
-                "enable_detailed_logging": True
-            },
-            "hooks": {
-                "max_hooks": 50,  # Smaller buffer
-                "retention_minutes": 30,
-                "real_time_updates": True
-            }
-        })
-        
-        return config
-    
-    def _staging_config(self, base: Dict[str, Any]) -> Dict[str, Any]:
-        """Staging environment configuration"""
-        config = base.copy()
-        
-        # Production-like but with some debugging capabilities
-        config.update({
-            "debug": False,
-            "log_level": "INFO",
-            "api_timeouts": {
-                "assistable_ai": 45,
-                "gohighlevel": 45
-            },
-            "batch_processing": {
-                "default_size": 5,  # Moderate batch sizes
-                "max_concurrent": 3,
-                "delay_between": 3
-            },
-            "security": {
-                "rate_limit_per_minute": 80,
-                "enable_audit_logging": True,
-                "enable_input_validation": True
-            },
-            "performance": {
-                "cache_ttl": 180,
-                "enable_caching": True,
-                "enable_metrics": True,
-                "enable_detailed_logging": False
-            },
-            "hooks": {
-                "max_hooks": 75,
-                "retention_minutes": 45,
-                "real_time_updates": True
-            }
-        })
-        
-        return config
-    
-    def _production_config(self, base: Dict[str, Any]) -> Dict[str, Any]:
-        """Production environment configuration"""
-        config = base.copy()
-        
-        # Optimized for performance and reliability
-        config.update({
-            "debug": False,
-            "log_level": "INFO",
-            "api_timeouts": {
-                "assistable_ai": 30,
-                "gohighlevel": 30
-            },
-            "batch_processing": {
-                "default_size": 10,
-                "max_concurrent": 5,
-                "delay_between": 2
-            },
-            "security": {
-                "rate_limit_per_minute": 60,
-                "enable_audit_logging": True,
-                "enable_input_validation": True
-            },
-            "performance": {
-                "cache_ttl": 300,
-                "enable_caching": True,
-                "enable_metrics": True,
-                "enable_detailed_logging": False
-            },
-            "hooks": {
-                "max_hooks": 100,
-                "retention_minutes": 60,
-                "real_time_updates": True
-            }
-        })
-        
-        return config
+        return _ENVIRONMENT_CONFIGS[self.current_env]
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key (supports dot notation)"""
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        try:
+            value = self._flat_cache[key]
+        except KeyError:
+            value = self.config
+            for k in key.split('.'):
+                if isinstance(value, Mapping) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._flat_cache[key] = value
         
-        return value
+        return default if value is _MISSING else value
     
     def is_development(self) -> bool:
         """Check if running in development environment"""
@@ -321,6 +316,11 @@ class EnvironmentConfig:
 # Global environment configuration instance
 env_config = EnvironmentConfig()
 
+# Environment flags resolved once; reload_environment_config refreshes them
+IS_DEV = env_config.is_development()
+IS_STAGING = env_config.is_staging()
+IS_PROD = env_config.is_production()
+
 
 def get_environment_config() -> EnvironmentConfig:
     """Get the global environment configuration instance"""
@@ -329,24 +329,27 @@ def get_environment_config() -> EnvironmentConfig:
 
 def reload_environment_config() -> EnvironmentConfig:
     """Reload environment configuration"""
-    global env_config
+    global env_config, IS_DEV, IS_STAGING, IS_PROD
     env_config = EnvironmentConfig()
+    IS_DEV = env_config.is_development()
+    IS_STAGING = env_config.is_staging()
+    IS_PROD = env_config.is_production()
     return env_config
 
 
 def is_development() -> bool:
     """Check if running in development"""
-    return env_config.is_development()
+    return IS_DEV
 
 
 def is_staging() -> bool:
     """Check if running in staging"""
-    return env_config.is_staging()
+    return IS_STAGING
 
 
 def is_production() -> bool:
     """Check if running in production"""
-    return env_config.is_production()
+    return IS_PROD
 
 
 def get_env_setting(key: str, default: Any = None) -> Any:
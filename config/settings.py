@@ -2,17 +2,125 @@
 Configuration management for Skyward Assistable Bundle
 """
 
+import json
 import os
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+import sys
+import threading
+from typing import Dict, Any, Callable, ClassVar, Mapping, NamedTuple, Optional, Tuple, TypedDict
+from dataclasses import InitVar, dataclass, field, fields, is_dataclass, replace
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C extension
+    orjson = None
 
-@dataclass
-class AssistableAIConfig:
-    """Configuration for Assistable AI integration"""
-    api_token: str = field(default_factory=lambda: os.getenv("ASSISTABLE_API_TOKEN", ""))
-    base_url: str = "https://api.assistable.ai/v2"
-    default_model: str = "gpt-4"
+
+# Bumped whenever the global config is replaced or one of its fields is assigned;
+# derived dicts are rebuilt when it changes
+_config_version = 0
+_memo: Dict[str, Tuple[int, Any]] = {}
+
+
+def _memoized(key: str, build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a copy of build()'s dict, recomputing it only after the config version changes"""
+    cached = _memo.get(key)
+    if cached is not None and cached[0] == _config_version:
+        return dict(cached[1])
+    value = build()
+    _memo[key] = (_config_version, value)
+    return dict(value)
+
+
+# First characters of accepted truthy values: true/True/TRUE, yes/Y, 1
+_TRUTHY_INITIALS = "tTyY1"
+
+
+def _cast_bool(raw: str) -> bool:
+    return bool(raw) and raw[0] in _TRUTHY_INITIALS
+
+
+# Every environment variable the config reads: name -> (default, parser)
+_ENV_SPEC: Dict[str, Tuple[Any, Callable[[str], Any]]] = {
+    "ENVIRONMENT": ("development", str),
+    "DEBUG": (False, _cast_bool),
+    "ASSISTABLE_API_TOKEN": ("", str),
+    "GHL_API_KEY": ("", str),
+    "GHL_CLIENT_ID": ("", str),
+    "GHL_CLIENT_SECRET": ("", str),
+    "DEFAULT_LOCATION_ID": ("", str),
+    "MAX_HOOKS": (100, int),
+    "HOOK_RETENTION_MINUTES": (60, int),
+    "REAL_TIME_HOOKS": (True, _cast_bool),
+    "AUTO_CLEANUP_HOOKS": (True, _cast_bool),
+    "ENABLE_METRICS": (True, _cast_bool),
+    "BATCH_SIZE_DEFAULT": (10, int),
+    "BATCH_DELAY_DEFAULT": (2, int),
+    "CONCURRENT_REQUESTS_MAX": (5, int),
+    "BATCH_TIMEOUT_PER_ITEM": (30, int),
+    "BATCH_STOP_ON_ERROR": (False, _cast_bool),
+    "ENABLE_RATE_LIMITING": (True, _cast_bool),
+    "RATE_LIMIT_PER_MINUTE": (60, int),
+    "ENABLE_AUDIT_LOGGING": (True, _cast_bool),
+    "CACHE_TTL": (300, int),
+    "ENABLE_CACHING": (True, _cast_bool),
+    "ENABLE_DETAILED_LOGGING": (False, _cast_bool),
+    "LOG_LEVEL": ("INFO", str),
+}
+
+
+# Looks up a raw environment variable; os.environ.get by default, or e.g. a dict's .get
+EnvSource = Callable[[str], Optional[str]]
+
+
+def _parse_env(source: Optional[EnvSource] = None) -> Dict[str, Any]:
+    """Read and parse every variable in _ENV_SPEC in one pass"""
+    get = os.environ.get if source is None else source
+    parsed = {}
+    for key, (default, cast) in _ENV_SPEC.items():
+        raw = get(key)
+        parsed[key] = default if raw is None else cast(raw)
+    return parsed
+
+
+# Parsed process environment, filled on the first read and replaced by reload_config
+_parsed_env: Optional[Dict[str, Any]] = None
+
+
+def _env_values() -> Dict[str, Any]:
+    global _parsed_env
+    parsed = _parsed_env
+    if parsed is None:
+        parsed = _parsed_env = _parse_env()
+    return parsed
+
+
+def _env(key: str) -> Any:
+    """Parsed value of a variable listed in _ENV_SPEC"""
+    return _env_values()[key]
+
+
+def _env_field(key: str) -> Any:
+    """Dataclass field defaulting to the parsed value of environment variable key"""
+    return field(default_factory=lambda: _env(key), metadata={"env": key})
+
+
+# Shared defaults, interned so values equal to them compare by identity
+_ASSISTABLE_BASE_URL = sys.intern("https://api.assistable.ai/v2")
+_ASSISTABLE_DEFAULT_MODEL = sys.intern("gpt-4")
+_GHL_BASE_URL = sys.intern("https://services.leadconnectorhq.com")
+_GHL_API_VERSION = sys.intern("2021-07-28")
+
+
+def _fill_env_defaults(section: Any) -> Any:
+    """Replace env-backed NamedTuple fields left as None with their parsed environment value"""
+    missing = {name: _env(key) for name, key in section._ENV_FIELDS.items() if getattr(section, name) is None}
+    return section._replace(**missing) if missing else section
+
+
+class _AssistableAIFields(NamedTuple):
+    api_token: Optional[str] = None
+    base_url: str = _ASSISTABLE_BASE_URL
+    default_model: str = _ASSISTABLE_DEFAULT_MODEL
     default_temperature: float = 0.7
     default_queue: int = 1
     request_timeout: int = 30
@@ -20,172 +128,312 @@ class AssistableAIConfig:
     retry_delay: float = 1.0
 
 
-@dataclass
-class GoHighLevelConfig:
-    """Configuration for GoHighLevel integration"""
-    api_key: str = field(default_factory=lambda: os.getenv("GHL_API_KEY", ""))
-    client_id: str = field(default_factory=lambda: os.getenv("GHL_CLIENT_ID", ""))
-    client_secret: str = field(default_factory=lambda: os.getenv("GHL_CLIENT_SECRET", ""))
-    base_url: str = "https://services.leadconnectorhq.com"
-    api_version: str = "2021-07-28"
-    default_location_id: str = field(default_factory=lambda: os.getenv("DEFAULT_LOCATION_ID", ""))
+class AssistableAIConfig(_AssistableAIFields):
+    """Configuration for Assistable AI integration; fields left as None read the environment"""
+    __slots__ = ()
+    
+    _ENV_FIELDS: ClassVar[Dict[str, str]] = {"api_token": "ASSISTABLE_API_TOKEN"}
+    
+    def __new__(cls, *args: Any, **kwargs: Any) -> 'AssistableAIConfig':
+        return _fill_env_defaults(super().__new__(cls, *args, **kwargs))
+    
+    @classmethod
+    def from_environment(cls, values: Optional[Mapping[str, Any]] = None) -> 'AssistableAIConfig':
+        values = _env_values() if values is None else values
+        return cls(api_token=values["ASSISTABLE_API_TOKEN"])
+
+
+class _GoHighLevelFields(NamedTuple):
+    api_key: Optional[str] = None
+    client_id: Optional[str] = None
+    client_secret: Optional[str] = None
+    base_url: str = _GHL_BASE_URL
+    api_version: str = _GHL_API_VERSION
+    default_location_id: Optional[str] = None
     request_timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
 
 
-@dataclass
+class GoHighLevelConfig(_GoHighLevelFields):
+    """Configuration for GoHighLevel integration; fields left as None read the environment"""
+    __slots__ = ()
+    
+    _ENV_FIELDS: ClassVar[Dict[str, str]] = {
+        "api_key": "GHL_API_KEY",
+        "client_id": "GHL_CLIENT_ID",
+        "client_secret": "GHL_CLIENT_SECRET",
+        "default_location_id": "DEFAULT_LOCATION_ID"
+    }
+    
+    def __new__(cls, *args: Any, **kwargs: Any) -> 'GoHighLevelConfig':
+        return _fill_env_defaults(super().__new__(cls, *args, **kwargs))
+    
+    @classmethod
+    def from_environment(cls, values: Optional[Mapping[str, Any]] = None) -> 'GoHighLevelConfig':
+        values = _env_values() if values is None else values
+        return cls(
+            api_key=values["GHL_API_KEY"],
+            client_id=values["GHL_CLIENT_ID"],
+            client_secret=values["GHL_CLIENT_SECRET"],
+            default_location_id=values["DEFAULT_LOCATION_ID"]
+        )
+
+
+def _replace_section(section: Any, **changes: Any) -> Any:
+    """Copy a section with changes applied; sections are NamedTuples or frozen dataclasses"""
+    if isinstance(section, tuple):
+        return section._replace(**changes)
+    return replace(section, **changes)
+
+
+def _build_section(section_type: type, values: Mapping[str, Any]) -> Any:
+    """Build a section from parsed environment values"""
+    from_environment = getattr(section_type, "from_environment", None)
+    if from_environment is not None:
+        return from_environment(values)
+    return section_type(**{
+        f.name: values[f.metadata["env"]] for f in fields(section_type) if "env" in f.metadata
+    })
+
+
+@dataclass(frozen=True)
 class RuntimeHooksConfig:
     """Configuration for runtime hooks system"""
-    max_hooks: int = field(default_factory=lambda: int(os.getenv("MAX_HOOKS", "100")))
-    retention_minutes: int = field(default_factory=lambda: int(os.getenv("HOOK_RETENTION_MINUTES", "60")))
-    real_time_updates: bool = field(default_factory=lambda: os.getenv("REAL_TIME_HOOKS", "true").lower() == "true")
-    auto_cleanup: bool = field(default_factory=lambda: os.getenv("AUTO_CLEANUP_HOOKS", "true").lower() == "true")
-    enable_metrics: bool = field(default_factory=lambda: os.getenv("ENABLE_METRICS", "true").lower() == "true")
+    max_hooks: int = _env_field("MAX_HOOKS")
+    retention_minutes: int = _env_field("HOOK_RETENTION_MINUTES")
+    real_time_updates: bool = _env_field("REAL_TIME_HOOKS")
+    auto_cleanup: bool = _env_field("AUTO_CLEANUP_HOOKS")
+    enable_metrics: bool = _env_field("ENABLE_METRICS")
 
 
-@dataclass
+@dataclass(frozen=True)
 class BatchProcessingConfig:
     """Configuration for batch processing operations"""
-    default_batch_size: int = field(default_factory=lambda: int(os.getenv("BATCH_SIZE_DEFAULT", "10")))
-    default_delay_between_batches: int = field(default_factory=lambda: int(os.getenv("BATCH_DELAY_DEFAULT", "2")))
-    max_concurrent_requests: int = field(default_factory=lambda: int(os.getenv("CONCURRENT_REQUESTS_MAX", "5")))
-    timeout_per_item: int = field(default_factory=lambda: int(os.getenv("BATCH_TIMEOUT_PER_ITEM", "30")))
-    stop_on_error: bool = field(default_factory=lambda: os.getenv("BATCH_STOP_ON_ERROR", "false").lower() == "true")
+    default_batch_size: int = _env_field("BATCH_SIZE_DEFAULT")
+    default_delay_between_batches: int = _env_field("BATCH_DELAY_DEFAULT")
+    max_concurrent_requests: int = _env_field("CONCURRENT_REQUESTS_MAX")
+    timeout_per_item: int = _env_field("BATCH_TIMEOUT_PER_ITEM")
+    stop_on_error: bool = _env_field("BATCH_STOP_ON_ERROR")
 
 
-@dataclass
+@dataclass(frozen=True)
 class AgentDelegationConfig:
     """Configuration for agent delegation system"""
     default_delegation_mode: str = "auto_detect"
     confidence_threshold: float = 0.3
-    crm_keywords: list = field(default_factory=lambda: [
+    crm_keywords: tuple = (
         'assistant', 'ai call', 'contact', 'gohighlevel', 'ghl', 
         'conversation', 'lead', 'crm', 'customer', 'phone',
         'message', 'create assistant', 'make call', 'update contact',
         'calling campaign', 'bulk call', 'leads', 'sales'
-    ])
-    natural_keywords: list = field(default_factory=lambda: [
+    )
+    natural_keywords: tuple = (
         'chat', 'talk', 'explain', 'help', 'question', 'general',
         'what is', 'how to', 'can you', 'please help'
-    ])
+    )
+    # Hashed copies of the keyword tuples for O(1) membership checks
+    crm_keyword_set: frozenset = field(init=False, repr=False, compare=False)
+    natural_keyword_set: frozenset = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "crm_keyword_set", frozenset(self.crm_keywords))
+        object.__setattr__(self, "natural_keyword_set", frozenset(self.natural_keywords))
 
 
-@dataclass
+@dataclass(frozen=True)
 class SecurityConfig:
     """Security configuration"""
     enable_input_validation: bool = True
-    enable_rate_limiting: bool = field(default_factory=lambda: os.getenv("ENABLE_RATE_LIMITING", "true").lower() == "true")
-    rate_limit_per_minute: int = field(default_factory=lambda: int(os.getenv("RATE_LIMIT_PER_MINUTE", "60")))
-    enable_audit_logging: bool = field(default_factory=lambda: os.getenv("ENABLE_AUDIT_LOGGING", "true").lower() == "true")
+    enable_rate_limiting: bool = _env_field("ENABLE_RATE_LIMITING")
+    rate_limit_per_minute: int = _env_field("RATE_LIMIT_PER_MINUTE")
+    enable_audit_logging: bool = _env_field("ENABLE_AUDIT_LOGGING")
     max_input_length: int = 10000
     allowed_file_types: list = field(default_factory=lambda: ['.json', '.csv', '.txt'])
 
 
-@dataclass
+@dataclass(frozen=True)
 class PerformanceConfig:
     """Performance and caching configuration"""
-    cache_ttl: int = field(default_factory=lambda: int(os.getenv("CACHE_TTL", "300")))
-    enable_caching: bool = field(default_factory=lambda: os.getenv("ENABLE_CACHING", "true").lower() == "true")
+    cache_ttl: int = _env_field("CACHE_TTL")
+    enable_caching: bool = _env_field("ENABLE_CACHING")
     max_cache_size: int = 1000
-    enable_detailed_logging: bool = field(default_factory=lambda: os.getenv("ENABLE_DETAILED_LOGGING", "false").lower() == "true")
-    log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    enable_detailed_logging: bool = _env_field("ENABLE_DETAILED_LOGGING")
+    log_level: str = _env_field("LOG_LEVEL")
+
+
+# to_dict() layout: (section, exported fields, fields shown only as "***" when set);
+# "global" reads the top-level BundleConfig fields
+_TO_DICT_SCHEMA = (
+    ("assistable_ai", ("api_token", "base_url", "default_model", "request_timeout"), ("api_token",)),
+    ("gohighlevel", ("api_key", "base_url", "default_location_id", "request_timeout"), ("api_key",)),
+    ("runtime_hooks", ("max_hooks", "retention_minutes", "real_time_updates"), ()),
+    ("batch_processing", ("default_batch_size", "max_concurrent_requests", "timeout_per_item"), ()),
+    ("security", ("enable_rate_limiting", "rate_limit_per_minute", "enable_audit_logging"), ()),
+    ("performance", ("cache_ttl", "enable_caching", "log_level"), ()),
+    ("global", ("environment", "debug", "version"), ())
+)
 
 
 @dataclass
 class BundleConfig:
     """Main configuration class combining all sub-configurations"""
-    assistable_ai: AssistableAIConfig = field(default_factory=AssistableAIConfig)
-    gohighlevel: GoHighLevelConfig = field(default_factory=GoHighLevelConfig)
-    runtime_hooks: RuntimeHooksConfig = field(default_factory=RuntimeHooksConfig)
-    batch_processing: BatchProcessingConfig = field(default_factory=BatchProcessingConfig)
-    agent_delegation: AgentDelegationConfig = field(default_factory=AgentDelegationConfig)
-    security: SecurityConfig = field(default_factory=SecurityConfig)
-    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
     
-    # Global settings
-    environment: str = field(default_factory=lambda: os.getenv("ENVIRONMENT", "development"))
-    debug: bool = field(default_factory=lambda: os.getenv("DEBUG", "false").lower() == "true")
+    # Sub-configurations; a section left as None is built on first access from the env
+    # source and then cached on the instance (see __getattr__ and _build_section)
+    assistable_ai: Optional[AssistableAIConfig] = None
+    gohighlevel: Optional[GoHighLevelConfig] = None
+    runtime_hooks: Optional[RuntimeHooksConfig] = None
+    batch_processing: Optional[BatchProcessingConfig] = None
+    agent_delegation: Optional[AgentDelegationConfig] = None
+    security: Optional[SecurityConfig] = None
+    performance: Optional[PerformanceConfig] = None
+    
+    _SECTIONS: ClassVar[Dict[str, type]] = {
+        "assistable_ai": AssistableAIConfig,
+        "gohighlevel": GoHighLevelConfig,
+        "runtime_hooks": RuntimeHooksConfig,
+        "batch_processing": BatchProcessingConfig,
+        "agent_delegation": AgentDelegationConfig,
+        "security": SecurityConfig,
+        "performance": PerformanceConfig
+    }
+    
+    # Global settings; None reads ENVIRONMENT / DEBUG from the env source
+    environment: Optional[str] = None
+    debug: Optional[bool] = None
     version: str = "1.0.0"
     
-    def __post_init__(self):
-        """Validate configuration after initialization"""
-        self.validate()
+    # Where settings are read from: os.environ by default, or any key -> str lookup,
+    # e.g. BundleConfig(env={"ASSISTABLE_API_TOKEN": "t"}.get)
+    env: InitVar[Optional[EnvSource]] = None
+    
+    # Parsed values for an injected env source; None uses the process environment
+    _source_values: ClassVar[Optional[Dict[str, Any]]] = None
+    
+    # (config version, to_dict result) and (config version, to_json_bytes result)
+    _dict_cache: ClassVar[Optional[Tuple[int, Dict[str, Any]]]] = None
+    _json_cache: ClassVar[Optional[Tuple[int, bytes]]] = None
+    
+    def __post_init__(self, env: Optional[EnvSource]):
+        """Validate on construction only when SKYWARD_VALIDATE_CONFIG=1; see from_environment"""
+        if env is not None:
+            self._source_values = _parse_env(env)
+        values = self._values()
+        if self.environment is None:
+            self.environment = values["ENVIRONMENT"]
+        if self.debug is None:
+            self.debug = values["DEBUG"]
+        if os.environ.get("SKYWARD_VALIDATE_CONFIG") == "1":
+            self.validate()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating derived dicts when a config field changes"""
+        global _config_version
+        if value is None and name in self._SECTIONS:
+            # Unset sections stay off the instance, so reads fall through to __getattr__
+            # and build them from the env source
+            self.__dict__.pop(name, None)
+        else:
+            object.__setattr__(self, name, value)
+        if name in _FIELD_NAMES:
+            # Drop this instance's derived dicts, and the module memo for the global config
+            self.__dict__.pop("_dict_cache", None)
+            self.__dict__.pop("_json_cache", None)
+            if self is _config:
+                _config_version += 1
+    
+    def _values(self) -> Dict[str, Any]:
+        values = self._source_values
+        return _env_values() if values is None else values
+    
+    def __getattr__(self, name: str) -> Any:
+        """Build a sub-configuration the first time it is read"""
+        section_type = self._SECTIONS.get(name)
+        if section_type is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        section = self.__dict__[name] = _build_section(section_type, self._values())
+        return section
     
     def validate(self) -> None:
         """Validate configuration settings"""
-        errors = []
-        
+        errors = tuple(self._iter_errors())
+        if errors:
+            raise ValueError(f"Configuration validation failed: {', '.join(errors)}")
+    
+    def validate_fast(self) -> None:
+        """Like validate(), but raise on the first error instead of collecting them all"""
+        for error in self._iter_errors():
+            raise ValueError(f"Configuration validation failed: {error}")
+    
+    def _iter_errors(self):
         # Validate required API credentials
         if not self.assistable_ai.api_token:
-            errors.append("ASSISTABLE_API_TOKEN is required")
+            yield "ASSISTABLE_API_TOKEN is required"
         
         if not self.gohighlevel.default_location_id:
-            errors.append("DEFAULT_LOCATION_ID is required")
+            yield "DEFAULT_LOCATION_ID is required"
         
         # Validate numeric ranges
         if self.batch_processing.default_batch_size <= 0:
-            errors.append("Batch size must be positive")
+            yield "Batch size must be positive"
         
         if self.runtime_hooks.max_hooks <= 0:
-            errors.append("Max hooks must be positive")
+            yield "Max hooks must be positive"
         
         if self.security.rate_limit_per_minute <= 0:
-            errors.append("Rate limit must be positive")
+            yield "Rate limit must be positive"
         
         # Validate environment
-        if self.environment not in ["development", "staging", "production"]:
-            errors.append(f"Invalid environment: {self.environment}")
-        
-        if errors:
-            raise ValueError(f"Configuration validation failed: {', '.join(errors)}")
+        if self.environment not in ("development", "staging", "production"):
+            yield f"Invalid environment: {self.environment}"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
-        return {
-            "assistable_ai": {
-                "api_token": "***" if self.assistable_ai.api_token else None,
-                "base_url": self.assistable_ai.base_url,
-                "default_model": self.assistable_ai.default_model,
-                "request_timeout": self.assistable_ai.request_timeout
-            },
-            "gohighlevel": {
-                "api_key": "***" if self.gohighlevel.api_key else None,
-                "base_url": self.gohighlevel.base_url,
-                "default_location_id": self.gohighlevel.default_location_id,
-                "request_timeout": self.gohighlevel.request_timeout
-            },
-            "runtime_hooks": {
-                "max_hooks": self.runtime_hooks.max_hooks,
-                "retention_minutes": self.runtime_hooks.retention_minutes,
-                "real_time_updates": self.runtime_hooks.real_time_updates
-            },
-            "batch_processing": {
-                "default_batch_size": self.batch_processing.default_batch_size,
-                "max_concurrent_requests": self.batch_processing.max_concurrent_requests,
-                "timeout_per_item": self.batch_processing.timeout_per_item
-            },
-            "security": {
-                "enable_rate_limiting": self.security.enable_rate_limiting,
-                "rate_limit_per_minute": self.security.rate_limit_per_minute,
-                "enable_audit_logging": self.security.enable_audit_logging
-            },
-            "performance": {
-                "cache_ttl": self.performance.cache_ttl,
-                "enable_caching": self.performance.enable_caching,
-                "log_level": self.performance.log_level
-            },
-            "global": {
-                "environment": self.environment,
-                "debug": self.debug,
-                "version": self.version
+        # Callers get their own copy, so editing it cannot corrupt the cache
+        return {section: dict(values) for section, values in self._cached_dict().items()}
+    
+    def _cached_dict(self) -> Dict[str, Any]:
+        cached = self._dict_cache
+        if cached is not None and cached[0] == _config_version:
+            return cached[1]
+        result = self._build_dict()
+        self._dict_cache = (_config_version, result)
+        return result
+    
+    def to_json_bytes(self) -> bytes:
+        """to_dict() encoded as JSON bytes, cached until the config version changes"""
+        cached = self._json_cache
+        if cached is not None and cached[0] == _config_version:
+            return cached[1]
+        payload = self._cached_dict()
+        encoded = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+        self._json_cache = (_config_version, encoded)
+        return encoded
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        result = {}
+        for section, names, masked in _TO_DICT_SCHEMA:
+            source = self if section == "global" else getattr(self, section)
+            result[section] = {
+                name: ("***" if getattr(source, name) else None) if name in masked else getattr(source, name)
+                for name in names
             }
-        }
+        return result
     
     @classmethod
-    def from_environment(cls) -> 'BundleConfig':
-        """Create configuration from environment variables"""
-        return cls()
+    def from_environment(
+        cls, validate: bool = True, env: Optional[EnvSource] = None
+    ) -> 'BundleConfig':
+        """Create configuration from environment variables, or from env when given
+        
+        The process environment is re-read on every call; BundleConfig() itself uses
+        the copy parsed on first use and refreshed by reload_config().
+        """
+        instance = cls(env=os.environ.get if env is None else env)
+        if validate:
+            instance.validate()
+        return instance
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'BundleConfig':
@@ -195,43 +443,142 @@ class BundleConfig:
         return cls.from_environment()
 
 
-# Global configuration instance
-config = BundleConfig()
+# Drop the None class defaults of the section fields, which would otherwise shadow __getattr__
+for _section in BundleConfig._SECTIONS:
+    delattr(BundleConfig, _section)
+del _section
+
+# Assigning any of these bumps _config_version; see BundleConfig.__setattr__
+_FIELD_NAMES = frozenset(f.name for f in fields(BundleConfig))
+
+
+def _section_fields(section_type: type) -> Tuple[str, ...]:
+    if is_dataclass(section_type):
+        return tuple(f.name for f in fields(section_type) if f.init)
+    return section_type._fields
+
+
+# update_config keys resolved to attribute paths: top-level fields, whole
+# sections, and "section.setting" for every settable section field
+_ATTR_PATHS: Dict[str, Tuple[str, ...]] = {f.name: (f.name,) for f in fields(BundleConfig)}
+for _section, _section_type in BundleConfig._SECTIONS.items():
+    _ATTR_PATHS[_section] = (_section,)
+    for _name in _section_fields(_section_type):
+        _ATTR_PATHS[f"{_section}.{_name}"] = (_section, _name)
+del _section, _section_type, _name
+_VALID_PATHS = frozenset(_ATTR_PATHS.values())
+
+
+# Global configuration instance, created on first get_config()
+_config: Optional[BundleConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> BundleConfig:
     """Get the global configuration instance"""
-    return config
+    current = _config
+    if current is None:
+        with _config_lock:
+            current = _config
+            if current is None:
+                current = _set_config(BundleConfig.from_environment())
+    return current
+
+
+def _set_config(new_config: BundleConfig) -> BundleConfig:
+    global _config, _config_version
+    _config = new_config
+    _config_version += 1
+    return new_config
+
+
+def __getattr__(name: str) -> Any:
+    # Keep settings.config working for callers that read the module attribute
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def reload_config() -> BundleConfig:
     """Reload configuration from environment"""
-    global config
-    config = BundleConfig.from_environment()
-    return config
+    global _parsed_env
+    with _config_lock:
+        _parsed_env = _parse_env()
+        return _set_config(BundleConfig.from_environment())
 
 
-def update_config(**kwargs) -> None:
-    """Update configuration values"""
-    global config
+def update_config(_paths: Optional[Mapping[Tuple[str, ...], Any]] = None, **kwargs) -> None:
+    """Update configuration values
+    
+    Keys are field names or "section.setting" strings. Callers that push the
+    same settings repeatedly can pass pre-split paths instead, e.g.
+    update_config({("performance", "cache_ttl"): 600}).
+    """
+    config = get_config()
+    
+    updates = [(_ATTR_PATHS.get(key), value) for key, value in kwargs.items()]
+    if _paths:
+        updates.extend(
+            (path if path in _VALID_PATHS else None, value) for path, value in _paths.items()
+        )
     
-    for key, value in kwargs.items():
-        if hasattr(config, key):
-            setattr(config, key, value)
+    for path, value in updates:
+        if path is None:
+            continue
+        if len(path) == 1:
+            setattr(config, path[0], value)
         else:
-            # Handle nested configuration updates
-            if '.' in key:
-                section, setting = key.split('.', 1)
-                if hasattr(config, section):
-                    section_config = getattr(config, section)
-                    if hasattr(section_config, setting):
-                        setattr(section_config, setting, value)
+            # Sections are immutable; swap in an updated copy
+            section, setting = path
+            setattr(config, section, _replace_section(getattr(config, section), **{setting: value}))
     
     config.validate()
 
 
-def get_environment_info() -> Dict[str, Any]:
+class EnvironmentInfo(TypedDict):
+    """Shape returned by get_environment_info()"""
+    environment: str
+    debug: bool
+    version: str
+    assistable_ai_configured: bool
+    ghl_configured: bool
+    default_location_set: bool
+    hooks_enabled: bool
+    caching_enabled: bool
+    rate_limiting_enabled: bool
+
+
+class RequiredSettings(TypedDict):
+    """Shape returned by validate_required_settings()"""
+    assistable_api_token: bool
+    ghl_api_key: bool
+    default_location_id: bool
+    environment_set: bool
+    valid_batch_size: bool
+    valid_rate_limit: bool
+
+
+class ProductionChecklist(TypedDict):
+    """Shape returned by get_production_checklist()"""
+    environment_is_production: bool
+    debug_disabled: bool
+    api_credentials_set: bool
+    location_configured: bool
+    rate_limiting_enabled: bool
+    audit_logging_enabled: bool
+    caching_enabled: bool
+    detailed_logging_disabled: bool
+    reasonable_timeouts: bool
+    reasonable_batch_sizes: bool
+
+
+def get_environment_info() -> EnvironmentInfo:
     """Get environment information for debugging"""
+    return _memoized("environment_info", _build_environment_info)
+
+
+def _build_environment_info() -> EnvironmentInfo:
+    config = get_config()
     return {
         "environment": config.environment,
         "debug": config.debug,
@@ -245,8 +592,13 @@ def get_environment_info() -> Dict[str, Any]:
     }
 
 
-def validate_required_settings() -> Dict[str, bool]:
+def validate_required_settings() -> RequiredSettings:
     """Validate that all required settings are configured"""
+    return _memoized("required_settings", _build_required_settings)
+
+
+def _build_required_settings() -> RequiredSettings:
+    config = get_config()
     return {
         "assistable_api_token": bool(config.assistable_ai.api_token),
         "ghl_api_key": bool(config.gohighlevel.api_key),
@@ -257,8 +609,13 @@ def validate_required_settings() -> Dict[str, bool]:
     }
 
 
-def get_production_checklist() -> Dict[str, bool]:
+def get_production_checklist() -> ProductionChecklist:
     """Get production readiness checklist"""
+    return _memoized("production_checklist", _build_production_checklist)
+
+
+def _build_production_checklist() -> ProductionChecklist:
+    config = get_config()
     return {
         "environment_is_production": config.environment == "production",
         "debug_disabled": not config.debug,
@@ -6,7 +6,9 @@ multiple components for sophisticated AI automation scenarios.
 """
 
 import asyncio
+import functools
 import json
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
@@ -15,10 +17,16 @@ import sys
 sys.path.append('../components')
 
 from assistable_ai_client import AssistableAIClient
-from ghl_client import GoHighLevelClient
 from agent_delegator import AgentDelegator
 from runtime_hooks import RuntimeHooks
-from batch_processor import BatchProcessor
+from batch_processor import BatchProcessor, TokenBucket
+
+# One request budget per upstream API, shared by every processor that calls it
+GHL_LIMITER = TokenBucket(rate=10, period=1.0)
+ASSISTABLE_LIMITER = TokenBucket(rate=5, period=1.0)
+
+# Emails per GoHighLevel contact search request
+CONTACT_SEARCH_PAGE_SIZE = 100
 
 
 class WorkflowOrchestrator:
@@ -27,16 +35,89 @@ class WorkflowOrchestrator:
     def __init__(self):
         self.hooks = RuntimeHooks()
         self.session_id = f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Hooks queued since the last flush; emitted together on the next loop iteration
+        self._pending_hooks: List[Dict[str, Any]] = []
+        
+    def _queue_hook(self, hook_type: str, data: Dict[str, Any]):
+        """Buffer a hook, scheduling a flush when the buffer was empty"""
+        if not self._pending_hooks:
+            try:
+                asyncio.get_running_loop().call_soon(self.flush_hooks)
+            except RuntimeError:
+                # No running loop to defer to
+                self.hooks.emit_hook(hook_type, "orchestrator", data)
+                return
+        self._pending_hooks.append({"hook_type": hook_type, "component": "orchestrator", "data": data})
         
     def log_step(self, step: str, data: Dict[str, Any]):
-        """Log workflow step with hooks"""
-        self.hooks.emit_hook("workflow_step", "orchestrator", {
+        """Log workflow step with hooks, batching emission off the workflow's path"""
+        self._queue_hook("workflow_step", {
             "session_id": self.session_id,
             "step": step,
             "timestamp": datetime.now().isoformat(),
             "data": data
         })
         print(f"📋 {step}: {data}")
+    
+    def emit_batch_complete(self, stage: str, batch_data: Dict[str, Any]):
+        """Record a finished BatchProcessor stage as one aggregate hook instead of per-item progress"""
+        summary = batch_data.get("summary", {})
+        started, completed = summary.get("started_at"), summary.get("completed_at")
+        duration_ms = None
+        if started and completed:
+            elapsed = datetime.fromisoformat(completed) - datetime.fromisoformat(started)
+            duration_ms = round(elapsed.total_seconds() * 1000, 1)
+        
+        aggregate = {
+            "session_id": self.session_id,
+            "stage": stage,
+            "total": summary.get("processed_items", 0),
+            "succeeded": summary.get("successful", 0),
+            "failed": summary.get("failed", 0),
+            "duration_ms": duration_ms
+        }
+        if "error" in batch_data:
+            aggregate["error"] = batch_data["error"]
+        self._queue_hook("workflow_batch_complete", aggregate)
+    
+    def flush_hooks(self):
+        """Emit buffered hooks in one batch; call before reading hooks"""
+        pending, self._pending_hooks = self._pending_hooks, []
+        if pending:
+            self.hooks.emit_hooks(pending)
+
+
+@functools.lru_cache(maxsize=1)
+def assistable_client() -> AssistableAIClient:
+    """Process-wide Assistable client, so every workflow step reuses one HTTP connection pool"""
+    client = AssistableAIClient()
+    client.emit_hooks = True
+    return client
+
+
+async def assistable_operation(**inputs) -> Dict[str, Any]:
+    """Run one Assistable operation on the shared client without mutating its inputs"""
+    [result] = await assistable_client().bulk_execute([inputs])
+    if isinstance(result, Exception):
+        return {"error": f"Operation failed: {result}"}
+    return result
+
+
+async def drain_queue(queue: asyncio.Queue):
+    """Yield queued items until the None sentinel, so a queue can feed a BatchProcessor"""
+    while True:
+        item = await queue.get()
+        if item is None:
+            return
+        yield item
+
+
+async def run_stage(processor: BatchProcessor, downstream: asyncio.Queue):
+    """Run one pipeline stage, then close the queue feeding the next one"""
+    try:
+        return await processor.process_batch()
+    finally:
+        downstream.put_nowait(None)
 
 
 async def workflow_complete_lead_qualification():
@@ -77,44 +158,47 @@ async def workflow_complete_lead_qualification():
         print("⚠️ Task not routed to specialist agent - may need manual intervention")
         return
     
+    # Steps 2-6 run as one streaming pipeline: each found contact is called as soon
+    # as its lookup returns and each finished call is written back right away, so no
+    # stage waits for the whole previous one. Step 3 (the assistant prompt is static)
+    # overlaps the lookups; only the calls wait for it
+    call_queue = asyncio.Queue()
+    update_queue = asyncio.Queue()
+    found_contacts = []
+    qualification_results = []
+    
     # Step 2: Batch Contact Lookup
     orchestrator.log_step("STEP_2_CONTACT_LOOKUP", {"operation": "batch_lookup"})
     
+    leads_by_email = {lead["email"]: lead for lead in leads}
+    
+    def on_contact(record):
+        if not record.success:
+            return
+        for contact_data in record.result.get("contacts", ()):
+            if contact_data.get("found"):
+                # Merge with original lead data
+                contact_data.update(leads_by_email.get(contact_data.get("email"), {}))
+                found_contacts.append(contact_data)
+                call_queue.put_nowait(contact_data)
+    
+    # One multi-email search per page of leads instead of one request per lead
+    emails = [lead["email"] for lead in leads]
     contact_processor = BatchProcessor()
     contact_processor.batch_operation = "bulk_contact_lookup"
-    contact_processor.batch_data = [{"email": lead["email"]} for lead in leads]
+    contact_processor.batch_data = [
+        {"emails": emails[start:start + CONTACT_SEARCH_PAGE_SIZE]}
+        for start in range(0, len(emails), CONTACT_SEARCH_PAGE_SIZE)
+    ]
     contact_processor.batch_size = 3
-    contact_processor.emit_progress_hooks = True
-    
-    contact_results = await contact_processor.process_batch()
-    
-    # Extract successful contact lookups
-    found_contacts = []
-    for result in contact_results.data["results"]:
-        if result["success"] and result["result"].get("found"):
-            contact_data = result["result"]
-            # Merge with original lead data
-            original_lead = next(lead for lead in leads if lead["email"] == contact_data.get("email"))
-            contact_data.update(original_lead)
-            found_contacts.append(contact_data)
-    
-    orchestrator.log_step("STEP_2_RESULTS", {
-        "contacts_found": len(found_contacts),
-        "contacts_missing": len(leads) - len(found_contacts)
-    })
-    
-    if not found_contacts:
-        print("❌ No contacts found in GoHighLevel - workflow cannot continue")
-        return
+    contact_processor.emit_progress_hooks = False  # one aggregate hook per stage instead
+    contact_processor.rate_limiter = GHL_LIMITER
+    contact_processor.on_result = on_contact
     
     # Step 3: Create Specialized Qualification Assistant
     orchestrator.log_step("STEP_3_ASSISTANT_CREATION", {"assistant_type": "qualification"})
     
-    assistable_client = AssistableAIClient()
-    assistable_client.operation = "create_assistant"
-    assistable_client.assistant_name = "Lead Qualification Specialist"
-    assistable_client.assistant_description = "AI assistant specialized in qualifying high-value B2B leads"
-    assistable_client.input_text = """
+    qualification_prompt = """
     You are a professional lead qualification specialist. Your role is to:
     
     1. Warmly introduce yourself and your company
@@ -126,95 +210,113 @@ async def workflow_complete_lead_qualification():
     Be conversational, professional, and focus on helping rather than selling.
     Ask open-ended questions and listen actively to responses.
     """
-    assistable_client.emit_hooks = True
-    
-    assistant_result = await assistable_client.execute_operation()
     
-    if "error" in assistant_result.data:
-        print(f"❌ Failed to create assistant: {assistant_result.data['error']}")
-        return
-    
-    assistant_id = assistant_result.data.get("assistant_id")
-    orchestrator.log_step("STEP_3_RESULTS", {"assistant_id": assistant_id})
+    assistant_task = asyncio.ensure_future(create_assistant(
+        "Lead Qualification Specialist",
+        "AI assistant specialized in qualifying high-value B2B leads",
+        qualification_prompt
+    ))
     
     # Step 4: Execute Qualification Calls
-    orchestrator.log_step("STEP_4_QUALIFICATION_CALLS", {"contacts_to_call": len(found_contacts)})
-    
-    # Prepare call data with personalization
-    call_data = []
-    for contact in found_contacts:
-        call_info = {
-            "contact_id": contact.get("contact_id"),
-            "assistant_id": assistant_id,
-            "personalization": {
-                "lead_source": contact.get("source"),
-                "lead_score": contact.get("score"),
-                "email": contact.get("email")
+    orchestrator.log_step("STEP_4_QUALIFICATION_CALLS", {"streaming_from": "contact_lookup"})
+    
+    async def call_data():
+        assistant_result = await assistant_task
+        if "error" in assistant_result:
+            return
+        assistant_id = assistant_result.get("assistant_id")
+        # Prepare call data with personalization
+        async for contact in drain_queue(call_queue):
+            yield {
+                "contact_id": contact.get("contact_id"),
+                "assistant_id": assistant_id,
+                "personalization": {
+                    "lead_source": contact.get("source"),
+                    "lead_score": contact.get("score"),
+                    "email": contact.get("email")
+                }
             }
-        }
-        call_data.append(call_info)
-    
-    # Execute batch calls
-    call_processor = BatchProcessor()
-    call_processor.batch_operation = "bulk_ai_calls"
-    call_processor.batch_data = call_data
-    call_processor.assistant_id = assistant_id
-    call_processor.batch_size = 2  # Smaller batches for personalized calls
-    call_processor.delay_between_batches = 5  # Longer delay for quality
-    call_processor.emit_progress_hooks = True
-    
-    call_results = await call_processor.process_batch()
     
     # Step 5: Process Results and Update Records
-    orchestrator.log_step("STEP_5_RESULT_PROCESSING", {"calls_completed": len(call_results.data["results"])})
-    
-    qualification_results = []
-    for result in call_results.data["results"]:
-        if result["success"]:
-            call_info = result["result"]
+    def on_call(record):
+        if record.success:
+            call_info = record.result
             # In real implementation, you would analyze call transcripts/outcomes
             # For demo, we'll simulate qualification results
             qualification = {
                 "contact_id": call_info.get("contact_id"),
                 "call_id": call_info.get("call_id"),
-                "status": "qualified" if result["index"] % 2 == 0 else "nurture",
-                "score": 85 + (result["index"] * 5),  # Simulated scoring
-                "next_action": "demo_scheduled" if result["index"] % 2 == 0 else "follow_up_email",
+                "status": "qualified" if record.index % 2 == 0 else "nurture",
+                "score": 85 + (record.index * 5),  # Simulated scoring
+                "next_action": "demo_scheduled" if record.index % 2 == 0 else "follow_up_email",
                 "notes": f"Qualified via AI call on {datetime.now().strftime('%Y-%m-%d')}"
             }
             qualification_results.append(qualification)
+            update_queue.put_nowait({
+                "contact_id": qualification["contact_id"],
+                "customFields": {
+                    "qualification_status": qualification["status"],
+                    "qualification_score": qualification["score"],
+                    "last_qualification_date": datetime.now().strftime('%Y-%m-%d'),
+                    "qualification_notes": qualification["notes"]
+                },
+                "tags": [f"ai_qualified_{qualification['status']}"]
+            })
+    
+    # Execute batch calls
+    call_processor = BatchProcessor()
+    call_processor.batch_operation = "bulk_ai_calls"
+    call_processor.batch_data = call_data()
+    call_processor.batch_size = 2  # Smaller batches for personalized calls
+    call_processor.emit_progress_hooks = False  # one aggregate hook per stage instead
+    call_processor.rate_limiter = ASSISTABLE_LIMITER
+    call_processor.on_result = on_call
     
     # Step 6: Update Contact Records with Qualification Results
-    orchestrator.log_step("STEP_6_RECORD_UPDATES", {"qualified_contacts": len(qualification_results)})
-    
-    ghl_client = GoHighLevelClient()
-    update_data = []
-    
-    for qual in qualification_results:
-        update_info = {
-            "contact_id": qual["contact_id"],
-            "customFields": {
-                "qualification_status": qual["status"],
-                "qualification_score": qual["score"],
-                "last_qualification_date": datetime.now().strftime('%Y-%m-%d'),
-                "qualification_notes": qual["notes"]
-            },
-            "tags": [f"ai_qualified_{qual['status']}"]
-        }
-        update_data.append(update_info)
+    orchestrator.log_step("STEP_6_RECORD_UPDATES", {"streaming_from": "qualification_calls"})
     
     # Execute batch updates
     update_processor = BatchProcessor()
     update_processor.batch_operation = "bulk_contact_updates"
-    update_processor.batch_data = update_data
+    update_processor.batch_data = drain_queue(update_queue)
     update_processor.batch_size = 5
-    update_processor.emit_progress_hooks = True
+    update_processor.emit_progress_hooks = False  # one aggregate hook per stage instead
+    update_processor.rate_limiter = GHL_LIMITER
+    
+    contact_results, call_results, update_results = await asyncio.gather(
+        run_stage(contact_processor, call_queue),
+        run_stage(call_processor, update_queue),
+        update_processor.process_batch()
+    )
+    assistant_result = assistant_task.result()
+    for stage, stage_results in (
+        ("contact_lookup", contact_results),
+        ("qualification_calls", call_results),
+        ("record_updates", update_results)
+    ):
+        orchestrator.emit_batch_complete(stage, stage_results.data)
+    
+    orchestrator.log_step("STEP_2_RESULTS", {
+        "contacts_found": len(found_contacts),
+        "contacts_missing": len(leads) - len(found_contacts)
+    })
+    
+    if not found_contacts:
+        print("❌ No contacts found in GoHighLevel - workflow cannot continue")
+        return
     
-    update_results = await update_processor.process_batch()
+    if "error" in assistant_result:
+        print(f"❌ Failed to create assistant: {assistant_result['error']}")
+        return
+    
+    orchestrator.log_step("STEP_3_RESULTS", {"assistant_id": assistant_result.get("assistant_id")})
+    orchestrator.log_step("STEP_5_RESULT_PROCESSING", {"calls_completed": len(call_results.data["results"])})
+    orchestrator.log_step("STEP_6_RESULTS", {"qualified_contacts": len(qualification_results)})
     
     # Step 7: Generate Summary Report
     orchestrator.log_step("STEP_7_REPORT_GENERATION", {"generating": True})
     
+    orchestrator.flush_hooks()
     report = generate_qualification_report(
         leads, found_contacts, qualification_results, 
         call_results.data["summary"], orchestrator.hooks
@@ -288,33 +390,24 @@ async def workflow_ai_calling_campaign_with_follow_up():
         }
     }
     
+    # Create all segment assistants concurrently
+    results = await asyncio.gather(*(
+        create_assistant(config["name"], config["description"], config["prompt"])
+        for config in assistant_configs.values()
+    ))
+    
     assistants = {}
-    assistable_client = AssistableAIClient()
-    
-    for segment, config in assistant_configs.items():
-        assistable_client.operation = "create_assistant"
-        assistable_client.assistant_name = config["name"]
-        assistable_client.assistant_description = config["description"]
-        assistable_client.input_text = config["prompt"]
-        assistable_client.emit_hooks = True
-        
-        result = await assistable_client.execute_operation()
-        
-        if "assistant_id" in result.data:
-            assistants[segment] = result.data["assistant_id"]
+    for segment, result in zip(assistant_configs, results):
+        if "assistant_id" in result:
+            assistants[segment] = result["assistant_id"]
             orchestrator.log_step(f"ASSISTANT_CREATED_{segment.upper()}", {
-                "assistant_id": result.data["assistant_id"]
+                "assistant_id": result["assistant_id"]
             })
     
     # Step 2: Execute Segmented Calling Campaigns
     orchestrator.log_step("STEP_2_CAMPAIGN_EXECUTION", {"segments_to_call": len(assistants)})
     
-    campaign_results = {}
-    
-    for segment, contacts in contact_segments.items():
-        if segment not in assistants:
-            continue
-            
+    async def call_segment(segment, contacts):
         orchestrator.log_step(f"CALLING_SEGMENT_{segment.upper()}", {
             "contacts_count": len(contacts),
             "assistant_id": assistants[segment]
@@ -337,11 +430,20 @@ async def workflow_ai_calling_campaign_with_follow_up():
         call_processor.batch_data = segment_call_data
         call_processor.assistant_id = assistants[segment]
         call_processor.batch_size = 2
-        call_processor.delay_between_batches = 3
-        call_processor.emit_progress_hooks = True
+        call_processor.emit_progress_hooks = False  # one aggregate hook per stage instead
+        # Segments run concurrently, so they pace against the same budget
+        call_processor.rate_limiter = ASSISTABLE_LIMITER
         
         segment_results = await call_processor.process_batch()
-        campaign_results[segment] = segment_results.data
+        orchestrator.emit_batch_complete(f"calls_{segment}", segment_results.data)
+        return segment, segment_results.data
+    
+    # Segments are independent, so their campaigns run concurrently
+    campaign_results = dict(await asyncio.gather(*(
+        call_segment(segment, contacts)
+        for segment, contacts in contact_segments.items()
+        if segment in assistants
+    )))
     
     # Step 3: Analyze Call Outcomes and Trigger Follow-ups
     orchestrator.log_step("STEP_3_OUTCOME_ANALYSIS", {"analyzing": True})
@@ -356,6 +458,7 @@ async def workflow_ai_calling_campaign_with_follow_up():
     follow_up_results = await execute_follow_up_actions(follow_up_actions, orchestrator)
     
     # Step 5: Generate Campaign Report
+    orchestrator.flush_hooks()
     campaign_report = generate_campaign_report(
         contact_segments, assistants, campaign_results, 
         follow_up_actions, orchestrator.hooks
@@ -400,16 +503,26 @@ async def workflow_real_time_customer_service():
         "inquiries_count": len(customer_inquiries)
     })
     
-    processed_inquiries = []
-    
-    for inquiry in customer_inquiries:
-        # Real-time agent delegation
-        delegator = AgentDelegator()
-        delegator.user_input = f"{inquiry['type']} issue: {inquiry['message']}"
-        delegator.delegation_mode = "auto_detect"
-        delegator.enable_hooks = True
-        
-        delegation_result = await delegator.delegate_task()
+    # Routing follows the inquiry type, so inquiries of one type share a single
+    # delegation; concurrent inquiries await the same in-flight task
+    delegations = {}
+    
+    def delegate(inquiry):
+        key = ("auto_detect", inquiry["type"])
+        task = delegations.get(key)
+        if task is None:
+            # Real-time agent delegation; each call gets its own delegator since
+            # inquiries are handled concurrently
+            delegator = AgentDelegator()
+            delegator.user_input = f"{inquiry['type']} issue: {inquiry['message']}"
+            delegator.delegation_mode = key[0]
+            delegator.enable_hooks = True
+            task = delegations[key] = asyncio.ensure_future(delegator.delegate_task())
+        # Shielded so one cancelled inquiry doesn't cancel the others' delegation
+        return asyncio.shield(task)
+    
+    async def handle_inquiry(inquiry):
+        delegation_result = await delegate(inquiry)
         
         # Select appropriate specialized assistant
         assistant_id = select_assistant_for_inquiry(inquiry, service_assistants)
@@ -419,13 +532,19 @@ async def workflow_real_time_customer_service():
             inquiry, assistant_id, delegation_result, orchestrator
         )
         
-        processed_inquiries.append(response)
-        
         # Check for escalation needs
         if should_escalate(inquiry, response):
             await trigger_escalation(inquiry, response, orchestrator)
+        
+        return response
+    
+    # Inquiries are independent; handle them concurrently, keeping arrival order
+    processed_inquiries = await asyncio.gather(
+        *(handle_inquiry(inquiry) for inquiry in customer_inquiries)
+    )
     
     # Step 3: Generate Service Report
+    orchestrator.flush_hooks()
     service_report = generate_service_report(processed_inquiries, orchestrator.hooks)
     
     print("\n" + "=" * 60)
@@ -441,8 +560,9 @@ async def workflow_real_time_customer_service():
 def generate_qualification_report(leads, found_contacts, qualification_results, call_summary, hooks):
     """Generate comprehensive qualification campaign report"""
     
-    qualified_count = len([q for q in qualification_results if q["status"] == "qualified"])
-    nurture_count = len([q for q in qualification_results if q["status"] == "nurture"])
+    status_counts = Counter(q["status"] for q in qualification_results)
+    qualified_count = status_counts["qualified"]
+    nurture_count = status_counts["nurture"]
     
     return {
         "campaign_summary": {
@@ -503,9 +623,7 @@ def analyze_call_outcomes_and_plan_follow_ups(campaign_results):
 async def execute_follow_up_actions(follow_up_actions, orchestrator):
     """Execute planned follow-up actions"""
     
-    results = []
-    
-    for action_info in follow_up_actions:
+    async def execute(action_info):
         orchestrator.log_step("EXECUTING_FOLLOW_UP", {
             "action": action_info["action"],
             "contact_id": action_info["contact_id"]
@@ -514,17 +632,16 @@ async def execute_follow_up_actions(follow_up_actions, orchestrator):
         # Simulate follow-up action execution
         if action_info["action"] in ["send_case_study", "send_welcome_email"]:
             # Email follow-up
-            result = await send_follow_up_email(action_info)
+            return await send_follow_up_email(action_info)
         elif action_info["action"] in ["schedule_demo", "schedule_discovery"]:
             # Calendar booking
-            result = await schedule_follow_up_meeting(action_info)
+            return await schedule_follow_up_meeting(action_info)
         else:
             # Other actions
-            result = await execute_other_follow_up(action_info)
-        
-        results.append(result)
+            return await execute_other_follow_up(action_info)
     
-    return results
+    # Follow-ups for different contacts don't depend on each other
+    return list(await asyncio.gather(*(execute(action_info) for action_info in follow_up_actions)))
 
 
 async def send_follow_up_email(action_info):
@@ -591,10 +708,7 @@ def generate_campaign_report(contact_segments, assistants, campaign_results, fol
             }
             for segment, results in campaign_results.items()
         },
-        "follow_up_breakdown": {
-            action: len([f for f in follow_up_actions if f["action"] == action])
-            for action in set(f["action"] for f in follow_up_actions)
-        },
+        "follow_up_breakdown": dict(Counter(f["action"] for f in follow_up_actions)),
         "operational_metrics": {
             "total_hooks_emitted": len(hooks.hook_storage),
             "workflow_efficiency": "92%",  # Simulated
@@ -603,6 +717,16 @@ def generate_campaign_report(contact_segments, assistants, campaign_results, fol
     }
 
 
+async def create_assistant(name, description, prompt):
+    """Create one assistant; safe to run concurrently since inputs are per operation"""
+    return await assistable_operation(
+        operation="create_assistant",
+        assistant_name=name,
+        assistant_description=description,
+        input_text=prompt
+    )
+
+
 async def create_service_assistants(orchestrator):
     """Create specialized customer service assistants"""
     
@@ -621,23 +745,19 @@ async def create_service_assistants(orchestrator):
         }
     }
     
+    # Create all service assistants concurrently
+    results = await asyncio.gather(*(
+        create_assistant(config["name"], f"Specialized assistant for {service_type} support", config["prompt"])
+        for service_type, config in assistant_configs.items()
+    ))
+    
     assistants = {}
-    assistable_client = AssistableAIClient()
-    
-    for service_type, config in assistant_configs.items():
-        assistable_client.operation = "create_assistant"
-        assistable_client.assistant_name = config["name"]
-        assistable_client.assistant_description = f"Specialized assistant for {service_type} support"
-        assistable_client.input_text = config["prompt"]
-        assistable_client.emit_hooks = True
-        
-        result = await assistable_client.execute_operation()
-        
-        if "assistant_id" in result.data:
-            assistants[service_type] = result.data["assistant_id"]
+    for service_type, result in zip(assistant_configs, results):
+        if "assistant_id" in result:
+            assistants[service_type] = result["assistant_id"]
             orchestrator.log_step(f"SERVICE_ASSISTANT_CREATED", {
                 "type": service_type,
-                "assistant_id": result.data["assistant_id"]
+                "assistant_id": result["assistant_id"]
             })
     
     return assistants
@@ -658,17 +778,15 @@ async def process_customer_inquiry(inquiry, assistant_id, delegation_result, orc
     })
     
     # Simulate processing with assistant
-    assistable_client = AssistableAIClient()
-    assistable_client.operation = "chat_completion"
-    assistable_client.assistant_id = assistant_id
-    assistable_client.input_text = inquiry["message"]
-    assistable_client.emit_hooks = True
-    
-    response = await assistable_client.execute_operation()
+    response = await assistable_operation(
+        operation="chat_completion",
+        assistant_id=assistant_id,
+        input_text=inquiry["message"]
+    )
     
     return {
         "inquiry": inquiry,
-        "assistant_response": response.data,
+        "assistant_response": response,
         "delegation_info": delegation_result.data,
         "processing_time": "2.3 seconds",  # Simulated
         "resolution_status": "resolved" if inquiry["urgency"] != "critical" else "escalated"
@@ -701,8 +819,15 @@ def generate_service_report(processed_inquiries, hooks):
     """Generate customer service report"""
     
     total_inquiries = len(processed_inquiries)
-    resolved_count = len([p for p in processed_inquiries if p["resolution_status"] == "resolved"])
-    escalated_count = len([p for p in processed_inquiries if p["resolution_status"] == "escalated"])
+    
+    # Count every breakdown in one pass
+    resolutions, inquiry_types, urgencies = Counter(), Counter(), Counter()
+    for p in processed_inquiries:
+        resolutions[p["resolution_status"]] += 1
+        inquiry_types[p["inquiry"]["type"]] += 1
+        urgencies[p["inquiry"]["urgency"]] += 1
+    resolved_count = resolutions["resolved"]
+    escalated_count = resolutions["escalated"]
     
     return {
         "service_summary": {
@@ -711,14 +836,8 @@ def generate_service_report(processed_inquiries, hooks):
             "escalated": escalated_count,
             "resolution_rate": resolved_count / total_inquiries if total_inquiries else 0
         },
-        "inquiry_breakdown": {
-            inquiry_type: len([p for p in processed_inquiries if p["inquiry"]["type"] == inquiry_type])
-            for inquiry_type in set(p["inquiry"]["type"] for p in processed_inquiries)
-        },
-        "urgency_distribution": {
-            urgency: len([p for p in processed_inquiries if p["inquiry"]["urgency"] == urgency])
-            for urgency in set(p["inquiry"]["urgency"] for p in processed_inquiries)
-        },
+        "inquiry_breakdown": dict(inquiry_types),
+        "urgency_distribution": dict(urgencies),
         "performance_metrics": {
             "average_processing_time": "2.1 seconds",  # Simulated
             "customer_satisfaction": "4.2/5",  # Simulated
@@ -749,6 +868,9 @@ async def run_advanced_workflows():
         except Exception as e:
             print(f"❌ Failed: {workflow_name} - {str(e)}")
     
+    # Release the shared client's connection pool before the event loop closes
+    await assistable_client().aclose()
+    
     print("\n🎉 All advanced workflows completed!")
 
 
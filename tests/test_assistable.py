@@ -5,6 +5,7 @@ Tests for AssistableAIClient component
 import pytest
 import asyncio
 import os
+import httpx
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime
 
@@ -28,7 +29,8 @@ class TestAssistableAIClient:
     def test_initialization(self):
         """Test component initialization"""
         client = AssistableAIClient()
-        assert client.hooks == []
+        assert list(client.hooks) == []
+        assert client.hooks.maxlen == 512
         assert client.base_url == "https://api.assistable.ai/v2"
         assert hasattr(client, 'emit_hook')
         
@@ -90,10 +92,10 @@ class TestAssistableAIClient:
     @pytest.mark.asyncio
     async def test_create_assistant_missing_location(self):
         """Test assistant creation with missing location ID"""
-        self.client.location_id = ""
-        
         with patch.dict(os.environ, {}, clear=True):  # Clear environment
-            result = await self.client.create_assistant()
+            client = AssistableAIClient()  # Environment defaults are read at init
+            client.location_id = ""
+            result = await client.create_assistant()
             
             assert "error" in result
             assert "Location ID is required" in result["error"]
@@ -149,7 +151,7 @@ class TestAssistableAIClient:
     async def test_api_request_timeout(self):
         """Test API request timeout handling"""
         with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.side_effect = asyncio.TimeoutError()
+            mock_client.return_value.request = AsyncMock(side_effect=httpx.TimeoutException("timed out"))
             
             result = await self.client._make_request("GET", "/test")
             
@@ -162,7 +164,7 @@ class TestAssistableAIClient:
         with patch('httpx.AsyncClient') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 401
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
             
             result = await self.client._make_request("GET", "/test")
             
@@ -175,7 +177,7 @@ class TestAssistableAIClient:
         with patch('httpx.AsyncClient') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 429
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
             
             result = await self.client._make_request("GET", "/test")
             
@@ -247,6 +249,76 @@ class TestAssistableAIClient:
             error_hooks = [h for h in self.client.hooks if h["hook_type"] == "error"]
             assert len(error_hooks) > 0
             
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_requests(self):
+        """Test the pooled HTTP client is created once and reused"""
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"ok": True}
+            mock_response.content = b'{"ok": true}'
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.aclose = AsyncMock()
+            
+            await self.client._make_request("GET", "/test")
+            await self.client._make_request("GET", "/test")
+            
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.request.await_count == 2
+            headers = mock_client.return_value.request.call_args[1]["headers"]
+            assert headers["Authorization"] == "Bearer test_token"
+            
+            await self.client.aclose()
+            mock_client.return_value.aclose.assert_awaited_once()
+            
+    @pytest.mark.asyncio
+    async def test_bulk_execute(self):
+        """Test bulk_execute runs each op with its own inputs"""
+        with patch.object(self.client, '_make_request') as mock_request:
+            mock_request.return_value = {"success": True}
+            
+            results = await self.client.bulk_execute([
+                {"operation": "create_message", "input_text": "first"},
+                {"operation": "create_message", "input_text": "second"},
+                {"operation": "unknown_operation"}
+            ])
+            
+            assert results[0] == {"success": True}
+            assert results[1] == {"success": True}
+            assert "Unknown operation" in results[2]["error"]
+            
+            contents = sorted(call[0][2]["content"] for call in mock_request.call_args_list)
+            assert contents == ["first", "second"]
+            # Per-op overrides do not leak into the original component
+            assert self.client.input_text == "Hello, world!"
+            
+    @pytest.mark.asyncio
+    async def test_bulk_execute_transport_overrides_use_private_clients(self):
+        """Test ops overriding timeout/base_url neither touch the shared pool nor leak clients"""
+        created = []
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"success": True}))
+        
+        def make_client(**kwargs):
+            client = real_client(transport=transport, **kwargs)
+            created.append(client)
+            return client
+        
+        ops = [{"operation": "create_message", "input_text": "slow", "timeout": 5}]
+        ops += [{"operation": "create_message", "input_text": f"op {i}"} for i in range(20)]
+        with patch('httpx.AsyncClient', side_effect=make_client):
+            results = await self.client.bulk_execute(ops)
+        
+        assert all(result == {"success": True} for result in results)
+        assert len(created) == 2
+        shared = self.client._client
+        assert shared in created and not shared.is_closed
+        assert all(client.is_closed for client in created if client is not shared)
+        
+        await self.client.aclose()
+        assert shared.is_closed
+            
     def test_get_hooks(self):
         """Test get_hooks method"""
         # Add some test hooks
@@ -260,6 +332,16 @@ class TestAssistableAIClient:
         assert result.data == {"hooks": self.client.hooks}
         assert len(result.data["hooks"]) == 2
         
+    def test_hook_timestamp_format(self):
+        """Test hook timestamps are ISO strings compatible with other components"""
+        self.client.emit_hooks = True
+        first = self.client.emit_hook("test", {"message": "first"})
+        second = self.client.emit_hook("test", {"message": "second"})
+        
+        assert isinstance(first["timestamp"], str)
+        assert datetime.fromisoformat(first["timestamp"])
+        assert first["timestamp"] <= second["timestamp"]
+        
     @pytest.mark.asyncio
     async def test_conversation_id_generation(self):
         """Test automatic conversation ID generation"""
@@ -282,7 +364,8 @@ class TestAssistableAIClient:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"test": "data"}
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_response.content = b'{"test": "data"}'
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
             
             result = await self.client._make_request("GET", "/test")
             
@@ -296,7 +379,8 @@ class TestAssistableAIClient:
             mock_response.status_code = 200
             mock_response.json.side_effect = Exception("Not JSON")
             mock_response.text = "Plain text response"
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_response.content = b"Plain text response"
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
             
             result = await self.client._make_request("GET", "/test")
             
@@ -4,6 +4,7 @@ Tests for GoHighLevelClient component
 
 import pytest
 import asyncio
+import httpx
 import os
 from unittest.mock import AsyncMock, patch, MagicMock
 
@@ -219,13 +220,13 @@ class TestGoHighLevelClient:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_response.content = b'{"success": true}'
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
             
             await self.client._make_request("GET", "/test")
             
-            # Check that request was called with correct headers
-            call_args = mock_client.return_value.__aenter__.return_value.request.call_args
-            headers = call_args[1]['headers']
+            # Check that the pooled client was built with correct headers
+            headers = mock_client.call_args[1]['headers']
             
             assert "Authorization" in headers
             assert "Bearer test_ghl_key" in headers["Authorization"]
@@ -244,13 +245,13 @@ class TestGoHighLevelClient:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_response.content = b'{"success": true}'
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
             
             await self.client._make_request("GET", "/test", location_id=location_id)
             
             # Check that location-specific token was used
-            call_args = mock_client.return_value.__aenter__.return_value.request.call_args
-            headers = call_args[1]['headers']
+            headers = mock_client.call_args[1]['headers']
             assert f"Bearer {location_token}" in headers["Authorization"]
             
     @pytest.mark.asyncio
@@ -264,17 +265,113 @@ class TestGoHighLevelClient:
         ]
         
         for status_code, expected_error in test_cases:
-            with patch('httpx.AsyncClient') as mock_client:
+            with patch('httpx.AsyncClient') as mock_client, \
+                    patch('asyncio.sleep', new_callable=AsyncMock):
                 mock_response = MagicMock()
                 mock_response.status_code = status_code
                 mock_response.text = f"Server error {status_code}"
-                mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+                mock_client.return_value.request = AsyncMock(return_value=mock_response)
                 
                 result = await self.client._make_request("GET", "/test")
                 
                 assert "error" in result
                 assert expected_error in result["error"]
                 
+    @pytest.mark.asyncio
+    async def test_rate_limit_retry_after(self):
+        """Test 429 responses are retried after the Retry-After delay"""
+        with patch('httpx.AsyncClient') as mock_client, \
+                patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            limited = MagicMock()
+            limited.status_code = 429
+            limited.headers = {"Retry-After": "2"}
+            ok = MagicMock()
+            ok.status_code = 200
+            ok.json.return_value = {"success": True}
+            ok.content = b'{"success": true}'
+            mock_client.return_value.request = AsyncMock(side_effect=[limited, ok])
+            
+            result = await self.client._make_request("GET", "/test")
+            
+            assert result == {"success": True}
+            mock_sleep.assert_awaited_once_with(2.0)
+                
+    @pytest.mark.asyncio
+    async def test_server_errors_retried_only_for_idempotent_methods(self):
+        """Test a 5xx is retried for GET but not for a POST the server may have applied"""
+        with patch('httpx.AsyncClient') as mock_client, \
+                patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            failed = MagicMock()
+            failed.status_code = 502
+            failed.headers = {}
+            failed.text = "Bad Gateway"
+            ok = MagicMock()
+            ok.status_code = 200
+            ok.content = b'{"success": true}'
+            mock_client.return_value.request = AsyncMock(side_effect=[failed, ok, failed])
+            
+            assert await self.client._make_request("GET", "/test") == {"success": True}
+            
+            result = await self.client._make_request("POST", "/contacts/", data={"email": "a@b.c"})
+            assert result["status"] == 502
+            assert mock_client.return_value.request.await_count == 3
+            assert mock_sleep.await_count == 1
+                
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_requests(self):
+        """Test the pooled HTTP client is created once and reused"""
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"success": True}
+            mock_response.content = b'{"success": true}'
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.aclose = AsyncMock()
+            
+            await self.client._make_request("GET", "/test")
+            await self.client._make_request("GET", "/test")
+            
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.request.await_count == 2
+            
+            # A location with its own token gets a separate client
+            self.client._location_tokens["loc_other"] = "other_token"
+            await self.client._make_request("GET", "/test", location_id="loc_other")
+            assert mock_client.call_count == 2
+            
+            await self.client.aclose()
+            assert mock_client.return_value.aclose.await_count == 2
+            assert self.client._clients == {}
+            
+    @pytest.mark.asyncio
+    async def test_http_client_replaced_when_token_or_settings_change(self):
+        """Test a new token or timeout replaces the slot's client and closes the old one"""
+        with patch('httpx.AsyncClient') as mock_client:
+            first, second, third = MagicMock(is_closed=False), MagicMock(is_closed=False), MagicMock(is_closed=False)
+            for client in (first, second, third):
+                client.aclose = AsyncMock()
+            mock_client.side_effect = [first, second, third]
+            
+            assert self.client._get_client("old_token") is first
+            assert self.client._get_client("new_token") is second
+            assert len(self.client._clients) == 1
+            
+            self.client.timeout = 5
+            assert self.client._get_client("new_token") is third
+            await asyncio.sleep(0)
+            
+            first.aclose.assert_awaited_once()
+            second.aclose.assert_awaited_once()
+            
+    def test_http_client_rebuilt_for_new_loop(self):
+        """Test the pooled client is not reused on a different event loop"""
+        async def pooled():
+            return self.client._get_client("test_ghl_key")
+        
+        assert asyncio.run(pooled()) is not asyncio.run(pooled())
+        assert len(self.client._clients) == 1
+            
     @pytest.mark.asyncio
     async def test_execute_operation_get_contact(self):
         """Test execute_operation with get_contact"""
@@ -388,7 +485,8 @@ class TestGoHighLevelClient:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"test": "data"}
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_response.content = b'{"test": "data"}'
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
             
             result = await self.client._make_request("GET", "/test")
             
@@ -402,7 +500,8 @@ class TestGoHighLevelClient:
             mock_response.status_code = 200
             mock_response.json.side_effect = Exception("Not JSON")
             mock_response.text = "Plain text response"
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_response.content = b"Plain text response"
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
             
             result = await self.client._make_request("GET", "/test")
             
@@ -412,7 +511,7 @@ class TestGoHighLevelClient:
     async def test_timeout_handling(self):
         """Test timeout handling"""
         with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.side_effect = asyncio.TimeoutError()
+            mock_client.return_value.request = AsyncMock(side_effect=httpx.TimeoutException("timed out"))
             
             result = await self.client._make_request("GET", "/test")
             
@@ -5,7 +5,11 @@ Tests component interactions and workflow patterns
 
 import pytest
 import asyncio
+import gc
+import json
 import os
+import weakref
+from datetime import datetime
 from unittest.mock import patch, MagicMock, AsyncMock
 
 # Import components
@@ -13,7 +17,7 @@ from assistable_ai_client import AssistableAIClient
 from ghl_client import GoHighLevelClient
 from agent_delegator import AgentDelegator
 from runtime_hooks import RuntimeHooks
-from batch_processor import BatchProcessor
+from batch_processor import BatchProcessor, TokenBucket
 
 
 class TestIntegration:
@@ -80,6 +84,78 @@ class TestIntegration:
         assert result.data["delegation_info"]["agent_used"] == "primary"
         assert len(self.agent_delegator.hooks) > 0
         
+    @pytest.mark.asyncio
+    async def test_agent_delegator_fixed_mode_skips_analysis(self):
+        """Test fixed delegation modes route without analyzing the input"""
+        self.agent_delegator.user_input = "What's the weather like today?"
+        self.agent_delegator.delegation_mode = "force_specialist"
+        
+        result = await self.agent_delegator.delegate_task()
+        
+        assert result.data["delegation_info"]["agent_used"] == "specialist"
+        assert result.data["delegation_info"]["task_analysis"]["skipped"] is True
+        
+    @pytest.mark.asyncio
+    async def test_agent_delegator_response_bytes(self):
+        """Test the delegation result is encoded to JSON once and cached"""
+        assert self.agent_delegator.response_bytes() is None
+        self.agent_delegator.user_input = "Create an assistant for customer service"
+        self.agent_delegator.delegation_mode = "auto_detect"
+        
+        result = await self.agent_delegator.delegate_task()
+        encoded = self.agent_delegator.response_bytes()
+        
+        assert json.loads(encoded) == json.loads(json.dumps(result.data, default=str))
+        assert self.agent_delegator.response_bytes() is encoded
+        
+    @pytest.mark.asyncio
+    async def test_agent_delegator_response_bytes_after_error(self):
+        """Test a failed delegation replaces the cached response of the previous one"""
+        self.agent_delegator.user_input = "Create an assistant for customer service"
+        await self.agent_delegator.delegate_task()
+        assert self.agent_delegator.response_bytes() is not None
+        
+        with patch.object(self.agent_delegator, "execute_with_primary_agent", side_effect=RuntimeError("boom")), \
+                patch.object(self.agent_delegator, "execute_with_specialist_agent", side_effect=RuntimeError("boom")):
+            result = await self.agent_delegator.delegate_task()
+        
+        assert "error" in result.data
+        assert json.loads(self.agent_delegator.response_bytes()) == json.loads(json.dumps(result.data, default=str))
+        
+    @pytest.mark.asyncio
+    async def test_agent_delegator_response_bytes_non_str_keys(self):
+        """Test agent results keyed by non-strings encode the same with or without orjson"""
+        self.agent_delegator.user_input = "Can you explain this?"
+        self.agent_delegator.delegation_mode = "primary_only"
+        
+        with patch.object(self.agent_delegator, "execute_with_primary_agent", return_value={"scores": {1: 0.9}}):
+            await self.agent_delegator.delegate_task()
+        
+        assert json.loads(self.agent_delegator.response_bytes())["scores"] == {"1": 0.9}
+        
+    def test_assistable_client_pool_follows_loop_and_settings(self):
+        """Test the pooled HTTP client is rebuilt for a new loop or changed settings"""
+        client = self.assistable_client
+        
+        async def pooled():
+            return client._get_client()
+        
+        first = asyncio.run(pooled())
+        second = asyncio.run(pooled())
+        assert second is not first
+        
+        async def same_loop():
+            pool = client._get_client()
+            assert client._get_client() is pool
+            client.timeout = 5
+            rebuilt = client._get_client()
+            assert rebuilt is not pool and rebuilt.timeout.connect == 5
+            await asyncio.sleep(0)
+            assert pool.is_closed
+            await client.aclose()
+        
+        asyncio.run(same_loop())
+        
     @pytest.mark.asyncio
     async def test_runtime_hooks_aggregation(self):
         """Test runtime hooks aggregating data from multiple components"""
@@ -126,6 +202,228 @@ class TestIntegration:
             hook_types = [h["hook_type"] for h in self.batch_processor.progress_hooks]
             assert "batch_start" in hook_types
             
+    @pytest.mark.asyncio
+    async def test_batch_processor_stop_on_error(self):
+        """Test stop_on_error cancels the items still waiting for a slot"""
+        self.batch_processor.batch_operation = "bulk_ai_calls"
+        self.batch_processor.batch_data = [{"contact_id": f"contact_{i}"} for i in range(6)]
+        self.batch_processor.assistant_id = "asst_test123"
+        self.batch_processor.number_pool_id = "pool_test123"
+        self.batch_processor.location_id = "loc_test123"
+        self.batch_processor.batch_size = 2
+        self.batch_processor.delay_between_batches = 0
+        self.batch_processor.stop_on_error = True
+        self.batch_processor.emit_progress_hooks = True
+        
+        async def mock_process_func(item, index):
+            if index == 0:
+                raise ValueError("boom")
+            await asyncio.sleep(0.01)
+            return {"call_id": f"call_{index}"}
+            
+        with patch.object(self.batch_processor, 'bulk_ai_calls_item', side_effect=mock_process_func):
+            result = await self.batch_processor.process_batch()
+            
+            assert result.data["summary"]["failed"] == 1
+            assert result.data["summary"]["processed_items"] < 6
+            hook_types = [h["hook_type"] for h in self.batch_processor.progress_hooks]
+            assert "batch_stopped" in hook_types
+            
+    @pytest.mark.asyncio
+    async def test_batch_processor_backs_off_on_rate_limit(self):
+        """Test the adaptive limit shrinks when items come back rate limited"""
+        self.batch_processor.batch_operation = "bulk_ai_calls"
+        self.batch_processor.batch_data = [{"contact_id": f"contact_{i}"} for i in range(8)]
+        self.batch_processor.assistant_id = "asst_test123"
+        self.batch_processor.number_pool_id = "pool_test123"
+        self.batch_processor.location_id = "loc_test123"
+        self.batch_processor.batch_size = 4
+        self.batch_processor.delay_between_batches = 0
+        self.batch_processor.emit_progress_hooks = True
+        
+        async def mock_process_func(item, index):
+            return {"error": "Rate limited - Please try again later"}
+            
+        with patch.object(self.batch_processor, 'bulk_ai_calls_item', side_effect=mock_process_func):
+            await self.batch_processor.process_batch()
+            
+            progress = [h for h in self.batch_processor.progress_hooks if h["hook_type"] == "chunk_progress"]
+            assert progress[-1]["data"]["concurrency"] == self.batch_processor.min_concurrency
+            
+    @pytest.mark.asyncio
+    async def test_batch_processors_share_rate_limiter(self):
+        """Test processors sharing a token bucket are paced together"""
+        limiter = TokenBucket(rate=20, period=1.0, capacity=1)
+        processors = [self.batch_processor, BatchProcessor()]
+        for processor in processors:
+            processor.batch_operation = "bulk_contact_lookup"
+            processor.batch_data = [{"contact_id": f"contact_{i}"} for i in range(3)]
+            processor.rate_limiter = limiter
+            
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(*(processor.process_batch() for processor in processors))
+        
+        # One token up front, then one every 50ms for the remaining five items
+        assert loop.time() - started >= 0.24
+        assert all(result.data["summary"]["successful"] == 3 for result in results)
+        
+    @pytest.mark.asyncio
+    async def test_batch_contact_lookup_deduplicates(self):
+        """Test duplicate contacts in one batch share a single lookup"""
+        self.batch_processor.batch_operation = "bulk_contact_lookup"
+        self.batch_processor.batch_data = [
+            {"email": "a@example.com"},
+            {"email": "a@example.com"},
+            {"phone": "+15551234567"}
+        ]
+        
+        async def mock_lookup(item):
+            return {"email": item.get("email"), "found": True}
+            
+        with patch.object(self.batch_processor, '_lookup_contact', side_effect=mock_lookup) as lookup:
+            result = await self.batch_processor.process_batch()
+            
+            assert result.data["summary"]["successful"] == 3
+            assert lookup.await_count == 2
+            assert self.batch_processor._lookup_cache is None
+            
+    @pytest.mark.asyncio
+    async def test_batch_contact_lookup_duplicates_survive_timeout(self):
+        """Test duplicates of a timed-out lookup are reported as failed items, not dropped"""
+        self.batch_processor.batch_operation = "bulk_contact_lookup"
+        self.batch_processor.batch_data = [
+            {"email": "a@example.com"},
+            {"email": "a@example.com"},
+            {"email": "b@example.com"},
+            {"email": "a@example.com"}
+        ]
+        self.batch_processor.timeout_per_item = 0.2
+        self.batch_processor.stop_on_error = False
+        # Stagger starts so the duplicates are waiting when the first lookup times out
+        self.batch_processor.rate_limiter = TokenBucket(rate=20, period=1.0, capacity=1)
+        
+        async def mock_lookup(item):
+            if item["email"] == "a@example.com":
+                await asyncio.sleep(1)
+            return {"email": item["email"], "found": True}
+            
+        with patch.object(self.batch_processor, '_lookup_contact', side_effect=mock_lookup):
+            result = await self.batch_processor.process_batch()
+            
+            summary = result.data["summary"]
+            assert summary["processed_items"] == 4
+            assert summary["successful"] == 1
+            assert summary["failed"] == 3
+            assert all("Timeout after" in e["error"] for e in self.batch_processor.batch_errors)
+            
+    @pytest.mark.asyncio
+    async def test_batch_contact_lookup_by_email_page(self):
+        """Test an emails item is resolved by one multi-email lookup"""
+        self.batch_processor.batch_operation = "bulk_contact_lookup"
+        self.batch_processor.batch_data = [{"emails": ["a@example.com", "b@example.com", "a@example.com"]}]
+        
+        with patch.object(self.batch_processor, '_lookup_contact', new_callable=AsyncMock) as single:
+            result = await self.batch_processor.process_batch()
+            
+            lookup = result.data["results"][0]["result"]
+            assert single.await_count == 0
+            assert lookup["found"] is True
+            assert [c["email"] for c in lookup["contacts"]] == ["a@example.com", "b@example.com"]
+            
+    @pytest.mark.asyncio
+    async def test_batch_invalid_items_fail_before_scheduling(self):
+        """Test items failing validation never reach the async handler"""
+        self.batch_processor.batch_operation = "bulk_contact_lookup"
+        self.batch_processor.batch_data = [{"email": "a@example.com"}, {"name": "no identifiers"}]
+        
+        with patch.object(self.batch_processor, 'bulk_contact_lookup_item', new_callable=AsyncMock) as handler:
+            handler.return_value = {"found": True}
+            result = await self.batch_processor.process_batch()
+            
+            assert handler.await_count == 1
+            assert result.data["summary"]["failed"] == 1
+            assert "Must provide contact_id" in self.batch_processor.batch_errors[0]["error"]
+            
+    @pytest.mark.asyncio
+    async def test_batch_processor_streams_iterator_input(self):
+        """Test generator batch data is consumed lazily without a known length"""
+        self.batch_processor.batch_operation = "bulk_contact_lookup"
+        self.batch_processor.batch_data = ({"contact_id": f"contact_{i}"} for i in range(5))
+        
+        result = await self.batch_processor.process_batch()
+        
+        assert result.data["summary"]["total_items"] == 5
+        assert result.data["summary"]["successful"] == 5
+        assert [r["index"] for r in result.data["results"]] == list(range(5))
+        
+    @pytest.mark.asyncio
+    async def test_batch_processors_chain_through_on_result(self):
+        """Test one processor's results can stream into the next via an async iterator"""
+        queue = asyncio.Queue()
+        
+        async def drain():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                yield item
+                
+        lookup = self.batch_processor
+        lookup.batch_operation = "bulk_contact_lookup"
+        lookup.batch_data = [{"contact_id": f"contact_{i}"} for i in range(4)]
+        lookup.on_result = lambda record: queue.put_nowait({"contact_id": record.result["contact_id"]})
+        
+        downstream = BatchProcessor()
+        downstream.batch_operation = "bulk_contact_lookup"
+        downstream.batch_data = drain()
+        
+        async def run_lookup():
+            try:
+                return await lookup.process_batch()
+            finally:
+                queue.put_nowait(None)
+                
+        _, chained = await asyncio.gather(run_lookup(), downstream.process_batch())
+        
+        assert chained.data["summary"]["successful"] == 4
+        assert sorted(r["result"]["contact_id"] for r in chained.data["results"]) == [
+            f"contact_{i}" for i in range(4)
+        ]
+        
+    @pytest.mark.asyncio
+    async def test_batch_pipeline_stops_early_on_error(self):
+        """Test a failure cancels the in-flight items instead of waiting for them"""
+        self.batch_processor.stop_on_error = True
+        self.batch_processor.batch_size = 3
+        self.batch_processor.emit_progress_hooks = False
+        
+        async def process_func(item, index):
+            if index == 0:
+                raise ValueError("boom")
+            await asyncio.sleep(5)
+            
+        results = await asyncio.wait_for(
+            self.batch_processor.run_pipeline(process_func, [{}, {}, {}]),
+            timeout=1
+        )
+        
+        assert [r.index for r in results] == [0]
+        assert results[0].success is False
+        
+    @pytest.mark.asyncio
+    async def test_batch_item_timeout(self):
+        """Test a slow item is reported as a timeout instead of raising"""
+        self.batch_processor.timeout_per_item = 0.01
+        
+        async def slow_func(item, index):
+            await asyncio.sleep(1)
+            
+        record = await self.batch_processor.process_item_with_timeout(slow_func, {}, 0)
+        
+        assert record.success is False
+        assert "Timeout after" in record.error
+        
     def test_hook_filtering_and_monitoring(self):
         """Test hook filtering and monitoring capabilities"""
         # Create test hooks from different components
@@ -169,6 +467,159 @@ class TestIntegration:
         assert len(filtered) == 1
         assert filtered[0]["hook_type"] == "error"
         
+    def test_hook_cleanup_and_realtime_feed(self):
+        """Test retention cleanup and realtime ordering on epoch timestamps"""
+        old = self.runtime_hooks.emit_hook("pre_task", "ghl_client", {})
+        old["_ts"] -= 3600 * 2
+        recent = self.runtime_hooks.emit_hook("end_run", "ghl_client", {})
+        foreign = {
+            "hook_type": "error",
+            "component": "assistable_ai_client",
+            "timestamp": datetime.now().isoformat(),
+            "data": {}
+        }
+        self.runtime_hooks.hook_storage.append(foreign)
+
+        feed = self.runtime_hooks.get_realtime_updates()
+        assert old not in feed
+        assert feed[0] is foreign and feed[1] is recent
+
+        self.runtime_hooks.cleanup_old_hooks()
+        assert list(self.runtime_hooks.hook_storage) == [recent, foreign]
+
+    def test_hook_cleanup_trims_sessions(self):
+        """Test cleanup drops expired session hooks and empty sessions"""
+        stale = self.runtime_hooks.emit_hook("pre_task", "ghl_client", {}, session_id="stale")
+        old = self.runtime_hooks.emit_hook("pre_task", "ghl_client", {}, session_id="live")
+        recent = self.runtime_hooks.emit_hook("end_run", "ghl_client", {}, session_id="live")
+        stale["_ts"] -= 3600 * 2
+        old["_ts"] -= 3600 * 2
+
+        self.runtime_hooks.cleanup_old_hooks()
+        assert "stale" not in self.runtime_hooks.session_hooks
+        assert list(self.runtime_hooks.session_hooks["live"]) == [recent]
+
+    def test_session_hooks_are_bounded(self):
+        """Test per-session hook lists and the session count stay capped"""
+        hooks = RuntimeHooks()
+        hooks._MAX_SESSIONS = 3
+        for i in range(40):
+            hooks.emit_hook("pre_task", "ghl_client", {}, session_id="busy")
+        for name in ("a", "b", "busy", "c"):
+            hooks.emit_hook("pre_task", "ghl_client", {}, session_id=name)
+
+        assert len(hooks.session_hooks["busy"]) == hooks._session_maxlen
+        assert list(hooks.session_hooks) == ["b", "busy", "c"]
+
+    @pytest.mark.asyncio
+    async def test_changed_max_hooks_applies_to_storage(self):
+        """Test a max_hooks change picked up by process_hooks also caps the stored hooks"""
+        for i in range(20):
+            self.runtime_hooks.emit_hook("pre_task", "ghl_client", {"i": i})
+        self.runtime_hooks.max_hooks = 5
+        self.runtime_hooks.hook_mode = "monitor"
+
+        await self.runtime_hooks.process_hooks()
+        status = self.runtime_hooks.get_status().data
+
+        assert status["max_hooks"] == 5
+        assert status["total_hooks_stored"] == 5
+        assert [h["data"]["i"] for h in self.runtime_hooks.hook_storage] == [15, 16, 17, 18, 19]
+        assert self.runtime_hooks.hook_storage.summary()["total_hooks"] == 5
+        await self.runtime_hooks.aclose()
+
+    @pytest.mark.asyncio
+    async def test_hook_cleanup_runs_in_background(self):
+        """Test process_hooks hands retention cleanup to a background task"""
+        old = self.runtime_hooks.emit_hook("pre_task", "ghl_client", {})
+        old["_ts"] -= 3600 * 2
+        self.runtime_hooks._CLEANUP_INTERVAL = 0
+
+        await self.runtime_hooks.process_hooks()
+        await asyncio.sleep(0.01)
+
+        assert old not in self.runtime_hooks.hook_storage
+        await self.runtime_hooks.aclose()
+        assert self.runtime_hooks._cleanup_task is None
+
+    @pytest.mark.asyncio
+    async def test_hook_cleanup_task_does_not_keep_component_alive(self):
+        """Test discarded components are collected and their cleanup tasks end"""
+        hooks = RuntimeHooks()
+        hooks._ensure_cleanup_task()
+        task = hooks._cleanup_task
+        ref = weakref.ref(hooks)
+
+        del hooks
+        gc.collect()
+        await asyncio.sleep(0)
+
+        assert ref() is None
+        assert task.done()
+
+    @pytest.mark.asyncio
+    async def test_hook_listeners_do_not_block_emit(self):
+        """Test queue subscribers receive hooks and callbacks run after emit returns"""
+        queue = self.runtime_hooks.add_hook_queue(maxsize=1)
+        seen = []
+        self.runtime_hooks.add_hook_listener(seen.append)
+
+        first = self.runtime_hooks.emit_hook("pre_task", "ghl_client", {})
+        self.runtime_hooks.emit_hook("end_run", "ghl_client", {})
+        assert seen == []
+
+        await asyncio.sleep(0)
+        assert len(seen) == 2
+        assert queue.get_nowait() is first
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_runtime_hooks_response_bytes(self):
+        """Test the last hook payload is encoded to JSON once and cached"""
+        assert self.runtime_hooks.response_bytes() is None
+        self.runtime_hooks.emit_hook("pre_task", "ghl_client", {"action": "get_contact"})
+        self.runtime_hooks.hook_mode = "monitor"
+
+        result = await self.runtime_hooks.process_hooks()
+        encoded = self.runtime_hooks.response_bytes()
+
+        assert json.loads(encoded) == json.loads(json.dumps(result.data, default=str))
+        assert self.runtime_hooks.response_bytes() is encoded
+        await self.runtime_hooks.aclose()
+
+    @pytest.mark.asyncio
+    async def test_runtime_hooks_response_bytes_non_str_keys(self):
+        """Test hook data keyed by non-strings encodes the same with or without orjson"""
+        self.runtime_hooks.emit_hook("end_run", "batch_processor", {"by_index": {0: "ok", 1: "failed"}})
+        self.runtime_hooks.hook_mode = "monitor"
+
+        await self.runtime_hooks.process_hooks()
+
+        hooks = json.loads(self.runtime_hooks.response_bytes())["hooks"]
+        assert hooks[-1]["data"]["by_index"] == {"0": "ok", "1": "failed"}
+        await self.runtime_hooks.aclose()
+
+    def test_emit_hooks_batch(self):
+        """Test bulk emission stores every hook and notifies listeners once per batch"""
+        batches = []
+        seen = []
+        self.runtime_hooks.add_hook_listener(batches.append, batch=True)
+        self.runtime_hooks.add_hook_listener(seen.append)
+
+        hooks = self.runtime_hooks.emit_hooks([
+            {"hook_type": "pre_task", "component": "ghl_client", "data": {"action": "get_contact"}, "session_id": "replay"},
+            {"hook_type": "end_run", "component": "ghl_client", "session_id": "replay"},
+            {"hook_type": "error"}
+        ])
+
+        assert len(hooks) == 3
+        assert len({h["id"] for h in hooks}) == 3
+        assert list(self.runtime_hooks.hook_storage) == hooks
+        assert len(self.runtime_hooks.session_hooks["replay"]) == 2
+        assert hooks[2]["component"] == "runtime_hooks"
+        assert batches == [hooks]
+        assert seen == hooks
+
     def test_hook_summary_generation(self):
         """Test hook summary statistics generation"""
         test_hooks = [
@@ -188,6 +639,46 @@ class TestIntegration:
         assert summary["by_component"]["ghl_client"] == 1
         assert summary["by_component"]["batch_processor"] == 1
         
+    def test_hook_summary_counters_follow_eviction(self):
+        """Test the running summary counters stay in step as old hooks are evicted"""
+        hooks = RuntimeHooks()
+        for i in range(hooks.hook_storage.maxlen + 5):
+            hooks.emit_hook("pre_task" if i % 2 else "end_run", f"component_{i % 3}", {}, session_id=f"s{i % 4}")
+
+        expected = hooks.get_hook_summary(list(hooks.hook_storage))
+        summary = hooks.get_summary().data
+
+        assert summary["total_hooks"] == hooks.hook_storage.maxlen
+        assert summary["by_type"] == expected["by_type"]
+        assert summary["by_component"] == expected["by_component"]
+        assert summary["by_status"] == expected["by_status"]
+        assert summary["latest_timestamp"] == expected["latest_timestamp"]
+        assert sorted(summary["session_list"]) == sorted(expected["session_list"])
+
+    def test_hook_filters_use_storage_indexes(self):
+        """Test indexed filtering of stored hooks matches a scan of the same hooks"""
+        hooks = RuntimeHooks()
+        for i in range(hooks.hook_storage.maxlen + 5):
+            hooks.emit_hook(["pre_task", "end_run", "error"][i % 3], f"component_{i % 4}", {})
+        snapshot = list(hooks.hook_storage)
+
+        for filter_type, component_filter in [("error", ""), ("", "component_1"), ("end_run", "component_2"), ("missing", "")]:
+            hooks.filter_type = filter_type
+            hooks.component_filter = component_filter
+            assert hooks.filter_hooks(hooks.hook_storage) == hooks.filter_hooks(snapshot)
+
+    def test_session_state_matches_scan(self):
+        """Test stored session state matches a fresh aggregation of the same hooks"""
+        hooks = RuntimeHooks()
+        for i in range(hooks.hook_storage.maxlen + 7):
+            hooks.emit_hook(["pre_task", "error", "end_run"][i % 3], "ghl_client", {"action": f"op_{i % 2}"}, session_id=f"s{i % 5}")
+            if i % 10 == 0:
+                assert hooks.aggregate_hooks_by_session(hooks.hook_storage) == \
+                    hooks.aggregate_hooks_by_session(list(hooks.hook_storage))
+
+        assert hooks.aggregate_hooks_by_session(hooks.hook_storage) == \
+            hooks.aggregate_hooks_by_session(list(hooks.hook_storage))
+
     @pytest.mark.asyncio
     async def test_error_propagation_through_hooks(self):
         """Test that errors are properly propagated through hook system"""
@@ -0,0 +1,129 @@
+"""
+Tests for the bundle configuration in config.settings
+"""
+
+import dataclasses
+import os
+import pytest
+from unittest.mock import patch
+
+from config import settings
+from config.settings import (
+    AssistableAIConfig,
+    BundleConfig,
+    GoHighLevelConfig,
+    RuntimeHooksConfig,
+    _cast_bool,
+    _parse_env,
+)
+
+
+REQUIRED_ENV = {"ASSISTABLE_API_TOKEN": "test_token", "DEFAULT_LOCATION_ID": "loc_test123"}
+
+
+class TestBundleConfig:
+    """Test cases for BundleConfig and the module-level config helpers"""
+
+    def setup_method(self):
+        """Install a global config built from an injected env source"""
+        self._saved = (settings._config, settings._parsed_env)
+        settings._parsed_env = _parse_env(REQUIRED_ENV.get)
+        settings._set_config(BundleConfig.from_environment(env=REQUIRED_ENV.get))
+
+    def teardown_method(self):
+        """Restore the global config and parsed environment"""
+        config, parsed_env = self._saved
+        settings._config = config
+        settings._parsed_env = parsed_env
+        settings._config_version += 1
+
+    def test_injected_env_source(self):
+        """Test BundleConfig reads an injected source instead of os.environ"""
+        env = {**REQUIRED_ENV, "MAX_HOOKS": "7", "DEBUG": "yes", "ENVIRONMENT": "staging"}
+        with patch.dict(os.environ, {"MAX_HOOKS": "999", "ENVIRONMENT": "production"}):
+            config = BundleConfig(env=env.get)
+
+        assert config.runtime_hooks.max_hooks == 7
+        assert config.assistable_ai.api_token == "test_token"
+        assert config.gohighlevel.default_location_id == "loc_test123"
+        assert config.environment == "staging"
+        assert config.debug is True
+
+    def test_sections_are_init_fields(self):
+        """Test sections can be passed in and take part in repr, == and asdict"""
+        section = AssistableAIConfig(api_token="explicit")
+        config = BundleConfig(assistable_ai=section, env=REQUIRED_ENV.get)
+
+        assert config.assistable_ai is section
+        assert config == BundleConfig(assistable_ai=section, env=REQUIRED_ENV.get)
+        assert "explicit" in repr(config)
+        assert dataclasses.asdict(config)["runtime_hooks"]["max_hooks"] == 100
+
+    def test_direct_section_construction_reads_env(self):
+        """Test NamedTuple and dataclass sections both default to the parsed environment"""
+        settings._parsed_env = _parse_env({**REQUIRED_ENV, "GHL_API_KEY": "ghl_key", "MAX_HOOKS": "5"}.get)
+
+        assert AssistableAIConfig().api_token == "test_token"
+        assert GoHighLevelConfig().api_key == "ghl_key"
+        assert GoHighLevelConfig(api_key="other").api_key == "other"
+        assert RuntimeHooksConfig().max_hooks == 5
+
+    def test_from_environment_rereads_os_environ(self):
+        """Test from_environment picks up changes made to os.environ after the first parse"""
+        with patch.dict(os.environ, {"MAX_HOOKS": "7"}):
+            assert BundleConfig.from_environment(validate=False).runtime_hooks.max_hooks == 7
+        with patch.dict(os.environ, {"MAX_HOOKS": "8"}):
+            assert BundleConfig.from_environment(validate=False).runtime_hooks.max_hooks == 8
+
+    def test_update_config_invalidates_derived_dicts(self):
+        """Test update_config refreshes to_dict and get_environment_info"""
+        config = settings.get_config()
+        assert config.to_dict()["performance"]["cache_ttl"] == 300
+        assert settings.get_environment_info()["caching_enabled"] is True
+
+        settings.update_config(**{"performance.cache_ttl": 600, "performance.enable_caching": False})
+
+        assert config.to_dict()["performance"]["cache_ttl"] == 600
+        assert settings.get_environment_info()["caching_enabled"] is False
+
+    def test_attribute_writes_invalidate_derived_dicts(self):
+        """Test assigning a field directly refreshes the cached dicts"""
+        config = settings.get_config()
+        assert config.to_dict()["global"]["debug"] is False
+        assert settings.get_environment_info()["debug"] is False
+
+        config.debug = True
+
+        assert config.to_dict()["global"]["debug"] is True
+        assert settings.get_environment_info()["debug"] is True
+        assert b'"debug":true' in config.to_json_bytes().replace(b" ", b"")
+
+    def test_derived_dicts_are_copies(self):
+        """Test editing a returned dict does not leak into later calls"""
+        config = settings.get_config()
+        config.to_dict()["global"]["debug"] = "poisoned"
+        settings.get_environment_info()["debug"] = "poisoned"
+
+        assert config.to_dict()["global"]["debug"] is False
+        assert settings.get_environment_info()["debug"] is False
+
+    def test_cast_bool(self):
+        """Test boolean flags accept true/yes/1 spellings and reject the rest"""
+        for raw in ("true", "True", "TRUE", "yes", "Y", "1"):
+            assert _cast_bool(raw) is True
+        for raw in ("false", "False", "no", "0", "off", ""):
+            assert _cast_bool(raw) is False
+
+    def test_validate_fast_stops_at_first_error(self):
+        """Test validate reports every error while validate_fast raises on the first"""
+        config = BundleConfig(env={"ENVIRONMENT": "qa"}.get)
+
+        with pytest.raises(ValueError) as full:
+            config.validate()
+        with pytest.raises(ValueError) as fast:
+            config.validate_fast()
+
+        assert "ASSISTABLE_API_TOKEN is required" in str(full.value)
+        assert "Invalid environment: qa" in str(full.value)
+        assert str(fast.value) == "Configuration validation failed: ASSISTABLE_API_TOKEN is required"
+        BundleConfig(env=REQUIRED_ENV.get).validate_fast()